@@ -54,6 +54,7 @@ Optional environment variables:
   ODOO_MCP_TRANSPORT       Transport type: stdio or streamable-http (default: stdio)
   ODOO_MCP_HOST            Server host for HTTP transports (default: localhost)
   ODOO_MCP_PORT            Server port for HTTP transports (default: 8000)
+  ODOO_MCP_JSON_RPC        Use JSON-RPC for model operations, YOLO mode only (default: false)
 
 For more information, visit: https://github.com/ivnvxd/mcp-server-odoo""",
     )
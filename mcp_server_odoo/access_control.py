@@ -11,13 +11,31 @@ import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Container, Dict, List, Optional, Tuple
 
 from .config import OdooConfig
 
 logger = logging.getLogger(__name__)
 
 
+# Operations permitted in read-only YOLO mode
+_READ_OPERATIONS = frozenset(
+    {"read", "search", "search_read", "fields_get", "count", "search_count"}
+)
+
+
+class _AllModels:
+    """Model-name container that contains every model (YOLO mode)."""
+
+    __slots__ = ()
+
+    def __contains__(self, model: object) -> bool:
+        return True
+
+
+_ALL_MODELS = _AllModels()
+
+
 class AccessControlError(Exception):
     """Exception for access control failures."""
 
@@ -84,6 +102,8 @@ class AccessController:
         self.cache_ttl = cache_ttl
         self._cache: Dict[str, CacheEntry] = {}
         self._session_id: Optional[str] = None
+        # Decided once: YOLO mode enables every model
+        self._all_models_enabled = config.is_yolo_enabled
 
         # Parse base URL
         self.base_url = config.url.rstrip("/")
@@ -306,6 +326,29 @@ class AccessController:
         logger.info(f"Retrieved {len(models)} enabled models")
         return models
 
+    def _get_enabled_model_names(self) -> Container[str]:
+        """Get the names of all MCP-enabled models as a frozenset.
+
+        The set is cached with the same TTL as the models list so that
+        membership checks are O(1) instead of scanning the list each call.
+        In YOLO mode a container holding every model is returned.
+
+        Raises:
+            AccessControlError: If request fails
+        """
+        if self._all_models_enabled:
+            return _ALL_MODELS
+
+        cache_key = "enabled_model_names"
+
+        cached = self._get_from_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        names = frozenset(m["model"] for m in self.get_enabled_models())
+        self._set_cache(cache_key, names)
+        return names
+
     def is_model_enabled(self, model: str) -> bool:
         """Check if a model is MCP-enabled.
 
@@ -315,14 +358,8 @@ class AccessController:
         Returns:
             True if model is enabled, False otherwise
         """
-        # In YOLO mode, all models are enabled
-        if self.config.is_yolo_enabled:
-            logger.debug(f"YOLO mode: Model '{model}' is accessible")
-            return True
-
         try:
-            enabled_models = self.get_enabled_models()
-            return any(m["model"] == model for m in enabled_models)
+            return model in self._get_enabled_model_names()
         except AccessControlError as e:
             logger.error(f"Failed to check if model {model} is enabled: {e}")
             return False
@@ -402,18 +439,8 @@ class AccessController:
         """
         # In YOLO mode, check based on mode level
         if self.config.is_yolo_enabled:
-            # Define read operations
-            read_operations = {
-                "read",
-                "search",
-                "search_read",
-                "fields_get",
-                "count",
-                "search_count",
-            }
-
             # Check operation based on mode
-            if operation in read_operations:
+            if operation in _READ_OPERATIONS:
                 # Read operations always allowed in YOLO mode
                 return True, None
             elif self.config.yolo_mode == "true":
@@ -473,8 +500,7 @@ class AccessController:
             return models  # Return all models unfiltered
 
         try:
-            enabled_models = self.get_enabled_models()
-            enabled_set = {m["model"] for m in enabled_models}
+            enabled_set = self._get_enabled_model_names()
             return [m for m in models if m in enabled_set]
         except AccessControlError as e:
             logger.error(f"Failed to filter models: {e}")
@@ -5,6 +5,7 @@ for connecting to Odoo via XML-RPC.
 """
 
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Literal, Optional
@@ -40,6 +41,9 @@ class OdooConfig:
     # YOLO mode configuration
     yolo_mode: str = "off"  # "off", "read", or "true"
 
+    # Use Odoo's JSON-RPC route instead of XML-RPC for model operations
+    json_rpc: bool = False
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         # Validate URL
@@ -58,6 +62,10 @@ class OdooConfig:
                 f"Must be one of: {', '.join(valid_yolo_modes)}"
             )
 
+        # The MCP module only exposes XML-RPC routes
+        if self.json_rpc and not self.is_yolo_enabled:
+            raise ValueError("ODOO_MCP_JSON_RPC requires YOLO mode (ODOO_YOLO=read or true)")
+
         # Validate authentication (relaxed for YOLO mode)
         has_api_key = bool(self.api_key)
         has_credentials = bool(self.username and self.password)
@@ -234,6 +242,7 @@ def load_config(env_file: Optional[Path] = None) -> OdooConfig:
         port=get_int_env("ODOO_MCP_PORT", 8000),
         locale=os.getenv("ODOO_LOCALE", "").strip() or None,
         yolo_mode=get_yolo_mode(),
+        json_rpc=os.getenv("ODOO_MCP_JSON_RPC", "").strip().lower() in ("true", "1", "yes"),
     )
 
     return config
@@ -241,6 +250,7 @@ def load_config(env_file: Optional[Path] = None) -> OdooConfig:
 
 # Singleton configuration instance
 _config: Optional[OdooConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> OdooConfig:
@@ -253,9 +263,14 @@ def get_config() -> OdooConfig:
         ValueError: If configuration is not yet loaded
     """
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    config = _config
+    if config is None:
+        # Double-checked so concurrent first calls load the configuration once
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
+            config = _config
+    return config
 
 
 def set_config(config: OdooConfig) -> None:
@@ -267,7 +282,8 @@ def set_config(config: OdooConfig) -> None:
         config: The configuration object to set
     """
     global _config
-    _config = config
+    with _config_lock:
+        _config = config
 
 
 def reset_config() -> None:
@@ -276,4 +292,5 @@ def reset_config() -> None:
     This is primarily useful for testing.
     """
     global _config
-    _config = None
+    with _config_lock:
+        _config = None
@@ -261,7 +261,7 @@ class ErrorHandler:
         self.metrics = ErrorMetrics()
         self._error_history: List[MCPError] = []
         self._max_history_size = 1000
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     def handle_error(
         self,
@@ -383,7 +383,7 @@ class ErrorHandler:
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current error metrics for monitoring."""
-        uptime = time.time() - self._start_time
+        uptime = time.monotonic() - self._start_time
         error_rate = self.metrics.total_errors / (uptime / 60) if uptime > 0 else 0
 
         return {
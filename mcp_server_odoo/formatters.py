@@ -6,12 +6,47 @@ hierarchical text format optimized for LLM consumption.
 
 import logging
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .uri_schema import build_record_uri, build_search_uri
 
 logger = logging.getLogger(__name__)
 
+# Rules framing result headers and individual records
+_HEADER_RULE = "=" * 60
+_RECORD_RULE = "=" * 50
+
+# Monetary values are always shown with two decimals and thousand separators
+_MONETARY_FORMAT_SPEC = ",.2f"
+
+# Shown in place of binary content, filled with (model, field_name)
+_BINARY_PLACEHOLDER = "[Binary data - use %s/%s to retrieve]"
+
+# Fields selected for display, split into (simple, relation) lists of
+# (field_name, field_meta) pairs
+_FieldPlan = Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, Dict[str, Any]]]]
+
+# Prefix operators allowed between conditions of a search domain
+_DOMAIN_OPERATORS = frozenset(("&", "|", "!"))
+
+# Float format specs keyed by decimal precision, built once per precision
+_FLOAT_FORMAT_SPECS: Dict[int, str] = {}
+
+
+def _float_format_spec(precision: int) -> str:
+    """Return the cached format spec for a float with the given precision.
+
+    Args:
+        precision: Number of decimal digits
+
+    Returns:
+        Format spec usable with the builtin format()
+    """
+    spec = _FLOAT_FORMAT_SPECS.get(precision)
+    if spec is None:
+        spec = _FLOAT_FORMAT_SPECS[precision] = f",.{precision}f"
+    return spec
+
 
 class RecordFormatter:
     """Formats Odoo records for LLM consumption.
@@ -35,6 +70,8 @@ class RecordFormatter:
     # Binary field types
     BINARY_FIELDS = {"binary", "image", "file"}
 
+    __slots__ = ("model", "max_related_items", "_recursion_stack")
+
     def __init__(self, model: str, max_related_items: int = 5):
         """Initialize the formatter.
 
@@ -62,23 +99,58 @@ class RecordFormatter:
         Returns:
             Formatted text representation of the record
         """
-        lines = []
-        indent = "  " * indent_level
+        plan = self._plan_fields(tuple(record), fields_metadata)
+        return self._format_planned_record(record, plan, indent_level)
 
-        # Record header
-        record_id = record.get("id", "Unknown")
-        record_name = record.get("display_name") or record.get("name", f"Record {record_id}")
+    def format_records(
+        self,
+        records: List[Dict[str, Any]],
+        fields_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+        indent_level: int = 0,
+    ) -> List[str]:
+        """Format several records of this model into hierarchical text.
 
-        lines.append(f"{indent}{'=' * 50}")
-        lines.append(f"{indent}Record: {self.model}/{record_id}")
-        lines.append(f"{indent}Name: {record_name}")
-        lines.append(f"{indent}{'=' * 50}")
+        Field filtering and categorization only depend on the field names and
+        their metadata, so they are resolved once per distinct field set
+        instead of once per record.
+
+        Args:
+            records: List of record dictionaries
+            fields_metadata: Optional field metadata from fields_get()
+            indent_level: Current indentation level for nested structures
+
+        Returns:
+            Formatted text representation of each record, in input order
+        """
+        plans: Dict[Tuple[str, ...], _FieldPlan] = {}
+        formatted = []
+        for record in records:
+            field_names = tuple(record)
+            plan = plans.get(field_names)
+            if plan is None:
+                plan = plans[field_names] = self._plan_fields(field_names, fields_metadata)
+            formatted.append(self._format_planned_record(record, plan, indent_level))
+        return formatted
+
+    def _plan_fields(
+        self,
+        field_names: Tuple[str, ...],
+        fields_metadata: Optional[Dict[str, Dict[str, Any]]],
+    ) -> _FieldPlan:
+        """Select and categorize the fields to display.
+
+        Args:
+            field_names: Field names present in the record, in display order
+            fields_metadata: Optional field metadata from fields_get()
 
-        # Group fields by category
+        Returns:
+            Tuple of (simple fields, relation fields), each a list of
+            (field_name, field_meta) pairs
+        """
         simple_fields = []
         relation_fields = []
 
-        for field_name, field_value in record.items():
+        for field_name in field_names:
             # Skip omitted fields
             if field_name in self.OMIT_FIELDS or field_name.startswith("_"):
                 continue
@@ -93,26 +165,54 @@ class RecordFormatter:
 
             # Categorize fields
             if field_type in ("many2one", "one2many", "many2many"):
-                relation_fields.append((field_name, field_value, field_meta))
+                relation_fields.append((field_name, field_meta))
             else:
-                simple_fields.append((field_name, field_value, field_meta))
+                simple_fields.append((field_name, field_meta))
+
+        return simple_fields, relation_fields
+
+    def _format_planned_record(
+        self, record: Dict[str, Any], plan: _FieldPlan, indent_level: int
+    ) -> str:
+        """Format a record using a precomputed field plan.
+
+        Args:
+            record: The record data dictionary
+            plan: Field plan from _plan_fields()
+            indent_level: Current indentation level for nested structures
+
+        Returns:
+            Formatted text representation of the record
+        """
+        simple_fields, relation_fields = plan
+        lines = []
+        indent = "  " * indent_level
+
+        # Record header
+        record_id = record.get("id", "Unknown")
+        record_name = record.get("display_name") or record.get("name", f"Record {record_id}")
+
+        lines.append(f"{indent}{_RECORD_RULE}")
+        lines.append(f"{indent}Record: {self.model}/{record_id}")
+        lines.append(f"{indent}Name: {record_name}")
+        lines.append(f"{indent}{_RECORD_RULE}")
 
         # Format simple fields first
         if simple_fields:
             lines.append(f"{indent}Fields:")
-            for field_name, field_value, field_meta in simple_fields:
+            for field_name, field_meta in simple_fields:
                 formatted_value = self._format_field_value(
-                    field_name, field_value, field_meta, indent_level + 1
+                    field_name, record[field_name], field_meta, indent_level + 1
                 )
                 lines.append(f"{indent}  {field_name}: {formatted_value}")
 
         # Format relationship fields
         if relation_fields:
             lines.append(f"{indent}Relationships:")
-            for field_name, field_value, field_meta in relation_fields:
+            for field_name, field_meta in relation_fields:
                 lines.extend(
                     self._format_relation_field(
-                        field_name, field_value, field_meta, indent_level + 1
+                        field_name, record[field_name], field_meta, indent_level + 1
                     )
                 )
 
@@ -135,7 +235,7 @@ class RecordFormatter:
         if not records:
             return f"No {self.model} records found."
 
-        lines = [f"{'=' * 60}", f"{self.model} Records ({len(records)} found)", f"{'=' * 60}", ""]
+        lines = [_HEADER_RULE, f"{self.model} Records ({len(records)} found)", _HEADER_RULE, ""]
 
         for idx, record in enumerate(records, 1):
             lines.append(f"[{idx}] {self._get_record_summary(record)}")
@@ -160,81 +260,103 @@ class RecordFormatter:
         if value is None or value is False:
             return "Not set"
 
-        field_type = field_meta.get("type", "unknown")
-
-        # Text fields
-        if field_type in ("char", "text", "html"):
-            return str(value)
-
-        # Numeric fields
-        elif field_type in ("integer", "float", "monetary"):
-            if field_type == "monetary":
-                # Try to get currency information
-                # TODO: Use currency_field to get proper currency formatting
-                # currency_field = field_meta.get("currency_field", "currency_id")
-                return f"{value:,.2f}"  # Format with thousand separators
-            elif field_type == "float":
-                digits = field_meta.get("digits", (16, 2))
-                precision = digits[1] if isinstance(digits, tuple) else 2
-                return f"{value:,.{precision}f}"
-            else:
-                return f"{value:,}"  # Integer with thousand separators
-
-        # Date/time fields
-        elif field_type in ("date", "datetime"):
-            if isinstance(value, str):
-                # Handle Odoo's datetime format (YYYYMMDDTHH:MM:SS)
-                if (
-                    field_type == "datetime"
-                    and len(value) == 17
-                    and "T" in value
-                    and "-" not in value
-                ):
-                    try:
-                        # Parse Odoo's compact datetime format
-                        dt = datetime.strptime(value, "%Y%m%dT%H:%M:%S")
-                        # Return proper ISO format with UTC timezone
-                        return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-                    except ValueError:
-                        pass
-                # Handle standard datetime formats
-                elif field_type == "datetime" and " " in value:
-                    try:
-                        # Parse standard Odoo datetime format
-                        dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-                        return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-                    except ValueError:
-                        pass
-                return value  # Return as-is if parsing fails
-            elif isinstance(value, (datetime, date)):
-                if isinstance(value, datetime):
-                    # Ensure datetime includes timezone
-                    return value.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-                else:
-                    # Date only
-                    return value.isoformat()
-            return str(value)
-
-        # Boolean fields
-        elif field_type == "boolean":
-            return "Yes" if value else "No"
-
-        # Selection fields
-        elif field_type == "selection":
-            # Try to get the human-readable selection value
-            selection = field_meta.get("selection", [])
-            for key, label in selection:
-                if key == value:
-                    return f"{label} ({value})"
-            return str(value)
-
-        # Binary fields
-        elif field_type in self.BINARY_FIELDS:
-            return f"[Binary data - use {self.model}/{field_name} to retrieve]"
-
-        # Unknown type
-        else:
-            return str(value)
+        # Single dict lookup per value; unknown types fall back to str()
+        formatter = self._get_value_formatter(
+            field_meta.get("type", "unknown"), RecordFormatter._format_default_value
+        )
+        return formatter(self, field_name, value, field_meta)
+
+    def _format_default_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Format text fields and fields of unknown type."""
+        return str(value)
+
+    def _format_integer_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Format an integer with thousand separators."""
+        return f"{value:,}"
+
+    def _format_float_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Format a float using the field's decimal precision."""
+        # XML-RPC delivers digits as a list, direct callers may pass a tuple
+        digits = field_meta.get("digits", (16, 2))
+        precision = digits[1] if isinstance(digits, (list, tuple)) else 2
+        return format(value, _float_format_spec(precision))
+
+    def _format_monetary_value(
+        self, field_name: str, value: Any, field_meta: Dict[str, Any]
+    ) -> str:
+        """Format a monetary amount with thousand separators."""
+        # TODO: Use currency_field to get proper currency formatting
+        # currency_field = field_meta.get("currency_field", "currency_id")
+        return format(value, _MONETARY_FORMAT_SPEC)
+
+    def _format_date_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Format a date or datetime object as ISO 8601."""
+        if isinstance(value, datetime):
+            # Ensure datetime includes timezone
+            return value.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        if isinstance(value, date):
+            # Date only
+            return value.isoformat()
+        return str(value)
+
+    def _format_datetime_value(
+        self, field_name: str, value: Any, field_meta: Dict[str, Any]
+    ) -> str:
+        """Format a datetime, normalizing Odoo's string formats to ISO 8601."""
+        if isinstance(value, str):
+            # Handle Odoo's datetime format (YYYYMMDDTHH:MM:SS)
+            if len(value) == 17 and "T" in value and "-" not in value:
+                try:
+                    # Parse Odoo's compact datetime format
+                    dt = datetime.strptime(value, "%Y%m%dT%H:%M:%S")
+                    # Return proper ISO format with UTC timezone
+                    return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+                except ValueError:
+                    pass
+            # Handle standard datetime formats
+            elif " " in value:
+                try:
+                    # Parse standard Odoo datetime format
+                    dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+                    return dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+                except ValueError:
+                    pass
+            return value  # Return as-is if parsing fails
+        return self._format_date_value(field_name, value, field_meta)
+
+    def _format_boolean_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Format a boolean as Yes/No."""
+        return "Yes" if value else "No"
+
+    def _format_selection_value(
+        self, field_name: str, value: Any, field_meta: Dict[str, Any]
+    ) -> str:
+        """Format a selection key with its human-readable label."""
+        for key, label in field_meta.get("selection", []):
+            if key == value:
+                return f"{label} ({value})"
+        return str(value)
+
+    def _format_binary_value(self, field_name: str, value: Any, field_meta: Dict[str, Any]) -> str:
+        """Replace binary content with a retrieval hint."""
+        return _BINARY_PLACEHOLDER % (self.model, field_name)
+
+    # Value formatters by field type. Entries are plain functions called with
+    # the formatter instance, so the table is built once for the class.
+    _VALUE_FORMATTERS = {
+        "char": _format_default_value,
+        "text": _format_default_value,
+        "html": _format_default_value,
+        "integer": _format_integer_value,
+        "float": _format_float_value,
+        "monetary": _format_monetary_value,
+        "date": _format_date_value,
+        "datetime": _format_datetime_value,
+        "boolean": _format_boolean_value,
+        "selection": _format_selection_value,
+        **dict.fromkeys(BINARY_FIELDS, _format_binary_value),
+    }
+    _get_value_formatter = _VALUE_FORMATTERS.get
 
     def _format_relation_field(
         self, field_name: str, value: Any, field_meta: Dict[str, Any], indent_level: int
@@ -253,22 +375,34 @@ class RecordFormatter:
         lines = []
         indent = "  " * indent_level
         field_type = field_meta.get("type", "unknown")
+        # Resolved once and shared by the many2one and x2many branches
+        related_model = field_meta.get("relation", "unknown")
+
+        # Empty relations (False for many2one, [] for x2many) short-circuit here
+        if not value:
+            empty_label = "Not set" if field_type == "many2one" else "No records"
+            lines.append(f"{indent}{field_name}: {empty_label}")
+            return lines
 
         # Many2one fields
         if field_type == "many2one":
-            if value and isinstance(value, (list, tuple)) and len(value) == 2:
+            # Odoo returns [id, display_name], or a bare id when read without names;
+            # exact type checks are enough for values coming off the wire
+            value_type = type(value)
+            if (value_type is list or value_type is tuple) and len(value) == 2:
                 related_id, related_name = value
-                related_model = field_meta.get("relation", "unknown")
                 uri = build_record_uri(related_model, related_id)
                 lines.append(f"{indent}{field_name}: {related_name} ({uri})")
+            elif value_type is int:
+                uri = build_record_uri(related_model, value)
+                lines.append(f"{indent}{field_name}: ID {value} ({uri})")
             else:
                 lines.append(f"{indent}{field_name}: Not set")
 
         # One2many and Many2many fields
         elif field_type in ("one2many", "many2many"):
-            if value and isinstance(value, list):
+            if isinstance(value, list):
                 count = len(value)
-                related_model = field_meta.get("relation", "unknown")
 
                 # Build search URI for the related records
                 if field_type == "one2many":
@@ -277,7 +411,7 @@ class RecordFormatter:
                     domain = [(inverse_field, "=", self._get_current_record_id())]
                 else:
                     # For many2many, we'd need the actual IDs
-                    domain = [("id", "in", value)] if value else []
+                    domain = [("id", "in", value)]
 
                 search_uri = build_search_uri(related_model, domain=domain)
 
@@ -337,6 +471,8 @@ class RecordFormatter:
 class DatasetFormatter:
     """Formats datasets and search results for LLM consumption."""
 
+    __slots__ = ("model", "record_formatter")
+
     def __init__(self, model: str):
         """Initialize the dataset formatter.
 
@@ -379,9 +515,9 @@ class DatasetFormatter:
             Formatted search results with pagination
         """
         lines = [
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Search Results: {self.model}",
-            f"{'=' * 60}",
+            _HEADER_RULE,
         ]
 
         # Add search context
@@ -461,7 +597,7 @@ class DatasetFormatter:
             if isinstance(condition, (list, tuple)) and len(condition) == 3:
                 field, operator, value = condition
                 conditions.append(f"{field} {operator} {value}")
-            elif condition in ("&", "|", "!"):
+            elif isinstance(condition, str) and condition in _DOMAIN_OPERATORS:
                 conditions.append(condition)
 
         return " ".join(conditions) if conditions else str(domain)
@@ -105,14 +105,14 @@ class PerformanceLogger:
                 # Perform operation
                 pass
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         timer_id = f"{operation}_{id(start_time)}"
         self._timers[timer_id] = start_time
 
         try:
             yield
         finally:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
             self._timers.pop(timer_id, None)
 
             log_data = {
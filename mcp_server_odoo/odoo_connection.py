@@ -7,16 +7,19 @@ to Odoo via XML-RPC using MCP-specific endpoints.
 import json
 import logging
 import socket
+import sys
+import threading
 import urllib.error
 import urllib.request
 import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from .config import OdooConfig
 from .error_sanitizer import ErrorSanitizer
-from .performance import PerformanceManager
+from .performance import JsonRpcProxy, PerformanceManager
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,20 @@ class OdooConnection:
     # Connection timeout in seconds
     DEFAULT_TIMEOUT = 30
 
+    # Gateway errors from a proxy in front of Odoo that usually clear on retry
+    RETRYABLE_HTTP_STATUSES = frozenset({502, 503, 504})
+
+    # Worker threads used by execute_parallel
+    PARALLEL_MAX_WORKERS = 8
+
+    # Larger reads are split into chunks of this many IDs and read concurrently
+    READ_CHUNK_SIZE = 50
+
+    # Read-only methods that are safe to send twice
+    IDEMPOTENT_METHODS = frozenset(
+        {"read", "search", "search_read", "search_count", "fields_get", "name_search"}
+    )
+
     def __init__(
         self,
         config: OdooConfig,
@@ -77,11 +94,12 @@ class OdooConnection:
 
         # Performance manager for optimizations
         self._performance_manager = performance_manager or PerformanceManager(config)
+        self._performance_manager.set_timeout(timeout)
 
         # XML-RPC proxies (created on connect)
         self._db_proxy: Optional[xmlrpc.client.ServerProxy] = None
         self._common_proxy: Optional[xmlrpc.client.ServerProxy] = None
-        self._object_proxy: Optional[xmlrpc.client.ServerProxy] = None
+        self._object_proxy: Optional[Union[xmlrpc.client.ServerProxy, JsonRpcProxy]] = None
 
         # Connection state
         self._connected = False
@@ -90,6 +108,17 @@ class OdooConnection:
         self._authenticated = False
         self._auth_method: Optional[str] = None  # 'api_key' or 'password'
         self._server_version: Optional[str] = None
+        # (database, uid, password_or_token) sent with every execute_kw call,
+        # built on first use after authentication
+        self._auth_prefix: Optional[Tuple[Any, ...]] = None
+        # (object proxy, its bound execute_kw): ServerProxy builds a new method
+        # wrapper on every attribute access, so the binding is reused per proxy
+        self._execute_kw_binding: Tuple[Any, Any] = (None, None)
+        # Created on first execute_parallel call, shut down on disconnect. The
+        # lock keeps handler threads from creating two pools or submitting to
+        # one that disconnect() is shutting down.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         mode_info = f" (YOLO mode: {config.yolo_mode})" if config.is_yolo_enabled else ""
         logger.info(f"Initialized OdooConnection for {self._url_components['host']}{mode_info}")
@@ -132,26 +161,6 @@ class OdooConnection:
         except Exception as e:
             raise OdooConnectionError(f"Failed to parse URL: {e}") from e
 
-    def _create_transport(self) -> xmlrpc.client.Transport:
-        """Create XML-RPC transport with timeout support.
-
-        Returns:
-            Configured Transport object
-        """
-
-        class TimeoutTransport(xmlrpc.client.Transport):
-            def __init__(self, timeout, *args, **kwargs):
-                self.timeout = timeout
-                super().__init__(*args, **kwargs)
-
-            def make_connection(self, host):
-                connection = super().make_connection(host)
-                if hasattr(connection, "sock") and connection.sock:
-                    connection.sock.settimeout(self.timeout)
-                return connection
-
-        return TimeoutTransport(self.timeout)
-
     def _build_endpoint_url(self, endpoint: str) -> str:
         """Build full URL for an MCP endpoint.
 
@@ -195,9 +204,13 @@ class OdooConnection:
             self._common_proxy = self._performance_manager.get_optimized_connection(
                 self.COMMON_ENDPOINT
             )
-            self._object_proxy = self._performance_manager.get_optimized_connection(
-                self.OBJECT_ENDPOINT
-            )
+            if self.config.json_rpc:
+                # Decoding JSON is much cheaper than unmarshalling XML-RPC
+                self._object_proxy = self._performance_manager.get_json_rpc_proxy("object")
+            else:
+                self._object_proxy = self._performance_manager.get_optimized_connection(
+                    self.OBJECT_ENDPOINT
+                )
 
             # 4. Test connection by calling server_version
             self._test_connection()
@@ -269,10 +282,19 @@ class OdooConnection:
                     pass
             return
 
-        # Clear proxies (but don't close pooled connections)
+        # Clear proxies
         self._db_proxy = None
         self._common_proxy = None
         self._object_proxy = None
+        self._execute_kw_binding = (None, None)
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        # Release the pool's keep-alive sockets
+        self._performance_manager.connection_pool.clear()
 
         # Clear connection state
         self._connected = False
@@ -280,6 +302,7 @@ class OdooConnection:
         self._database = None
         self._authenticated = False
         self._auth_method = None
+        self._auth_prefix = None
 
         if not suppress_logging:
             try:
@@ -362,11 +385,11 @@ class OdooConnection:
         return self._common_proxy
 
     @property
-    def object_proxy(self) -> xmlrpc.client.ServerProxy:
+    def object_proxy(self) -> Union[xmlrpc.client.ServerProxy, JsonRpcProxy]:
         """Get object operations proxy.
 
         Returns:
-            XML-RPC proxy for object operations
+            XML-RPC (or JSON-RPC, when enabled) proxy for object operations
 
         Raises:
             OdooConnectionError: If not connected
@@ -375,6 +398,22 @@ class OdooConnection:
             raise OdooConnectionError("Not connected to Odoo")
         return self._object_proxy
 
+    def _bound_execute_kw(self) -> Any:
+        """Get ``execute_kw`` bound on the current object proxy.
+
+        Returns:
+            Callable performing the execute_kw RPC
+
+        Raises:
+            OdooConnectionError: If not connected
+        """
+        proxy = self.object_proxy
+        bound_proxy, method = self._execute_kw_binding
+        if bound_proxy is not proxy:
+            method = proxy.execute_kw
+            self._execute_kw_binding = (proxy, method)
+        return method
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -743,6 +782,9 @@ class OdooConnection:
         if not self._connected:
             raise OdooConnectionError("Not connected to Odoo")
 
+        # Credentials may change; rebuild the execute_kw prefix on next use
+        self._auth_prefix = None
+
         # Get database name
         if database:
             db_name = database
@@ -756,6 +798,16 @@ class OdooConnection:
         else:
             logger.info(f"Authenticating in standard MCP mode for database '{db_name}'")
 
+        # A recent successful login with the same credentials is reused, so
+        # reconnects skip the authentication round-trip
+        cached = self._performance_manager.get_cached_auth(db_name, self._auth_credentials())
+        if cached:
+            self._uid, self._auth_method = cached
+            self._database = db_name
+            self._authenticated = True
+            logger.info(f"Reusing cached authentication (UID: {self._uid})")
+            return
+
         auth_errors = []
 
         # Try API key authentication first (if available)
@@ -766,6 +818,7 @@ class OdooConnection:
             try:
                 if self._authenticate_api_key(db_name):
                     logger.info(f"Successfully authenticated using {auth_method}")
+                    self._cache_auth()
                     return
                 else:
                     error_msg = f"{auth_method} authentication failed"
@@ -786,6 +839,7 @@ class OdooConnection:
             try:
                 if self._authenticate_password(db_name):
                     logger.info("Successfully authenticated using username/password")
+                    self._cache_auth()
                     return
                 else:
                     auth_errors.append("Username/password authentication failed")
@@ -811,6 +865,25 @@ class OdooConnection:
                 "Provide either API key or username/password credentials."
             )
 
+    def _auth_credentials(self) -> str:
+        """Identify the configured credentials and mode for the auth cache."""
+        config = self.config
+        return "\0".join(
+            (
+                config.yolo_mode,
+                config.username or "",
+                config.api_key or "",
+                config.password or "",
+            )
+        )
+
+    def _cache_auth(self) -> None:
+        """Remember the current authentication result for reconnects."""
+        if self._database and self._uid and self._auth_method:
+            self._performance_manager.cache_auth(
+                self._database, self._auth_credentials(), self._uid, self._auth_method
+            )
+
     @property
     def is_authenticated(self) -> bool:
         """Check if currently authenticated."""
@@ -854,6 +927,38 @@ class OdooConnection:
         """
         return self.execute_kw(model, method, list(args), {})
 
+    def execute_parallel(
+        self, calls: List[Tuple[str, str, List[Any], Dict[str, Any]]]
+    ) -> List[Any]:
+        """Execute independent operations concurrently.
+
+        Each call runs ``execute_kw`` on a worker thread with its own keep-alive
+        HTTP connection, so the total latency is that of the slowest call
+        rather than the sum of all calls.
+
+        Args:
+            calls: List of (model, method, args, kwargs) tuples
+
+        Returns:
+            Results in the same order as ``calls``
+
+        Raises:
+            OdooConnectionError: If any call fails
+        """
+        if len(calls) <= 1:
+            return [self.execute_kw(*call) for call in calls]
+
+        with self._executor_lock:
+            # disconnect() may have shut the pool down meanwhile
+            if not self._connected:
+                raise OdooConnectionError("Not connected to Odoo")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.PARALLEL_MAX_WORKERS, thread_name_prefix="odoo-rpc"
+                )
+            futures = [self._executor.submit(self.execute_kw, *call) for call in calls]
+        return [future.result() for future in futures]
+
     def execute_kw(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
         """Execute an operation on an Odoo model with keyword arguments.
 
@@ -877,10 +982,13 @@ class OdooConnection:
         if not self._connected:
             raise OdooConnectionError("Not connected to Odoo")
 
-        # Get the appropriate password/token based on auth method
-        password_or_token = (
-            self.config.api_key if self._auth_method == "api_key" else self.config.password
-        )
+        # The database, uid and password/token are fixed once authenticated
+        auth_prefix = self._auth_prefix
+        if auth_prefix is None:
+            password_or_token = (
+                self.config.api_key if self._auth_method == "api_key" else self.config.password
+            )
+            auth_prefix = self._auth_prefix = (self._database, self._uid, password_or_token)
 
         # Inject locale into context as default (caller-provided lang takes precedence)
         if self.config.locale:
@@ -890,12 +998,22 @@ class OdooConnection:
 
         try:
             # Log the operation
-            logger.debug(f"Executing {method} on {model} with args={args}, kwargs={kwargs}")
+            logger.debug("Executing %s on %s with args=%s, kwargs=%s", method, model, args, kwargs)
 
             # Execute via object proxy
-            result = self.object_proxy.execute_kw(
-                self._database, self._uid, password_or_token, model, method, args, kwargs
-            )
+            call = self._bound_execute_kw()
+            try:
+                result = call(*auth_prefix, model, method, args, kwargs)
+            except xmlrpc.client.ProtocolError as e:
+                # Only transient gateway errors on reads are retried, once and
+                # without delay; everything else fails immediately
+                if (
+                    e.errcode not in self.RETRYABLE_HTTP_STATUSES
+                    or method not in self.IDEMPOTENT_METHODS
+                ):
+                    raise
+                logger.warning("HTTP %s during %s on %s, retrying once", e.errcode, method, model)
+                result = call(*auth_prefix, model, method, args, kwargs)
 
             logger.debug("Operation completed successfully")
             return result
@@ -911,6 +1029,10 @@ class OdooConnection:
                 kwargs.get("context", {}).pop("lang", None)
                 return self.execute_kw(model, method, args, kwargs)
 
+            if "Access Denied" in e.faultString and self._database:
+                # Credentials were revoked; don't reuse them on reconnect
+                self._performance_manager.invalidate_auth(self._database, self._auth_credentials())
+
             logger.error(f"XML-RPC fault during {method} on {model}: {e}")
             # Sanitize the fault string before exposing to user
             sanitized_message = ErrorSanitizer.sanitize_xmlrpc_fault(e.faultString)
@@ -937,27 +1059,65 @@ class OdooConnection:
         """
         return self.execute_kw(model, "search", [domain], kwargs)
 
+    def search_and_count(
+        self, model: str, domain: List[Union[str, List[Any]]], **kwargs
+    ) -> Tuple[List[int], int]:
+        """Search for a page of records and count all matches in one round-trip.
+
+        The ``search`` and ``search_count`` calls are issued concurrently, so
+        the caller waits for a single round-trip instead of two.
+
+        Args:
+            model: The Odoo model name
+            domain: Odoo domain filter
+            **kwargs: Additional search parameters (limit, offset, order)
+
+        Returns:
+            Tuple of (matching record IDs, total number of matching records)
+        """
+        record_ids, total_count = self.execute_parallel(
+            [
+                (model, "search", [domain], kwargs),
+                (model, "search_count", [domain], {}),
+            ]
+        )
+        return record_ids, total_count
+
     def read(
         self, model: str, ids: List[int], fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Read records by IDs.
 
+        Reads of more than ``READ_CHUNK_SIZE`` IDs are split into chunks that
+        are read concurrently, keeping each XML-RPC payload small.
+
         Args:
             model: The Odoo model name
             ids: List of record IDs to read
             fields: List of field names to read (None for all fields)
 
         Returns:
-            List of dictionaries containing record data
+            List of dictionaries containing record data, in the order of ``ids``
         """
         kwargs = {}
         if fields:
             kwargs["fields"] = fields
 
         with self._performance_manager.monitor.track_operation(f"read_{model}"):
-            records = self.execute_kw(model, "read", [ids], kwargs)
+            chunk_size = self.READ_CHUNK_SIZE
+            if len(ids) <= chunk_size:
+                return self.execute_kw(model, "read", [ids], kwargs)
+
+            # execute_kw injects the locale into kwargs["context"] from the
+            # worker threads, so every chunk gets its own kwargs dict
+            chunks = self.execute_parallel(
+                [
+                    (model, "read", [ids[start : start + chunk_size]], dict(kwargs))
+                    for start in range(0, len(ids), chunk_size)
+                ]
+            )
 
-        return records
+        return [record for chunk in chunks for record in chunk]
 
     def search_read(
         self,
@@ -993,11 +1153,12 @@ class OdooConnection:
         Returns:
             Dictionary mapping field names to their definitions
         """
-        # Check cache first
-        cached_fields = self._performance_manager.get_cached_fields(model)
-        if cached_fields and not attributes:  # Only use cache if no specific attributes requested
-            logger.debug(f"Field definitions for {model} retrieved from cache")
-            return cached_fields
+        # Check cache first; only full definitions are cached
+        if not attributes:
+            cached_fields = self._performance_manager.get_cached_fields(model)
+            if cached_fields is not None:
+                logger.debug("Field definitions for %s retrieved from cache", model)
+                return cached_fields
 
         # Get fields from server
         kwargs = {}
@@ -1007,6 +1168,13 @@ class OdooConnection:
         with self._performance_manager.monitor.track_operation(f"fields_get_{model}"):
             fields = self.execute_kw(model, "fields_get", [], kwargs)
 
+        # Field types are compared and used as dispatch keys for every value
+        # formatted; interning them once lets those lookups match by identity
+        for field_info in fields.values():
+            field_type = field_info.get("type")
+            if isinstance(field_type, str):
+                field_info["type"] = sys.intern(field_type)
+
         # Cache if we got all attributes
         if not attributes:
             self._performance_manager.cache_fields(model, fields)
@@ -1049,6 +1217,53 @@ class OdooConnection:
             logger.error(f"Failed to create {model} record: {e}")
             raise
 
+    def create_and_read(
+        self, model: str, values: Dict[str, Any], fields: List[str]
+    ) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """Create a new record and read back some of its fields.
+
+        On Odoo 17+ in YOLO mode this is a single ``web_save`` call, which
+        returns the requested fields of the new record. Otherwise (including
+        standard mode, which goes through the MCP addon endpoints)
+        it falls back to ``create`` followed by ``read``.
+
+        Args:
+            model: The Odoo model name
+            values: Dictionary of field values for the new record
+            fields: Field names to return for the created record
+
+        Returns:
+            Tuple of the created record's ID and its requested fields. The
+            fields are None if the record cannot be read back; the ID is None
+            only if ``web_save`` returned no record.
+
+        Raises:
+            OdooConnectionError: If creation fails
+        """
+        major = self._get_major_version()
+        if not self.config.is_yolo_enabled or major is None or major < 17:
+            record_id = self.create(model, values)
+            records = self.read(model, [record_id], fields)
+            return record_id, records[0] if records else None
+
+        try:
+            with self._performance_manager.monitor.track_operation(f"create_{model}"):
+                records = self.execute_kw(
+                    model,
+                    "web_save",
+                    [[], values],
+                    {"specification": {field: {} for field in fields}},
+                )
+                # Invalidate cache for this model
+                self._performance_manager.invalidate_record_cache(model)
+                if not records:
+                    return None, None
+                logger.info("Created %s record with ID %s via web_save", model, records[0]["id"])
+                return records[0]["id"], records[0]
+        except Exception as e:
+            logger.error("Failed to create %s record: %s", model, e)
+            raise
+
     def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
         """Update existing records.
 
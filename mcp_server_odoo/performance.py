@@ -7,15 +7,21 @@ This module provides performance optimizations including:
 - Performance monitoring and metrics
 """
 
+import gzip
+import hashlib
+import http.client
+import itertools
 import json
 import threading
 import time
 from collections import OrderedDict, defaultdict
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
-from xmlrpc.client import SafeTransport, ServerProxy, Transport
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+from xmlrpc.client import Fault, ProtocolError, SafeTransport, ServerProxy, Transport
 
 from .config import OdooConfig
 from .logging_config import get_logger
@@ -256,53 +262,223 @@ class Cache:
             self._remove(key, reason)
 
 
-class OdooTransport(Transport):
-    """HTTP transport that injects X-Odoo-Database header for multi-DB routing."""
+class _OdooTransportMixin:
+    """Keep-alive, timeout and X-Odoo-Database handling shared by both transports.
+
+    The underlying HTTP(S) connection is kept alive and reused for every
+    request to the same host, so sequential calls skip the TCP (and TLS)
+    handshake. Each thread gets its own connection, so one transport can
+    serve concurrent requests without interleaving them on a socket. Every
+    thread's connection is tracked so ``close_all()`` can release them.
+    """
 
-    def __init__(self, database: Optional[str] = None, **kwargs):
+    def __init__(self, database: Optional[str] = None, timeout: Optional[float] = None, **kwargs):
+        self._local = threading.local()
+        self._open_connections: Set[http.client.HTTPConnection] = set()
+        self._open_connections_lock = threading.Lock()
         super().__init__(**kwargs)
+        # Let a compressing reverse proxy gzip large responses. Request bodies
+        # are left uncompressed (encode_threshold=None): Odoo does not decode
+        # gzipped XML-RPC requests.
+        self.accept_gzip_encoding = True
+        self.encode_threshold = None
         self.database = database
+        self.timeout = timeout
+
+    @property
+    def _connection(self):
+        # Replaces the base class's single cached (host, connection) pair
+        return getattr(self._local, "connection", (None, None))
+
+    @_connection.setter
+    def _connection(self, value):
+        self._local.connection = value
+
+    def make_connection(self, host):
+        # The base class caches the last connection per host; only apply the
+        # socket timeout to connections that have not been opened yet
+        connection = super().make_connection(host)
+        if connection.sock is None:
+            if self.timeout is not None:
+                connection.timeout = self.timeout
+            # About to be (re)opened, possibly after close_all()
+            with self._open_connections_lock:
+                self._open_connections.add(connection)
+        return connection
+
+    def close(self):
+        # Closes only the calling thread's connection
+        _, connection = self._connection
+        if connection is not None:
+            with self._open_connections_lock:
+                self._open_connections.discard(connection)
+        super().close()
+
+    def close_all(self) -> None:
+        """Close the keep-alive connections of every thread."""
+        with self._open_connections_lock:
+            connections = list(self._open_connections)
+            self._open_connections.clear()
+        for connection in connections:
+            connection.close()
 
     def send_headers(self, connection, headers):
         super().send_headers(connection, headers)
+        connection.putheader("Connection", "keep-alive")
         if self.database:
             connection.putheader("X-Odoo-Database", self.database)
 
 
-class OdooSafeTransport(SafeTransport):
+class OdooTransport(_OdooTransportMixin, Transport):
+    """HTTP transport that injects X-Odoo-Database header for multi-DB routing."""
+
+
+class OdooSafeTransport(_OdooTransportMixin, SafeTransport):
     """HTTPS transport that injects X-Odoo-Database header for multi-DB routing."""
 
-    def __init__(self, database: Optional[str] = None, **kwargs):
-        super().__init__(**kwargs)
-        self.database = database
 
-    def send_headers(self, connection, headers):
-        super().send_headers(connection, headers)
-        if self.database:
-            connection.putheader("X-Odoo-Database", self.database)
+class JsonRpcProxy:
+    """Stand-in for an XML-RPC ``ServerProxy`` that talks to Odoo's ``/jsonrpc`` route.
+
+    Responses are decoded by the C-accelerated ``json`` module instead of the
+    pure-Python XML-RPC unmarshaller, which dominates CPU time on large
+    ``search_read`` results. Requests go through the pool's keep-alive
+    transport, and Odoo errors are raised as ``xmlrpc.client.Fault`` so callers
+    handle both protocols the same way.
+    """
+
+    PATH = "/jsonrpc"
+
+    # Errors raised when the server closed an idle keep-alive connection
+    _RETRYABLE_ERRORS = (
+        http.client.RemoteDisconnected,
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError,
+    )
+
+    def __init__(self, url: str, service: str, transport: Transport):
+        """Initialize JSON-RPC proxy.
+
+        Args:
+            url: Odoo server base URL
+            service: Odoo RPC service name (e.g., 'object')
+            transport: Transport providing the keep-alive HTTP connection
+        """
+        parts = urlsplit(url)
+        self._host = parts.netloc
+        self._path = parts.path.rstrip("/") + self.PATH
+        self._service = service
+        self._transport = transport
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return partial(self._call, name)
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Call a service method and return its result.
+
+        Raises:
+            Fault: If Odoo returns an error
+            ProtocolError: If the server answers with a non-200 status
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": self._service, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        response = self._request(json.dumps(payload).encode("utf-8"))
+
+        error = response.get("error")
+        if error:
+            data = error.get("data") or {}
+            if data.get("name"):
+                fault_string = f"{data['name']}: {data.get('message', '')}"
+            else:
+                fault_string = error.get("message", "Unknown error")
+            raise Fault(error.get("code", 1), fault_string)
+        return response.get("result")
+
+    def _request(self, body: bytes) -> Dict[str, Any]:
+        """POST a JSON-RPC body and decode the response."""
+        try:
+            response, data = self._send(body)
+        except self._RETRYABLE_ERRORS:
+            # The server closed the idle keep-alive connection; retry once
+            response, data = self._send(body)
+
+        if response.status != 200:
+            self._transport.close()
+            raise ProtocolError(
+                self._host + self._path,
+                response.status,
+                response.reason,
+                dict(response.getheaders()),
+            )
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        return json.loads(data)
+
+    def _send(self, body: bytes):
+        """Send one request over the transport's connection and read the reply."""
+        transport = self._transport
+        connection = transport.make_connection(self._host)
+        try:
+            connection.putrequest("POST", self._path, skip_accept_encoding=True)
+            connection.putheader("Accept-Encoding", "gzip")
+            connection.putheader("Content-Type", "application/json")
+            connection.putheader("Content-Length", str(len(body)))
+            transport.send_headers(connection, [])
+            connection.endheaders(body)
+            response = connection.getresponse()
+            return response, response.read()
+        except Exception:
+            transport.close()
+            raise
 
 
 class ConnectionPool:
-    """Thread-safe connection pool for XML-RPC connections."""
+    """Thread-safe connection pool for XML-RPC connections.
+
+    Connections are keyed by endpoint. Reusing a fresh connection does not
+    take the pool lock; the lock only guards creation, expiry and eviction.
+    """
+
+    # Seconds a connection may sit unused before it is considered stale
+    MAX_IDLE_SECONDS = 300
+
+    # Seconds between sweeps for stale connections
+    CLEANUP_INTERVAL = 60
 
-    def __init__(self, config: OdooConfig, max_connections: int = 10):
+    def __init__(
+        self, config: OdooConfig, max_connections: int = 10, timeout: Optional[float] = None
+    ):
         """Initialize connection pool.
 
         Args:
             config: Odoo configuration
             max_connections: Maximum number of connections
+            timeout: Socket timeout in seconds for XML-RPC requests
         """
         self.config = config
         self.max_connections = max_connections
-        self._connections: List[Tuple[ServerProxy, float]] = []
-        self._endpoint_map: List[str] = []  # Track endpoints for each connection
+        # endpoint -> [connection, last_used] in least-recently-used order. The
+        # entry list is mutated in place on reuse; insertions and removals only
+        # happen under the lock.
+        self._connections: OrderedDict[str, List[Any]] = OrderedDict()
         self._lock = threading.RLock()
-        # Use OdooSafeTransport/OdooTransport to support X-Odoo-Database header
+        # Use OdooSafeTransport/OdooTransport to support X-Odoo-Database header.
+        # A single keep-alive transport is shared by all proxies in the pool.
         if config.url.startswith("https://"):
-            self._transport: Union[OdooTransport, OdooSafeTransport] = OdooSafeTransport()
+            self._transport: Union[OdooTransport, OdooSafeTransport] = OdooSafeTransport(
+                timeout=timeout
+            )
         else:
-            self._transport = OdooTransport()
-        self._last_cleanup = time.time()
+            self._transport = OdooTransport(timeout=timeout)
+        self._last_cleanup = time.monotonic()
         self._stats = {
             "connections_created": 0,
             "connections_reused": 0,
@@ -319,42 +495,48 @@ class ConnectionPool:
         Returns:
             ServerProxy connection
         """
-        with self._lock:
-            now = time.time()
+        now = time.monotonic()
+
+        # Fast path: dict reads are atomic, so a fresh connection can be reused
+        # without the lock. Only the entry's timestamp is updated.
+        entry = self._connections.get(endpoint)
+        if entry is not None and now - entry[1] < self.MAX_IDLE_SECONDS:
+            entry[1] = now
+            # The entry may have been evicted by another thread meanwhile
+            with suppress(KeyError):
+                self._connections.move_to_end(endpoint)
+            self._stats["connections_reused"] += 1
+            logger.debug(f"Reusing connection for {endpoint}")
+            return entry[0]
 
+        with self._lock:
             # Cleanup stale connections periodically
-            if now - self._last_cleanup > 60:  # Every minute
+            if now - self._last_cleanup > self.CLEANUP_INTERVAL:
                 self._cleanup_stale_connections()
                 self._last_cleanup = now
 
-            # Try to find an existing connection
-            url = f"{self.config.url}{endpoint}"
-            for i, (conn, last_used) in enumerate(self._connections):
-                # Store endpoint with connection for matching
-                if i < len(self._endpoint_map) and self._endpoint_map[i] == endpoint:
-                    # Connection is still fresh (used within last 5 minutes)
-                    if now - last_used < 300:
-                        self._connections[i] = (conn, now)
-                        self._stats["connections_reused"] += 1
-                        logger.debug(f"Reusing connection for {endpoint}")
-                        return conn
-                    else:
-                        # Connection is stale, remove it
-                        self._connections.pop(i)
-                        self._endpoint_map.pop(i)
-                        self._stats["connections_closed"] += 1
-                        break
+            # Another thread may have created the connection meanwhile
+            entry = self._connections.get(endpoint)
+            if entry is not None:
+                if now - entry[1] < self.MAX_IDLE_SECONDS:
+                    entry[1] = now
+                    self._connections.move_to_end(endpoint)
+                    self._stats["connections_reused"] += 1
+                    logger.debug(f"Reusing connection for {endpoint}")
+                    return entry[0]
+                # Connection is stale, remove it
+                del self._connections[endpoint]
+                self._stats["connections_closed"] += 1
 
             # Create new connection
             if len(self._connections) >= self.max_connections:
-                # Remove oldest connection
-                self._connections.pop(0)
-                self._endpoint_map.pop(0)
+                # Remove least recently used connection
+                self._connections.popitem(last=False)
                 self._stats["connections_closed"] += 1
 
+            url = f"{self.config.url}{endpoint}"
             conn = ServerProxy(url, transport=self._transport, allow_none=True)
-            self._connections.append((conn, now))
-            self._endpoint_map.append(endpoint)
+            self._connections[endpoint] = [conn, now]
             self._stats["connections_created"] += 1
             self._stats["active_connections"] = len(self._connections)
             logger.debug(f"Created new connection for {endpoint}")
@@ -362,22 +544,18 @@ class ConnectionPool:
 
     def _cleanup_stale_connections(self):
         """Remove stale connections from pool."""
-        now = time.time()
-        initial_count = len(self._connections)
-
-        # Remove connections older than 5 minutes
-        new_connections = []
-        new_endpoints = []
-        for i, (conn, last_used) in enumerate(self._connections):
-            if now - last_used < 300:
-                new_connections.append((conn, last_used))
-                new_endpoints.append(self._endpoint_map[i])
-
-        self._connections = new_connections
-        self._endpoint_map = new_endpoints
-
-        removed = initial_count - len(self._connections)
-        if removed > 0:
+        now = time.monotonic()
+        removed = 0
+
+        # Entries are in least-recently-used order, so stop at the first fresh one
+        while self._connections:
+            endpoint, (_, last_used) = next(iter(self._connections.items()))
+            if now - last_used < self.MAX_IDLE_SECONDS:
+                break
+            self._connections.pop(endpoint, None)
+            removed += 1
+
+        if removed:
             self._stats["connections_closed"] += removed
             self._stats["active_connections"] = len(self._connections)
             logger.debug(f"Cleaned up {removed} stale connections")
@@ -398,17 +576,36 @@ class ConnectionPool:
             # Invalidate existing connections — they were created without the header
             self._stats["connections_closed"] += len(self._connections)
             self._connections.clear()
-            self._endpoint_map.clear()
             self._stats["active_connections"] = 0
             logger.debug(f"Set database header to '{db_name}', cleared connection pool")
 
+    def get_json_rpc_proxy(self, service: str) -> JsonRpcProxy:
+        """Get a JSON-RPC proxy sharing the pool's keep-alive transport.
+
+        Args:
+            service: Odoo RPC service name (e.g., 'object')
+
+        Returns:
+            JsonRpcProxy for the service
+        """
+        return JsonRpcProxy(self.config.url, service, self._transport)
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """Set the socket timeout used for new HTTP connections.
+
+        Args:
+            timeout: Timeout in seconds, or None for no timeout
+        """
+        with self._lock:
+            self._transport.timeout = timeout
+
     def clear(self):
-        """Clear all connections."""
+        """Clear all connections and close their keep-alive sockets."""
         with self._lock:
             self._stats["connections_closed"] += len(self._connections)
             self._connections.clear()
-            self._endpoint_map.clear()
             self._stats["active_connections"] = 0
+            self._transport.close_all()
 
 
 class RequestOptimizer:
@@ -511,7 +708,7 @@ class PerformanceMonitor:
         """Initialize performance monitor."""
         self._metrics: Dict[str, List[float]] = defaultdict(list)
         self._lock = threading.RLock()
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     @contextmanager
     def track_operation(self, operation: str):
@@ -520,11 +717,11 @@ class PerformanceMonitor:
         Args:
             operation: Operation name
         """
-        start = time.time()
+        start = time.monotonic()
         try:
             yield
         finally:
-            duration = time.time() - start
+            duration = time.monotonic() - start
             with self._lock:
                 self._metrics[operation].append(duration)
                 # Keep only last 1000 measurements
@@ -535,7 +732,7 @@ class PerformanceMonitor:
         """Get performance statistics."""
         with self._lock:
             stats: Dict[str, Any] = {
-                "uptime_seconds": int(time.time() - self._start_time),
+                "uptime_seconds": int(time.monotonic() - self._start_time),
                 "operations": {},
             }
 
@@ -562,11 +759,15 @@ class PerformanceManager:
             config: Odoo configuration
         """
         self.config = config
+        # Database the cached field definitions belong to; refined once the
+        # connection resolves it (auto-selection may differ from config)
+        self._database = config.database
 
         # Initialize components
         self.field_cache = Cache(max_size=100, max_memory_mb=10)
         self.record_cache = Cache(max_size=1000, max_memory_mb=50)
         self.permission_cache = Cache(max_size=500, max_memory_mb=5)
+        self.auth_cache = Cache(max_size=50, max_memory_mb=1)
         self.connection_pool = ConnectionPool(config)
         self.request_optimizer = RequestOptimizer()
         self.monitor = PerformanceMonitor()
@@ -592,6 +793,14 @@ class PerformanceManager:
             key_parts.append(f"{k}:{v}")
         return ":".join(key_parts)
 
+    def _fields_key(self, model: str) -> str:
+        """Build the field cache key, scoped to the server URL and database.
+
+        Field definitions differ between databases (installed modules), so a
+        manager shared by several connections must not mix them up.
+        """
+        return self.cache_key("fields", url=self.config.url, db=self._database or "", model=model)
+
     def get_cached_fields(self, model: str) -> Optional[Dict[str, Any]]:
         """Get cached field definitions.
 
@@ -601,8 +810,7 @@ class PerformanceManager:
         Returns:
             Cached fields or None
         """
-        key = self.cache_key("fields", model=model)
-        return self.field_cache.get(key)
+        return self.field_cache.get(self._fields_key(model))
 
     def cache_fields(self, model: str, fields: Dict[str, Any]):
         """Cache field definitions.
@@ -611,10 +819,19 @@ class PerformanceManager:
             model: Model name
             fields: Field definitions
         """
-        key = self.cache_key("fields", model=model)
+        key = self._fields_key(model)
         # Fields rarely change, cache for 1 hour
         self.field_cache.put(key, fields, ttl_seconds=3600)
 
+    def invalidate_fields_cache(self, model: str):
+        """Invalidate cached field definitions.
+
+        Args:
+            model: Model name
+        """
+        if self.field_cache.invalidate(self._fields_key(model)):
+            logger.debug(f"Invalidated cached field definitions for {model}")
+
     def get_cached_record(
         self, model: str, record_id: int, fields: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
@@ -695,6 +912,46 @@ class PerformanceManager:
         # Permissions may change, cache for 5 minutes
         self.permission_cache.put(key, allowed, ttl_seconds=300)
 
+    def _auth_key(self, database: str, credentials: str) -> str:
+        """Build the auth cache key without keeping secrets in plain text."""
+        digest = hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+        return self.cache_key("auth", url=self.config.url, db=database, credentials=digest)
+
+    def get_cached_auth(self, database: str, credentials: str) -> Optional[Tuple[int, str]]:
+        """Get a cached authentication result.
+
+        Args:
+            database: Database name
+            credentials: Opaque string identifying the login and secret
+
+        Returns:
+            Tuple of (uid, auth_method) or None
+        """
+        cached = self.auth_cache.get(self._auth_key(database, credentials))
+        return (cached[0], cached[1]) if cached else None
+
+    def cache_auth(self, database: str, credentials: str, uid: int, auth_method: str):
+        """Cache a successful authentication result.
+
+        Args:
+            database: Database name
+            credentials: Opaque string identifying the login and secret
+            uid: Authenticated user ID
+            auth_method: Authentication method used ('api_key' or 'password')
+        """
+        key = self._auth_key(database, credentials)
+        # Reconnects within 10 minutes skip the authentication round-trip
+        self.auth_cache.put(key, [uid, auth_method], ttl_seconds=600)
+
+    def invalidate_auth(self, database: str, credentials: str):
+        """Drop a cached authentication result.
+
+        Args:
+            database: Database name
+            credentials: Opaque string identifying the login and secret
+        """
+        self.auth_cache.invalidate(self._auth_key(database, credentials))
+
     def get_optimized_connection(self, endpoint: str) -> Any:
         """Get optimized connection from pool.
 
@@ -707,6 +964,17 @@ class PerformanceManager:
         with self.monitor.track_operation("connection_get"):
             return self.connection_pool.get_connection(endpoint)
 
+    def get_json_rpc_proxy(self, service: str) -> JsonRpcProxy:
+        """Get a JSON-RPC proxy for a service.
+
+        Args:
+            service: Odoo RPC service name (e.g., 'object')
+
+        Returns:
+            JsonRpcProxy using the connection pool's transport
+        """
+        return self.connection_pool.get_json_rpc_proxy(service)
+
     def optimize_search_fields(
         self, model: str, requested_fields: Optional[List[str]] = None
     ) -> List[str]:
@@ -730,6 +998,7 @@ class PerformanceManager:
                 "field_cache": self.field_cache.get_stats(),
                 "record_cache": self.record_cache.get_stats(),
                 "permission_cache": self.permission_cache.get_stats(),
+                "auth_cache": self.auth_cache.get_stats(),
             },
             "connection_pool": self.connection_pool.get_stats(),
             "performance": self.monitor.get_stats(),
@@ -741,11 +1010,21 @@ class PerformanceManager:
         Args:
             db_name: Database name to send in the header
         """
+        self._database = db_name
         self.connection_pool.set_database(db_name)
 
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """Set the socket timeout for XML-RPC requests on the connection pool.
+
+        Args:
+            timeout: Timeout in seconds, or None for no timeout
+        """
+        self.connection_pool.set_timeout(timeout)
+
     def clear_all_caches(self):
         """Clear all caches."""
         self.field_cache.clear()
         self.record_cache.clear()
         self.permission_cache.clear()
+        self.auth_cache.clear()
         logger.info("All caches cleared")
@@ -4,8 +4,10 @@ This module implements MCP resources for accessing Odoo data through
 standardized URIs using FastMCP decorators.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
 from mcp.server.fastmcp import Context, FastMCP
@@ -28,6 +30,18 @@ from .uri_schema import (
 
 logger = get_logger(__name__)
 
+# Rules framing result headers, field groups and browsed records
+_HEADER_RULE = "=" * 60
+_GROUP_RULE = "-" * 30
+_RECORD_SEPARATOR = "\n" + "-" * 40 + "\n"
+
+# Field types whose definitions list a related model or a decimal precision
+_RELATION_FIELD_TYPES = frozenset(("many2one", "one2many", "many2many"))
+_DECIMAL_FIELD_TYPES = frozenset(("float", "monetary"))
+
+# Field types left out of record reads because they often fail to serialize
+_UNSAFE_READ_FIELD_TYPES = frozenset(("binary", "serialized", "html"))
+
 
 class OdooResourceHandler:
     """Handles MCP resource requests for Odoo data."""
@@ -61,7 +75,7 @@ class OdooResourceHandler:
             try:
                 await ctx.info(message)
             except Exception:
-                logger.debug(f"Failed to send ctx info: {message}")
+                logger.debug("Failed to send ctx info: %s", message)
 
     def _register_resources(self):
         """Register all resource handlers with FastMCP."""
@@ -175,7 +189,7 @@ class OdooResourceHandler:
         context = ErrorContext(model=model, operation="get_record", record_id=record_id)
         await self._ctx_info(ctx, f"Retrieving {model}/{record_id}...")
 
-        logger.info(f"Retrieving record: {model}/{record_id}")
+        logger.info("Retrieving record: %s/%s", model, record_id)
 
         try:
             with perf_logger.track_operation("resource_get_record", model=model):
@@ -191,70 +205,47 @@ class OdooResourceHandler:
 
                 # Check model access permissions
                 try:
-                    self.access_controller.validate_model_access(model, "read")
+                    await asyncio.to_thread(
+                        self.access_controller.validate_model_access, model, "read"
+                    )
                 except AccessControlError as e:
-                    logger.warning(f"Access denied for {model}.read: {e}")
+                    logger.warning("Access denied for %s.read: %s", model, e)
                     raise PermissionError(f"Access denied: {e}", context=context) from e
 
                 # Ensure we're connected
                 if not self.connection.is_authenticated:
                     raise ValidationError("Not authenticated with Odoo", context=context)
 
-            # Search for the record to check if it exists
-            record_ids = self.connection.search(model, [("id", "=", record_id_int)])
+            # Read the record with smart field selection to avoid serialization issues.
+            # search_read returns nothing for a missing ID, where read would raise,
+            # so existence is checked without a separate search round-trip.
+            records, fields_info = await asyncio.to_thread(
+                self._read_safe_records,
+                model,
+                partial(self.connection.search_read, model, [("id", "=", record_id_int)]),
+            )
 
-            if not record_ids:
+            if not records:
                 raise NotFoundError(
                     f"Record not found: {model} with ID {record_id} does not exist", context=context
                 )
 
-            # Read the record with smart field selection to avoid serialization issues
-            # Get field metadata to determine which fields to fetch
-            try:
-                fields_info = self.connection.fields_get(model)
-                # Filter out fields that might cause serialization issues
-                safe_fields = []
-                for field_name, field_info in fields_info.items():
-                    field_type = field_info.get("type", "")
-                    # Skip fields that commonly cause XML-RPC serialization issues
-                    # Expanded list to include html fields which often contain Markup objects
-                    problematic_types = ["binary", "serialized", "html"]
-                    if (
-                        field_type not in problematic_types
-                        and not field_name.startswith("__")
-                        and not field_name.startswith("_")
-                    ):  # Also skip private fields
-                        safe_fields.append(field_name)
-
-                if safe_fields:
-                    records = self.connection.read(model, record_ids, safe_fields)
-                else:
-                    # Fallback to all fields if we can't determine safe fields
-                    records = self.connection.read(model, record_ids)
-            except Exception as e:
-                logger.debug(f"Could not get field metadata, reading all fields: {e}")
-                # If we can't get field info, try to read all fields
-                records = self.connection.read(model, record_ids)
-
-            if not records:
-                raise NotFoundError(f"Record not found: {model} with ID {record_id} does not exist")
-
             record = records[0]
 
             # Format the record data
-            formatted_data = self._format_record(model, record)
+            formatted_data = self._format_record(model, record, fields_info)
 
-            logger.info(f"Successfully retrieved record: {model}/{record_id}")
+            logger.info("Successfully retrieved record: %s/%s", model, record_id)
             return formatted_data
 
         except (NotFoundError, PermissionError, ValidationError):
             # Re-raise our custom exceptions
             raise
         except OdooConnectionError as e:
-            logger.error(f"Connection error retrieving {model}/{record_id}: {e}")
+            logger.error("Connection error retrieving %s/%s: %s", model, record_id, e)
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error retrieving {model}/{record_id}: {e}")
+            logger.error("Unexpected error retrieving %s/%s: %s", model, record_id, e)
             raise ValidationError(f"Failed to retrieve record: {e}") from e
 
     async def _handle_search(
@@ -283,14 +274,16 @@ class OdooResourceHandler:
             PermissionError: If access is denied
             ValidationError: For other errors
         """
-        logger.info(f"Searching {model} with domain={domain}, limit={limit}, offset={offset}")
+        logger.info(
+            "Searching %s with domain=%s, limit=%s, offset=%s", model, domain, limit, offset
+        )
 
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
             except AccessControlError as e:
-                logger.warning(f"Access denied for {model}.read: {e}")
+                logger.warning("Access denied for %s.read: %s", model, e)
                 raise PermissionError(f"Access denied: {e}") from e
 
             # Ensure we're connected
@@ -304,24 +297,32 @@ class OdooResourceHandler:
             offset_value = self._parse_offset(offset)
             order_value = self._parse_order(order)
 
-            # Get total count for pagination
-            total_count = self.connection.search_count(model, parsed_domain)
-
-            # Perform search
-            record_ids = self.connection.search(
-                model, parsed_domain, limit=limit_value, offset=offset_value, order=order_value
+            # Search and read the page in a single round trip
+            records = await asyncio.to_thread(
+                self.connection.search_read,
+                model,
+                parsed_domain,
+                fields_list,
+                limit=limit_value,
+                offset=offset_value,
+                order=order_value,
             )
 
-            # Read records if any found
-            records = []
-            if record_ids:
-                records = self.connection.read(model, record_ids, fields_list)
+            # Get total count for pagination. A page shorter than the limit is
+            # the last one, so the total follows from it without a count call;
+            # an empty page past the start still needs the real count.
+            if len(records) < limit_value and (records or not offset_value):
+                total_count = offset_value + len(records)
+            else:
+                total_count = await asyncio.to_thread(
+                    self.connection.search_count, model, parsed_domain
+                )
 
             # Get field metadata for formatting
             try:
-                fields_metadata = self.connection.fields_get(model)
+                fields_metadata = await asyncio.to_thread(self.connection.fields_get, model)
             except Exception as e:
-                logger.debug(f"Could not retrieve field metadata: {e}")
+                logger.debug("Could not retrieve field metadata: %s", e)
                 fields_metadata = None
 
             # Format search results
@@ -336,17 +337,17 @@ class OdooResourceHandler:
                 fields_metadata,
             )
 
-            logger.info(f"Search completed: found {len(records)} of {total_count} records")
+            logger.info("Search completed: found %s of %s records", len(records), total_count)
             return formatted_results
 
         except (PermissionError, ValidationError):
             # Re-raise our custom exceptions
             raise
         except OdooConnectionError as e:
-            logger.error(f"Connection error searching {model}: {e}")
+            logger.error("Connection error searching %s: %s", model, e)
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error searching {model}: {e}")
+            logger.error("Unexpected error searching %s: %s", model, e)
             raise ValidationError(f"Failed to search records: {e}") from e
 
     def _parse_domain(self, domain: Optional[str]) -> List[Any]:
@@ -362,8 +363,8 @@ class OdooResourceHandler:
             return []
 
         try:
-            # URL decode
-            decoded = unquote(domain)
+            # URL decode, skipped when there is nothing escaped
+            decoded = unquote(domain) if "%" in domain else domain
             # Parse JSON
             parsed = json.loads(decoded)
 
@@ -372,7 +373,7 @@ class OdooResourceHandler:
 
             return parsed
         except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Invalid domain parameter: {domain} - {e}")
+            logger.warning("Invalid domain parameter: %s - %s", domain, e)
             return []
 
     def _parse_fields(self, fields: Optional[str]) -> Optional[List[str]]:
@@ -400,16 +401,11 @@ class OdooResourceHandler:
         Returns:
             Valid limit value
         """
-        if limit is None:
+        if limit is None or limit <= 0:
             return self.config.default_limit
 
         # Ensure it's within bounds
-        if limit <= 0:
-            return self.config.default_limit
-        elif limit > self.config.max_limit:
-            return self.config.max_limit
-        else:
-            return limit
+        return min(limit, self.config.max_limit)
 
     def _parse_offset(self, offset: Optional[int]) -> int:
         """Parse and validate offset parameter.
@@ -476,21 +472,20 @@ class OdooResourceHandler:
         next_uri = None
         prev_uri = None
 
+        # Convert domain back to JSON string for URI, once for both links
+        domain_str = (
+            json.dumps(domain, separators=(",", ":")) if domain and (has_next or has_prev) else None
+        )
+
         if has_next:
-            # Convert domain back to JSON string for URI
-            domain_str = json.dumps(domain) if domain else None
-            fields_str = ",".join(fields) if fields else None
             next_uri = build_search_uri(
-                model, domain=domain_str, fields=fields_str, limit=limit, offset=offset + limit
+                model, domain=domain_str, fields=fields, limit=limit, offset=offset + limit
             )
 
         if has_prev:
             prev_offset = max(0, offset - limit)
-            # Convert domain back to JSON string for URI
-            domain_str = json.dumps(domain) if domain else None
-            fields_str = ",".join(fields) if fields else None
             prev_uri = build_search_uri(
-                model, domain=domain_str, fields=fields_str, limit=limit, offset=prev_offset
+                model, domain=domain_str, fields=fields, limit=limit, offset=prev_offset
             )
 
         # Use DatasetFormatter for rich formatting
@@ -523,14 +518,14 @@ class OdooResourceHandler:
             PermissionError: If access is denied
             ValidationError: For other errors
         """
-        logger.info(f"Browsing {model} records with IDs: {ids}")
+        logger.info("Browsing %s records with IDs: %s", model, ids)
 
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
             except AccessControlError as e:
-                logger.warning(f"Access denied for {model}.read: {e}")
+                logger.warning("Access denied for %s.read: %s", model, e)
                 raise PermissionError(f"Access denied: {e}") from e
 
             # Ensure we're connected
@@ -543,56 +538,24 @@ class OdooResourceHandler:
                 raise ValidationError("No valid IDs provided")
 
             # Read records in batch with smart field selection to avoid serialization issues
-            # Get field metadata to determine which fields to fetch
-            try:
-                fields_info = self.connection.fields_get(model)
-                # Filter out fields that might cause serialization issues
-                safe_fields = []
-                for field_name, field_info in fields_info.items():
-                    field_type = field_info.get("type", "")
-                    # Skip fields that commonly cause XML-RPC serialization issues
-                    # Expanded list to include html fields which often contain Markup objects
-                    problematic_types = ["binary", "serialized", "html"]
-                    if (
-                        field_type not in problematic_types
-                        and not field_name.startswith("__")
-                        and not field_name.startswith("_")
-                    ):  # Also skip private fields
-                        safe_fields.append(field_name)
-
-                if safe_fields:
-                    records = self.connection.read(model, id_list, safe_fields)
-                else:
-                    # Fallback to all fields if we can't determine safe fields
-                    records = self.connection.read(model, id_list)
-            except Exception as e:
-                logger.debug(f"Could not get field metadata, reading all fields: {e}")
-                # If we can't get field info, try to read all fields
-                records = self.connection.read(model, id_list)
-
-            # Get field metadata for formatting
-            try:
-                fields_metadata = self.connection.fields_get(model)
-            except Exception as e:
-                logger.debug(f"Could not retrieve field metadata: {e}")
-                fields_metadata = None
+            records, fields_info = await asyncio.to_thread(
+                self._read_safe_records, model, partial(self.connection.read, model, id_list)
+            )
 
             # Format the results
-            formatted_results = self._format_browse_results(
-                model, records, id_list, fields_metadata
-            )
+            formatted_results = self._format_browse_results(model, records, id_list, fields_info)
 
-            logger.info(f"Browse completed: found {len(records)} of {len(id_list)} records")
+            logger.info("Browse completed: found %s of %s records", len(records), len(id_list))
             return formatted_results
 
         except (PermissionError, ValidationError):
             # Re-raise our custom exceptions
             raise
         except OdooConnectionError as e:
-            logger.error(f"Connection error browsing {model}: {e}")
+            logger.error("Connection error browsing %s: %s", model, e)
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error browsing {model}: {e}")
+            logger.error("Unexpected error browsing %s: %s", model, e)
             raise ValidationError(f"Failed to browse records: {e}") from e
 
     async def _handle_count(self, model: str, domain: Optional[str]) -> str:
@@ -609,14 +572,14 @@ class OdooResourceHandler:
             PermissionError: If access is denied
             ValidationError: For other errors
         """
-        logger.info(f"Counting {model} records with domain: {domain}")
+        logger.info("Counting %s records with domain: %s", model, domain)
 
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
             except AccessControlError as e:
-                logger.warning(f"Access denied for {model}.read: {e}")
+                logger.warning("Access denied for %s.read: %s", model, e)
                 raise PermissionError(f"Access denied: {e}") from e
 
             # Ensure we're connected
@@ -627,22 +590,22 @@ class OdooResourceHandler:
             parsed_domain = self._parse_domain(domain)
 
             # Get count
-            count = self.connection.search_count(model, parsed_domain)
+            count = await asyncio.to_thread(self.connection.search_count, model, parsed_domain)
 
             # Format result
             formatted_result = self._format_count_result(model, count, parsed_domain)
 
-            logger.info(f"Count completed: {count} records match criteria")
+            logger.info("Count completed: %s records match criteria", count)
             return formatted_result
 
         except (PermissionError, ValidationError):
             # Re-raise our custom exceptions
             raise
         except OdooConnectionError as e:
-            logger.error(f"Connection error counting {model}: {e}")
+            logger.error("Connection error counting %s: %s", model, e)
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error counting {model}: {e}")
+            logger.error("Unexpected error counting %s: %s", model, e)
             raise ValidationError(f"Failed to count records: {e}") from e
 
     async def _handle_fields(self, model: str) -> str:
@@ -658,14 +621,14 @@ class OdooResourceHandler:
             PermissionError: If access is denied
             ValidationError: For other errors
         """
-        logger.info(f"Getting field definitions for {model}")
+        logger.info("Getting field definitions for %s", model)
 
         try:
             # Check model access permissions
             try:
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
             except AccessControlError as e:
-                logger.warning(f"Access denied for {model}.read: {e}")
+                logger.warning("Access denied for %s.read: %s", model, e)
                 raise PermissionError(f"Access denied: {e}") from e
 
             # Ensure we're connected
@@ -673,24 +636,65 @@ class OdooResourceHandler:
                 raise ValidationError("Not authenticated with Odoo")
 
             # Get field definitions
-            fields = self.connection.fields_get(model)
+            fields = await asyncio.to_thread(self.connection.fields_get, model)
 
             # Format result
             formatted_result = self._format_fields_result(model, fields)
 
-            logger.info(f"Fields retrieved: {len(fields)} fields found")
+            logger.info("Fields retrieved: %s fields found", len(fields))
             return formatted_result
 
         except (PermissionError, ValidationError):
             # Re-raise our custom exceptions
             raise
         except OdooConnectionError as e:
-            logger.error(f"Connection error getting fields for {model}: {e}")
+            logger.error("Connection error getting fields for %s: %s", model, e)
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error getting fields for {model}: {e}")
+            logger.error("Unexpected error getting fields for %s: %s", model, e)
             raise ValidationError(f"Failed to get field definitions: {e}") from e
 
+    def _read_safe_records(
+        self, model: str, reader: Callable[..., List[Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Read records, skipping fields that do not serialize over XML-RPC.
+
+        The field metadata is fetched once and returned alongside the records
+        so callers can reuse it for formatting.
+
+        Args:
+            model: The Odoo model name
+            reader: Connection read call bound to its records, taking an
+                optional list of fields as its only argument
+
+        Returns:
+            Tuple of the records read and the field metadata, or None if the
+            metadata could not be fetched
+        """
+        fields_info = None
+        try:
+            fields_info = self.connection.fields_get(model)
+            # Skip private fields and types that commonly cause XML-RPC
+            # serialization issues (html fields often contain Markup objects)
+            safe_fields = [
+                field_name
+                for field_name, field_info in fields_info.items()
+                if field_info.get("type", "") not in _UNSAFE_READ_FIELD_TYPES
+                and not field_name.startswith("_")
+            ]
+
+            if safe_fields:
+                records = reader(safe_fields)
+            else:
+                # Fallback to all fields if we can't determine safe fields
+                records = reader()
+        except Exception as e:
+            logger.debug("Could not get field metadata, reading all fields: %s", e)
+            # If we can't get field info, try to read all fields
+            records = reader()
+
+        return records, fields_info
+
     def _parse_ids(self, ids: str) -> List[int]:
         """Parse comma-separated IDs string.
 
@@ -703,14 +707,26 @@ class OdooResourceHandler:
         if not ids:
             return []
 
+        if ids.isdecimal():
+            # Single ID, the common case for one-record browses
+            id_int = int(ids)
+            return [id_int] if id_int > 0 else []
+
+        id_strs = ids.split(",")
+        try:
+            # Fast path for a clean list; int() tolerates surrounding whitespace
+            return [id_int for id_int in map(int, id_strs) if id_int > 0]
+        except ValueError:
+            pass
+
         id_list = []
-        for id_str in ids.split(","):
+        for id_str in id_strs:
             try:
                 id_int = int(id_str.strip())
                 if id_int > 0:
                     id_list.append(id_int)
             except ValueError:
-                logger.warning(f"Invalid ID in list: {id_str}")
+                logger.warning("Invalid ID in list: %s", id_str)
 
         return id_list
 
@@ -733,9 +749,9 @@ class OdooResourceHandler:
             Formatted browse results
         """
         lines = [
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Browse Results: {model}",
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Requested IDs: {', '.join(map(str, requested_ids))}",
             f"Found: {len(records)} of {len(requested_ids)} records",
             "",
@@ -748,12 +764,12 @@ class OdooResourceHandler:
             lines.append(f"Missing IDs: {', '.join(map(str, sorted(missing_ids)))}")
             lines.append("")
 
-        # Format each record
+        # Format each record; field selection is resolved once for the batch
         formatter = RecordFormatter(model)
-        for idx, record in enumerate(records, 1):
+        for idx, formatted in enumerate(formatter.format_records(records, fields_metadata), 1):
             if idx > 1:
-                lines.append(f"\n{'-' * 40}\n")
-            lines.append(formatter.format_record(record, fields_metadata))
+                lines.append(_RECORD_SEPARATOR)
+            lines.append(formatted)
 
         return "\n".join(lines)
 
@@ -769,9 +785,9 @@ class OdooResourceHandler:
             Formatted count result
         """
         lines = [
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Count Result: {model}",
-            f"{'=' * 60}",
+            _HEADER_RULE,
         ]
 
         if domain:
@@ -796,35 +812,44 @@ class OdooResourceHandler:
             Formatted field definitions
         """
         lines = [
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Field Definitions: {model}",
-            f"{'=' * 60}",
+            _HEADER_RULE,
             f"Total fields: {len(fields)}",
             "",
         ]
 
-        # Group fields by type
-        fields_by_type = {}
-        for field_name, field_info in sorted(fields.items()):
+        # Group fields by type, in field name order
+        fields_by_type: Dict[str, List[Any]] = {}
+        for field_name in sorted(fields):
+            field_info = fields[field_name]
             field_type = field_info.get("type", "unknown")
-            if field_type not in fields_by_type:
-                fields_by_type[field_type] = []
-            fields_by_type[field_type].append((field_name, field_info))
+            fields_by_type.setdefault(field_type, []).append((field_name, field_info))
 
         # Format fields by type
-        for field_type in sorted(fields_by_type.keys()):
-            lines.append(f"\n{field_type.upper()} Fields ({len(fields_by_type[field_type])}):")
-            lines.append("-" * 30)
-
-            for field_name, field_info in fields_by_type[field_type]:
-                lines.append(f"\n{field_name}:")
-                lines.append(f"  Label: {field_info.get('string', 'N/A')}")
-                lines.append(f"  Required: {field_info.get('required', False)}")
-                lines.append(f"  Readonly: {field_info.get('readonly', False)}")
+        for field_type in sorted(fields_by_type):
+            typed_fields = fields_by_type[field_type]
+            lines.extend((f"\n{field_type.upper()} Fields ({len(typed_fields)}):", _GROUP_RULE))
+
+            # Type-specific information is the same for the whole group
+            is_selection = field_type == "selection"
+            is_relation = field_type in _RELATION_FIELD_TYPES
+            is_decimal = field_type in _DECIMAL_FIELD_TYPES
+
+            for field_name, field_info in typed_fields:
+                get = field_info.get
+                lines.extend(
+                    (
+                        f"\n{field_name}:",
+                        f"  Label: {get('string', 'N/A')}",
+                        f"  Required: {get('required', False)}",
+                        f"  Readonly: {get('readonly', False)}",
+                    )
+                )
 
                 # Add type-specific information
-                if field_type == "selection":
-                    selection = field_info.get("selection", [])
+                if is_selection:
+                    selection = get("selection", [])
                     if selection and len(selection) <= 5:
                         lines.append(
                             f"  Options: {', '.join([f'{k} ({v})' for k, v in selection])}"
@@ -832,16 +857,14 @@ class OdooResourceHandler:
                     elif selection:
                         lines.append(f"  Options: {len(selection)} choices available")
 
-                elif field_type in ("many2one", "one2many", "many2many"):
-                    relation = field_info.get("relation", "N/A")
-                    lines.append(f"  Related Model: {relation}")
+                elif is_relation:
+                    lines.append(f"  Related Model: {get('relation', 'N/A')}")
 
-                elif field_type in ("float", "monetary"):
-                    digits = field_info.get("digits", "N/A")
-                    lines.append(f"  Precision: {digits}")
+                elif is_decimal:
+                    lines.append(f"  Precision: {get('digits', 'N/A')}")
 
                 # Add help text if available
-                help_text = field_info.get("help", "")
+                help_text = get("help", "")
                 if help_text:
                     lines.append(
                         f"  Help: {help_text[:100]}{'...' if len(help_text) > 100 else ''}"
@@ -849,23 +872,22 @@ class OdooResourceHandler:
 
         return "\n".join(lines)
 
-    def _format_record(self, model: str, record: Dict[str, Any]) -> str:
+    def _format_record(
+        self,
+        model: str,
+        record: Dict[str, Any],
+        fields_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> str:
         """Format a record for MCP consumption.
 
         Args:
             model: The model name
             record: The record data
+            fields_metadata: Field metadata already fetched for the record, if any
 
         Returns:
             Formatted text representation
         """
-        # Get field metadata if available
-        try:
-            fields_metadata = self.connection.fields_get(model)
-        except Exception as e:
-            logger.debug(f"Could not retrieve field metadata: {e}")
-            fields_metadata = None
-
         # Use RecordFormatter for rich formatting
         formatter = RecordFormatter(model)
         return formatter.format_record(record, fields_metadata)
@@ -113,8 +113,10 @@ class OdooMCPServer:
             try:
                 logger.info("Establishing connection to Odoo...")
                 with perf_logger.track_operation("connection_setup"):
-                    # Create performance manager (shared across components)
-                    self.performance_manager = PerformanceManager(self.config)
+                    # Create performance manager (shared across components). It
+                    # outlives reconnects so cached field definitions are reused.
+                    if self.performance_manager is None:
+                        self.performance_manager = PerformanceManager(self.config)
 
                     # Create connection with performance manager
                     self.connection = OdooConnection(
@@ -5,9 +5,12 @@ Tools are different from resources - they can have side effects and perform
 actions like creating, updating, or deleting records.
 """
 
+import ast
+import asyncio
 import json
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import ToolAnnotations
@@ -35,6 +38,107 @@ from .schemas import (
 logger = get_logger(__name__)
 
 
+# Resource templates described by the list_resource_templates tool
+_RESOURCE_TEMPLATES: Tuple[Dict[str, Any], ...] = (
+    {
+        "uri_template": "odoo://{model}/record/{record_id}",
+        "description": "Get a specific record by ID",
+        "parameters": {
+            "model": "Odoo model name (e.g., res.partner)",
+            "record_id": "Record ID (e.g., 10)",
+        },
+        "example": "odoo://res.partner/record/10",
+    },
+    {
+        "uri_template": "odoo://{model}/search",
+        "description": "Basic search returning first 10 records",
+        "parameters": {
+            "model": "Odoo model name",
+        },
+        "example": "odoo://res.partner/search",
+        "note": "Query parameters are not supported. Use search_records tool for advanced queries.",
+    },
+    {
+        "uri_template": "odoo://{model}/count",
+        "description": "Count all records in a model",
+        "parameters": {
+            "model": "Odoo model name",
+        },
+        "example": "odoo://res.partner/count",
+        "note": "Query parameters are not supported. Use search_records tool for filtered counts.",
+    },
+    {
+        "uri_template": "odoo://{model}/fields",
+        "description": "Get field definitions for a model",
+        "parameters": {"model": "Odoo model name"},
+        "example": "odoo://res.partner/fields",
+    },
+)
+
+
+def _parse_domain_string(domain: str) -> List[Any]:
+    """Parse a search domain passed as a string.
+
+    Accepts JSON, JSON written with Python quoting and booleans, and Python
+    list literals, tried in that order.
+
+    Args:
+        domain: Domain string from the tool call
+
+    Returns:
+        Parsed domain list
+
+    Raises:
+        ValidationError: If the string is not a valid domain list
+    """
+    try:
+        # First try standard JSON parsing
+        parsed_domain = json.loads(domain)
+    except json.JSONDecodeError:
+        # If that fails, try converting single quotes to double quotes
+        # This handles Python-style domain strings
+        try:
+            # Replace single quotes with double quotes for valid JSON
+            # But be careful not to replace quotes inside string values
+            json_domain = domain.replace("'", '"')
+            # Also need to ensure Python True/False are lowercase for JSON
+            json_domain = json_domain.replace("True", "true").replace("False", "false")
+            parsed_domain = json.loads(json_domain)
+        except json.JSONDecodeError as e:
+            # If both attempts fail, try evaluating as Python literal
+            try:
+                parsed_domain = ast.literal_eval(domain)
+            except (ValueError, SyntaxError):
+                raise ValidationError(
+                    f"Invalid domain parameter. Expected JSON array or Python list, got: {domain[:100]}..."
+                ) from e
+
+    if not isinstance(parsed_domain, list):
+        raise ValidationError(f"Domain must be a list, got {type(parsed_domain).__name__}")
+    logger.debug("Parsed domain from string: %s", parsed_domain)
+    return parsed_domain
+
+
+# Messages OdooConnectionError carries when Odoo raises MissingError. XML-RPC
+# sends write()'s MissingError back as a bare warning ("One of the records you
+# are trying to modify has already been deleted ..."), which ErrorSanitizer
+# passes through; tracebacks naming MissingError are rewritten to the
+# sanitizer's own wording.
+_MISSING_RECORD_MESSAGES = (
+    "has already been deleted",
+    "you are trying to access has been deleted",
+    "Record does not exist",
+    "The requested record was not found",
+    "The requested record does not exist",
+)
+
+
+def _is_missing_record_error(error: OdooConnectionError) -> bool:
+    """Check whether a connection error reports a record that does not exist."""
+    message = str(error)
+    return any(marker in message for marker in _MISSING_RECORD_MESSAGES)
+
+
 class OdooToolHandler:
     """Handles MCP tool requests for Odoo operations."""
 
@@ -57,6 +161,23 @@ class OdooToolHandler:
         self.connection = connection
         self.access_controller = access_controller
         self.config = config
+        # Models listed in YOLO mode, with the monotonic time they were queried
+        self._yolo_models: Optional[Tuple[float, List[Dict[str, str]]]] = None
+        # YOLO mode metadata reported by list_models depends only on the config
+        self._yolo_mode_desc = "READ-ONLY" if config.yolo_mode == "read" else "FULL ACCESS"
+        full_access = config.yolo_mode == "true"
+        self._yolo_metadata: Dict[str, Any] = {
+            "enabled": True,
+            "level": config.yolo_mode,  # "read" or "true"
+            "description": self._yolo_mode_desc,
+            "warning": "🚨 All models accessible without MCP security!",
+            "operations": {
+                "read": True,
+                "write": full_access,
+                "create": full_access,
+                "unlink": full_access,
+            },
+        }
 
         # Register tools
         self._register_tools()
@@ -306,13 +427,16 @@ class OdooToolHandler:
                 final_fields = [f for f in essential_fields if f in fields_info]
 
             logger.debug(
-                f"Smart default fields for {model}: {len(final_fields)} of {len(fields_info)} fields "
-                f"(max configured: {max_fields})"
+                "Smart default fields for %s: %s of %s fields (max configured: %s)",
+                model,
+                len(final_fields),
+                len(fields_info),
+                max_fields,
             )
             return final_fields
 
         except Exception as e:
-            logger.warning(f"Could not determine default fields for {model}: {e}")
+            logger.warning("Could not determine default fields for %s: %s", model, e)
             # Return None to indicate we should get all fields
             return None
 
@@ -322,7 +446,7 @@ class OdooToolHandler:
             try:
                 await ctx.info(message)
             except Exception:
-                logger.debug(f"Failed to send ctx info: {message}")
+                logger.debug("Failed to send ctx info: %s", message)
 
     async def _ctx_warning(self, ctx, message: str):
         """Send warning to MCP client context if available."""
@@ -330,7 +454,7 @@ class OdooToolHandler:
             try:
                 await ctx.warning(message)
             except Exception:
-                logger.debug(f"Failed to send ctx warning: {message}")
+                logger.debug("Failed to send ctx warning: %s", message)
 
     async def _ctx_progress(self, ctx, progress: float, total: float, message: str = ""):
         """Report progress to MCP client context if available."""
@@ -338,7 +462,7 @@ class OdooToolHandler:
             try:
                 await ctx.report_progress(progress, total, message)
             except Exception:
-                logger.debug(f"Failed to report progress: {progress}/{total}")
+                logger.debug("Failed to report progress: %s/%s", progress, total)
 
     def _register_tools(self):
         """Register all tool handlers with FastMCP."""
@@ -573,7 +697,7 @@ class OdooToolHandler:
         try:
             with perf_logger.track_operation("tool_search", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
                 await self._ctx_info(ctx, f"Searching {model}...")
 
                 # Ensure we're connected
@@ -584,38 +708,7 @@ class OdooToolHandler:
                 parsed_domain = []
                 if domain is not None:
                     if isinstance(domain, str):
-                        # Parse string to list
-                        try:
-                            # First try standard JSON parsing
-                            parsed_domain = json.loads(domain)
-                        except json.JSONDecodeError:
-                            # If that fails, try converting single quotes to double quotes
-                            # This handles Python-style domain strings
-                            try:
-                                # Replace single quotes with double quotes for valid JSON
-                                # But be careful not to replace quotes inside string values
-                                json_domain = domain.replace("'", '"')
-                                # Also need to ensure Python True/False are lowercase for JSON
-                                json_domain = json_domain.replace("True", "true").replace(
-                                    "False", "false"
-                                )
-                                parsed_domain = json.loads(json_domain)
-                            except json.JSONDecodeError as e:
-                                # If both attempts fail, try evaluating as Python literal
-                                try:
-                                    import ast
-
-                                    parsed_domain = ast.literal_eval(domain)
-                                except (ValueError, SyntaxError):
-                                    raise ValidationError(
-                                        f"Invalid domain parameter. Expected JSON array or Python list, got: {domain[:100]}..."
-                                    ) from e
-
-                        if not isinstance(parsed_domain, list):
-                            raise ValidationError(
-                                f"Domain must be a list, got {type(parsed_domain).__name__}"
-                            )
-                        logger.debug(f"Parsed domain from string: {parsed_domain}")
+                        parsed_domain = _parse_domain_string(domain)
                     else:
                         # Already a list
                         parsed_domain = domain
@@ -633,8 +726,6 @@ class OdooToolHandler:
                     except json.JSONDecodeError:
                         # Try Python literal eval as fallback
                         try:
-                            import ast
-
                             parsed_fields = ast.literal_eval(fields)
                             if not isinstance(parsed_fields, list):
                                 raise ValidationError(
@@ -651,23 +742,27 @@ class OdooToolHandler:
                 elif limit > self.config.max_limit:
                     limit = self.config.max_limit
 
-                # Get total count
-                total_count = self.connection.search_count(model, parsed_domain)
-                await self._ctx_progress(ctx, 1, 3, f"Found {total_count} records")
-
-                # Search for records
-                record_ids = self.connection.search(
-                    model, parsed_domain, limit=limit, offset=offset, order=order
+                # Search for the page and count all matches concurrently
+                record_ids, total_count = await asyncio.to_thread(
+                    self.connection.search_and_count,
+                    model,
+                    parsed_domain,
+                    limit=limit,
+                    offset=offset,
+                    order=order,
                 )
+                await self._ctx_progress(ctx, 1, 3, f"Found {total_count} records")
 
                 # Determine which fields to fetch
                 fields_to_fetch = parsed_fields
                 if parsed_fields is None:
                     # Use smart field selection to avoid serialization issues
-                    fields_to_fetch = self._get_smart_default_fields(model)
+                    fields_to_fetch = await asyncio.to_thread(self._get_smart_default_fields, model)
                     await self._ctx_info(ctx, f"Using smart field defaults for {model}")
                     logger.debug(
-                        f"Using smart defaults for {model} search: {len(fields_to_fetch) if fields_to_fetch else 'all'} fields"
+                        "Using smart defaults for %s search: %s fields",
+                        model,
+                        len(fields_to_fetch) if fields_to_fetch else "all",
                     )
                 elif parsed_fields == ["__all__"]:
                     # Explicit request for all fields
@@ -676,12 +771,14 @@ class OdooToolHandler:
                         ctx,
                         f"Fetching ALL fields for {model} — may be slow or cause serialization errors",
                     )
-                    logger.debug(f"Fetching all fields for {model} search")
+                    logger.debug("Fetching all fields for %s search", model)
 
                 # Read records
                 records = []
                 if record_ids:
-                    records = self.connection.read(model, record_ids, fields_to_fetch)
+                    records = await asyncio.to_thread(
+                        self.connection.read, model, record_ids, fields_to_fetch
+                    )
                     # Process datetime fields in each record
                     records = [self._process_record_dates(record, model) for record in records]
                 await self._ctx_progress(ctx, 3, 3, f"Returning {len(records)} records")
@@ -699,7 +796,7 @@ class OdooToolHandler:
         except OdooConnectionError as e:
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in search_records tool: {e}")
+            logger.error("Error in search_records tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Search failed: {sanitized_msg}") from e
 
@@ -714,7 +811,7 @@ class OdooToolHandler:
         try:
             with perf_logger.track_operation("tool_get_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "read")
+                await asyncio.to_thread(self.access_controller.validate_model_access, model, "read")
                 await self._ctx_info(ctx, f"Getting {model}/{record_id}...")
 
                 # Ensure we're connected
@@ -729,23 +826,27 @@ class OdooToolHandler:
 
                 if fields is None:
                     # Use smart field selection
-                    fields_to_fetch = self._get_smart_default_fields(model)
+                    fields_to_fetch = await asyncio.to_thread(self._get_smart_default_fields, model)
                     use_smart_defaults = True
                     field_selection_method = "smart_defaults"
                     logger.debug(
-                        f"Using smart defaults for {model}: {len(fields_to_fetch) if fields_to_fetch else 'all'} fields"
+                        "Using smart defaults for %s: %s fields",
+                        model,
+                        len(fields_to_fetch) if fields_to_fetch else "all",
                     )
                 elif fields == ["__all__"]:
                     # Explicit request for all fields
                     fields_to_fetch = None  # Odoo interprets None as all fields
                     field_selection_method = "all"
-                    logger.debug(f"Fetching all fields for {model}")
+                    logger.debug("Fetching all fields for %s", model)
                 else:
                     # Specific fields requested
-                    logger.debug(f"Fetching specific fields for {model}: {fields}")
+                    logger.debug("Fetching specific fields for %s: %s", model, fields)
 
                 # Read the record
-                records = self.connection.read(model, [record_id], fields_to_fetch)
+                records = await asyncio.to_thread(
+                    self.connection.read, model, [record_id], fields_to_fetch
+                )
 
                 if not records:
                     raise ValidationError(f"Record not found: {model} with ID {record_id}")
@@ -757,7 +858,7 @@ class OdooToolHandler:
                 metadata = None
                 if use_smart_defaults:
                     try:
-                        all_fields_info = self.connection.fields_get(model)
+                        all_fields_info = await asyncio.to_thread(self.connection.fields_get, model)
                         total_fields = len(all_fields_info)
                     except Exception:
                         pass
@@ -780,10 +881,62 @@ class OdooToolHandler:
         except OdooConnectionError as e:
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in get_record tool: {e}")
+            logger.error("Error in get_record tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to get record: {sanitized_msg}") from e
 
+    def _get_yolo_models(self) -> List[Dict[str, str]]:
+        """Get the models listed in YOLO mode from ir.model.
+
+        Installed models only change when modules are installed, so the query
+        result is reused for the access control cache TTL.
+
+        Returns:
+            List of dicts with 'model' and 'name' keys
+        """
+        now = time.monotonic()
+        if self._yolo_models is not None:
+            fetched_at, models_list = self._yolo_models
+            if now - fetched_at < AccessController.CACHE_TTL:
+                return models_list
+
+        # Exclude transient models and less useful system models
+        domain = [
+            "&",
+            ("transient", "=", False),
+            "|",
+            "|",
+            ("model", "not like", "ir.%"),
+            ("model", "not like", "base.%"),
+            (
+                "model",
+                "in",
+                [
+                    "ir.attachment",
+                    "ir.model",
+                    "ir.model.fields",
+                    "ir.config_parameter",
+                ],
+            ),
+        ]
+
+        # Query models from database
+        model_records = self.connection.search_read(
+            "ir.model",
+            domain,
+            ["model", "name"],
+            order="name ASC",
+            limit=200,  # Reasonable limit for practical use
+        )
+
+        # Clean data without permissions
+        models_list = [
+            {"model": record["model"], "name": record["name"] or record["model"]}
+            for record in model_records
+        ]
+        self._yolo_models = (now, models_list)
+        return models_list
+
     async def _handle_list_models_tool(self, ctx=None) -> Dict[str, Any]:
         """Handle list models tool request with permissions."""
         try:
@@ -793,88 +946,39 @@ class OdooToolHandler:
                 if self.config.is_yolo_enabled:
                     # Query actual models from ir.model in YOLO mode
                     try:
-                        # Exclude transient models and less useful system models
-                        domain = [
-                            "&",
-                            ("transient", "=", False),
-                            "|",
-                            "|",
-                            ("model", "not like", "ir.%"),
-                            ("model", "not like", "base.%"),
-                            (
-                                "model",
-                                "in",
-                                [
-                                    "ir.attachment",
-                                    "ir.model",
-                                    "ir.model.fields",
-                                    "ir.config_parameter",
-                                ],
-                            ),
-                        ]
-
-                        # Query models from database
-                        model_records = self.connection.search_read(
-                            "ir.model",
-                            domain,
-                            ["model", "name"],
-                            order="name ASC",
-                            limit=200,  # Reasonable limit for practical use
-                        )
+                        models_list = await asyncio.to_thread(self._get_yolo_models)
 
                         # Prepare response with YOLO mode metadata
-                        mode_desc = (
-                            "READ-ONLY" if self.config.yolo_mode == "read" else "FULL ACCESS"
-                        )
+                        mode_desc = self._yolo_mode_desc
                         await self._ctx_info(
                             ctx,
-                            f"YOLO mode ({mode_desc}): found {len(model_records)} models",
+                            f"YOLO mode ({mode_desc}): found {len(models_list)} models",
                         )
 
-                        # Create metadata about YOLO mode
-                        yolo_metadata = {
-                            "enabled": True,
-                            "level": self.config.yolo_mode,  # "read" or "true"
-                            "description": mode_desc,
-                            "warning": "🚨 All models accessible without MCP security!",
-                            "operations": {
-                                "read": True,
-                                "write": self.config.yolo_mode == "true",
-                                "create": self.config.yolo_mode == "true",
-                                "unlink": self.config.yolo_mode == "true",
-                            },
-                        }
-
-                        # Process actual models (clean data without permissions)
-                        models_list = []
-                        for record in model_records:
-                            model_entry = {
-                                "model": record["model"],
-                                "name": record["name"] or record["model"],
-                            }
-                            models_list.append(model_entry)
-
                         logger.info(
-                            f"YOLO mode ({mode_desc}): Listed {len(model_records)} models from database"
+                            "YOLO mode (%s): Listed %s models from database",
+                            mode_desc,
+                            len(models_list),
                         )
 
                         return {
-                            "yolo_mode": yolo_metadata,
-                            "models": models_list,
+                            # Copied so callers cannot alter later responses
+                            "yolo_mode": {
+                                **self._yolo_metadata,
+                                "operations": dict(self._yolo_metadata["operations"]),
+                            },
+                            "models": [dict(m) for m in models_list],
                             "total": len(models_list),
                         }
 
                     except Exception as e:
-                        logger.error(f"Failed to query models in YOLO mode: {e}")
+                        logger.error("Failed to query models in YOLO mode: %s", e)
                         # Return error in consistent structure
-                        mode_desc = (
-                            "READ-ONLY" if self.config.yolo_mode == "read" else "FULL ACCESS"
-                        )
                         return {
                             "yolo_mode": {
                                 "enabled": True,
                                 "level": self.config.yolo_mode,
-                                "description": mode_desc,
+                                "description": self._yolo_mode_desc,
                                 "warning": f"⚠️ Error querying models: {str(e)}",
                                 "operations": {
                                     "read": False,
@@ -889,7 +993,7 @@ class OdooToolHandler:
                         }
 
                 # Standard mode: Get models from MCP access controller
-                models = self.access_controller.get_enabled_models()
+                models = await asyncio.to_thread(self.access_controller.get_enabled_models)
 
                 # Enrich with permissions for each model
                 enriched_models = []
@@ -898,7 +1002,9 @@ class OdooToolHandler:
                     model_name = model_info["model"]
                     try:
                         # Get permissions for this model
-                        permissions = self.access_controller.get_model_permissions(model_name)
+                        permissions = await asyncio.to_thread(
+                            self.access_controller.get_model_permissions, model_name
+                        )
                         enriched_model = {
                             "model": model_name,
                             "name": model_info["name"],
@@ -912,7 +1018,7 @@ class OdooToolHandler:
                         enriched_models.append(enriched_model)
                     except Exception as e:
                         # If we can't get permissions for a model, include it with all operations false
-                        logger.warning(f"Failed to get permissions for {model_name}: {e}")
+                        logger.warning("Failed to get permissions for %s: %s", model_name, e)
                         enriched_model = {
                             "model": model_name,
                             "name": model_info["name"],
@@ -930,7 +1036,7 @@ class OdooToolHandler:
         except ValidationError:
             raise
         except Exception as e:
-            logger.error(f"Error in list_models tool: {e}")
+            logger.error("Error in list_models tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to list models: {sanitized_msg}") from e
 
@@ -939,56 +1045,23 @@ class OdooToolHandler:
         try:
             await self._ctx_info(ctx, "Listing resource templates...")
             # Get list of enabled models that can be used with resources
-            enabled_models = self.access_controller.get_enabled_models()
+            enabled_models = await asyncio.to_thread(self.access_controller.get_enabled_models)
             model_names = [m["model"] for m in enabled_models if m.get("read", True)]
 
-            # Define the resource templates
-            templates = [
-                {
-                    "uri_template": "odoo://{model}/record/{record_id}",
-                    "description": "Get a specific record by ID",
-                    "parameters": {
-                        "model": "Odoo model name (e.g., res.partner)",
-                        "record_id": "Record ID (e.g., 10)",
-                    },
-                    "example": "odoo://res.partner/record/10",
-                },
-                {
-                    "uri_template": "odoo://{model}/search",
-                    "description": "Basic search returning first 10 records",
-                    "parameters": {
-                        "model": "Odoo model name",
-                    },
-                    "example": "odoo://res.partner/search",
-                    "note": "Query parameters are not supported. Use search_records tool for advanced queries.",
-                },
-                {
-                    "uri_template": "odoo://{model}/count",
-                    "description": "Count all records in a model",
-                    "parameters": {
-                        "model": "Odoo model name",
-                    },
-                    "example": "odoo://res.partner/count",
-                    "note": "Query parameters are not supported. Use search_records tool for filtered counts.",
-                },
-                {
-                    "uri_template": "odoo://{model}/fields",
-                    "description": "Get field definitions for a model",
-                    "parameters": {"model": "Odoo model name"},
-                    "example": "odoo://res.partner/fields",
-                },
-            ]
-
             # Return the resource template information
             return {
-                "templates": templates,
+                # Copied so callers cannot alter later responses
+                "templates": [
+                    {**template, "parameters": dict(template["parameters"])}
+                    for template in _RESOURCE_TEMPLATES
+                ],
                 "enabled_models": model_names[:10],  # Show first 10 as examples
                 "total_models": len(model_names),
                 "note": "Resource URIs do not support query parameters. Use tools (search_records, get_record) for advanced operations with filtering, pagination, and field selection.",
             }
 
         except Exception as e:
-            logger.error(f"Error in list_resource_templates tool: {e}")
+            logger.error("Error in list_resource_templates tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to list resource templates: {sanitized_msg}") from e
 
@@ -1002,7 +1075,9 @@ class OdooToolHandler:
         try:
             with perf_logger.track_operation("tool_create_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "create")
+                await asyncio.to_thread(
+                    self.access_controller.validate_model_access, model, "create"
+                )
                 await self._ctx_info(ctx, f"Creating record in {model}...")
 
                 # Ensure we're connected
@@ -1013,23 +1088,24 @@ class OdooToolHandler:
                 if not values:
                     raise ValidationError("No values provided for record creation")
 
-                # Create the record
-                record_id = self.connection.create(model, values)
-
                 # Return only essential fields to minimize context usage
                 # Users can use get_record if they need more fields
                 # Only use universally available fields (not all models have 'name')
                 essential_fields = ["id", "display_name"]
 
-                # Read only the essential fields
-                records = self.connection.read(model, [record_id], essential_fields)
-                if not records:
+                # Create the record and read back only the essential fields
+                record_id, created = await asyncio.to_thread(
+                    self.connection.create_and_read, model, values, essential_fields
+                )
+                if not created:
+                    if record_id is None:
+                        raise ValidationError(f"Failed to create record in {model}")
                     raise ValidationError(
                         f"Failed to read created record: {model} with ID {record_id}"
                     )
 
                 # Process dates in the minimal record
-                record = self._process_record_dates(records[0], model)
+                record = self._process_record_dates(created, model)
 
                 record_url = self.connection.build_record_url(model, record_id)
 
@@ -1047,7 +1123,7 @@ class OdooToolHandler:
         except OdooConnectionError as e:
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in create_record tool: {e}")
+            logger.error("Error in create_record tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to create record: {sanitized_msg}") from e
 
@@ -1062,7 +1138,9 @@ class OdooToolHandler:
         try:
             with perf_logger.track_operation("tool_update_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "write")
+                await asyncio.to_thread(
+                    self.access_controller.validate_model_access, model, "write"
+                )
                 await self._ctx_info(ctx, f"Updating {model}/{record_id}...")
 
                 # Ensure we're connected
@@ -1073,13 +1151,20 @@ class OdooToolHandler:
                 if not values:
                     raise ValidationError("No values provided for record update")
 
-                # Check if record exists (only fetch ID to verify existence)
-                existing = self.connection.read(model, [record_id], ["id"])
-                if not existing:
-                    raise NotFoundError(f"Record not found: {model} with ID {record_id}")
-
-                # Update the record
-                success = self.connection.write(model, [record_id], values)
+                # Update the record; Odoo rejects IDs that do not exist, so the
+                # existence check only runs when the write fails
+                try:
+                    success = await asyncio.to_thread(
+                        self.connection.write, model, [record_id], values
+                    )
+                except OdooConnectionError as e:
+                    # The fault text is translated to the configured locale, so
+                    # fall back to reading the record when it is not recognised
+                    if _is_missing_record_error(e) or not await asyncio.to_thread(
+                        self.connection.read, model, [record_id], ["id"]
+                    ):
+                        raise NotFoundError(f"Record not found: {model} with ID {record_id}") from e
+                    raise
 
                 # Return only essential fields to minimize context usage
                 # Users can use get_record if they need more fields
@@ -1087,7 +1172,9 @@ class OdooToolHandler:
                 essential_fields = ["id", "display_name"]
 
                 # Read only the essential fields
-                records = self.connection.read(model, [record_id], essential_fields)
+                records = await asyncio.to_thread(
+                    self.connection.read, model, [record_id], essential_fields
+                )
                 if not records:
                     raise ValidationError(
                         f"Failed to read updated record: {model} with ID {record_id}"
@@ -1114,7 +1201,7 @@ class OdooToolHandler:
         except OdooConnectionError as e:
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in update_record tool: {e}")
+            logger.error("Error in update_record tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to update record: {sanitized_msg}") from e
 
@@ -1128,7 +1215,9 @@ class OdooToolHandler:
         try:
             with perf_logger.track_operation("tool_delete_record", model=model):
                 # Check model access
-                self.access_controller.validate_model_access(model, "unlink")
+                await asyncio.to_thread(
+                    self.access_controller.validate_model_access, model, "unlink"
+                )
                 await self._ctx_info(ctx, f"Deleting {model}/{record_id}...")
 
                 # Ensure we're connected
@@ -1136,7 +1225,9 @@ class OdooToolHandler:
                     raise ValidationError("Not authenticated with Odoo")
 
                 # Check if record exists and get display info
-                existing = self.connection.read(model, [record_id], ["id", "display_name"])
+                existing = await asyncio.to_thread(
+                    self.connection.read, model, [record_id], ["id", "display_name"]
+                )
                 if not existing:
                     raise NotFoundError(f"Record not found: {model} with ID {record_id}")
 
@@ -1144,7 +1235,7 @@ class OdooToolHandler:
                 record_name = existing[0].get("display_name", f"ID {record_id}")
 
                 # Delete the record
-                success = self.connection.unlink(model, [record_id])
+                success = await asyncio.to_thread(self.connection.unlink, model, [record_id])
 
                 return {
                     "success": success,
@@ -1162,7 +1253,7 @@ class OdooToolHandler:
         except OdooConnectionError as e:
             raise ValidationError(f"Connection error: {e}") from e
         except Exception as e:
-            logger.error(f"Error in delete_record tool: {e}")
+            logger.error("Error in delete_record tool: %s", e)
             sanitized_msg = ErrorSanitizer.sanitize_message(str(e))
             raise ValidationError(f"Failed to delete record: {sanitized_msg}") from e
 
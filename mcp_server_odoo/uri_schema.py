@@ -16,6 +16,7 @@ import re
 import urllib.parse
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
@@ -29,6 +30,10 @@ class OdooOperation(Enum):
     FIELDS = "fields"
 
 
+# Operation lookup by URI path segment
+_OPERATIONS = {op.value: op for op in OdooOperation}
+
+
 @dataclass
 class OdooURI:
     """Parsed Odoo URI representation."""
@@ -76,11 +81,18 @@ class URIValidationError(URIError):
     pass
 
 
+# URI scheme prefix shared by every Odoo resource URI
+URI_SCHEME = "odoo://"
+
 # URI pattern for matching odoo:// URIs
 # This pattern is permissive in what it captures, validation happens later
 # It requires at least one non-slash character for the model name
 URI_PATTERN = re.compile(r"^odoo://([^/]+)/([^/?]+)(?:/(\d+))?(?:\?(.*))?$")
 
+# Odoo model names start with a letter and contain letters, digits, dots and
+# underscores
+MODEL_NAME_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9_.]*")
+
 
 def parse_uri(uri: str) -> OdooURI:
     """Parse an Odoo URI string into its components.
@@ -95,8 +107,8 @@ def parse_uri(uri: str) -> OdooURI:
         URIParseError: If the URI format is invalid
         URIValidationError: If the URI components are invalid
     """
-    if not uri.startswith("odoo://"):
-        raise URIParseError(f"URI must start with 'odoo://', got: {uri}")
+    if not uri.startswith(URI_SCHEME):
+        raise URIParseError(f"URI must start with '{URI_SCHEME}', got: {uri}")
 
     match = URI_PATTERN.match(uri)
     if not match:
@@ -110,18 +122,13 @@ def parse_uri(uri: str) -> OdooURI:
     if not _is_valid_model_name(model):
         raise URIValidationError(f"Invalid model name: {model}")
 
-    # Parse operation and record ID
-    try:
-        if operation_str == "record" and record_id_str:
-            operation = OdooOperation.RECORD
-            record_id = int(record_id_str)
-        elif operation_str in [op.value for op in OdooOperation]:
-            operation = OdooOperation(operation_str)
-            record_id = None
-        else:
-            raise URIValidationError(f"Invalid operation: {operation_str}")
-    except ValueError:
-        raise URIValidationError(f"Invalid record ID: {record_id_str}") from None
+    # Route on the operation captured by the single URI_PATTERN match
+    operation = _OPERATIONS.get(operation_str)
+    if operation is None:
+        raise URIValidationError(f"Invalid operation: {operation_str}")
+
+    # URI_PATTERN only captures digits for the record ID
+    record_id = int(record_id_str) if operation is OdooOperation.RECORD and record_id_str else None
 
     # Validate operation-specific requirements
     if operation == OdooOperation.RECORD and not record_id:
@@ -190,16 +197,16 @@ def build_uri(
         raise URIValidationError(f"Invalid model name: {model}")
 
     # Validate operation
-    if operation not in [op.value for op in OdooOperation]:
+    if operation not in _OPERATIONS:
         raise URIValidationError(f"Invalid operation: {operation}")
 
     # Build base URI
     if operation == "record":
         if not record_id:
             raise URIValidationError("Record operation requires an ID")
-        uri = f"odoo://{model}/record/{record_id}"
+        uri = f"{URI_SCHEME}{model}/record/{record_id}"
     else:
-        uri = f"odoo://{model}/{operation}"
+        uri = f"{URI_SCHEME}{model}/{operation}"
 
     # Add query parameters
     params = {}
@@ -240,10 +247,12 @@ def build_search_uri(
     )
 
 
+@lru_cache(maxsize=1024, typed=True)
 def build_record_uri(model: str, record_id: int) -> str:
     """Build a record URI for a specific record.
 
-    This is a convenience function for building record URIs.
+    This is a convenience function for building record URIs. Results are
+    memoized since formatters link the same related records repeatedly.
     """
     return build_uri(model, "record", record_id=record_id)
 
@@ -281,6 +290,7 @@ def extract_model_from_uri(uri: str) -> str:
     return parsed.model
 
 
+@lru_cache(maxsize=512)
 def _is_valid_model_name(model: str) -> bool:
     """Check if a model name is valid.
 
@@ -288,18 +298,28 @@ def _is_valid_model_name(model: str) -> bool:
     - Start with a letter
     - Contain only letters, numbers, dots, and underscores
     - Not be empty
+
+    Results are cached, as a server only ever sees a small set of models.
     """
     if not model:
         return False
-    return bool(re.match(r"^[a-zA-Z][a-zA-Z0-9_.]*$", model))
+    return MODEL_NAME_PATTERN.fullmatch(model) is not None
 
 
 def _parse_query_parameters(query_string: str) -> Dict[str, str]:
-    """Parse URL query parameters."""
-    # parse_qsl returns a list of tuples, filter out empty values
+    """Parse URL query parameters.
+
+    Repeated keys keep their last value.
+    """
+    if "%" in query_string or "+" in query_string:
+        return dict(urllib.parse.parse_qsl(query_string, keep_blank_values=True))
+
+    # Nothing to decode, so split the pairs directly
     params = {}
-    for key, value in urllib.parse.parse_qsl(query_string, keep_blank_values=True):
-        params[key] = value
+    for pair in query_string.split("&"):
+        if pair:
+            key, _, value = pair.partition("=")
+            params[key] = value
     return params
 
 
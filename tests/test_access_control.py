@@ -227,6 +227,25 @@ class TestAccessControl:
         assert controller.is_model_enabled("res.users") is True
         assert controller.is_model_enabled("account.move") is False
 
+    @patch("urllib.request.urlopen")
+    def test_enabled_model_names_cached_as_frozenset(self, mock_urlopen, controller):
+        """Test membership checks reuse a cached frozenset of model names."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(
+            {
+                "success": True,
+                "data": {"models": [{"model": "res.partner", "name": "Contact"}]},
+            }
+        ).encode("utf-8")
+        mock_urlopen.return_value.__enter__.return_value = mock_response
+
+        assert controller.is_model_enabled("res.partner") is True
+        assert controller.filter_enabled_models(["res.partner", "res.users"]) == ["res.partner"]
+
+        names = controller._get_from_cache("enabled_model_names")
+        assert names == frozenset({"res.partner"})
+        mock_urlopen.assert_called_once()
+
     @patch("urllib.request.urlopen")
     def test_get_model_permissions(self, mock_urlopen, controller):
         """Test getting model permissions."""
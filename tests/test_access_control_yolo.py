@@ -4,6 +4,7 @@ This module tests the AccessController class behavior in YOLO modes.
 """
 
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -90,6 +91,16 @@ class TestYoloModeAccessControl:
         assert controller.is_model_enabled("ir.model") is True
         assert controller.is_model_enabled("any.random.model") is True
 
+    def test_is_model_enabled_yolo_mode_makes_no_requests(self, config_yolo_read):
+        """Test YOLO membership checks never reach the network or the cache."""
+        controller = AccessController(config_yolo_read)
+
+        with patch.object(controller, "_make_request") as mock_request:
+            assert controller.is_model_enabled("res.partner") is True
+
+        mock_request.assert_not_called()
+        assert controller._cache == {}
+
     def test_get_model_permissions_read_only(self, config_yolo_read):
         """Test permissions in read-only YOLO mode."""
         controller = AccessController(config_yolo_read)
@@ -131,6 +131,8 @@ class TestBrowseResource:
         assert "Record 1" in result
         assert "Record 3" in result
         assert "Record 5" in result
+        # Field metadata is fetched once and reused for formatting
+        mock_connection.fields_get.assert_called_once_with("res.partner")
 
     @pytest.mark.asyncio
     async def test_browse_with_missing_records(
@@ -187,6 +189,14 @@ class TestBrowseResource:
 
         assert "No valid IDs provided" in str(exc_info.value)
 
+    def test_parse_ids(self, resource_handler):
+        """Test ID parsing keeps positive IDs in order on both paths."""
+        assert resource_handler._parse_ids("3, 1,2") == [3, 1, 2]
+        assert resource_handler._parse_ids("1,-2,0,4") == [1, 4]
+        assert resource_handler._parse_ids("1,,abc, 5") == [1, 5]
+        assert resource_handler._parse_ids("42") == [42]
+        assert resource_handler._parse_ids("0") == []
+
     @pytest.mark.asyncio
     async def test_browse_access_denied(self, resource_handler, mock_access_controller):
         """Test browse with access denied."""
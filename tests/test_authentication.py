@@ -212,6 +212,38 @@ class TestAuthentication:
         assert connection_api_key.database is None
         assert connection_api_key.auth_method is None
 
+    def test_reconnect_reuses_cached_authentication(self, config_password):
+        """Test a new connection sharing the performance manager skips re-authentication."""
+        first = OdooConnection(config_password)
+        first._connected = True
+        first._common_proxy = Mock()
+        first._common_proxy.authenticate.return_value = 2
+        first.authenticate("mcp")
+
+        second = OdooConnection(config_password, performance_manager=first.performance_manager)
+        second._connected = True
+        second._common_proxy = Mock()
+        second.authenticate("mcp")
+
+        second._common_proxy.authenticate.assert_not_called()
+        assert second.is_authenticated
+        assert second.uid == 2
+        assert second.auth_method == "password"
+
+    def test_access_denied_invalidates_cached_authentication(self, connection_password):
+        """Test an Access Denied fault drops the cached login."""
+        connection_password._common_proxy = Mock()
+        connection_password._common_proxy.authenticate.return_value = 2
+        connection_password.authenticate("mcp")
+        connection_password._object_proxy = Mock()
+        connection_password._object_proxy.execute_kw.side_effect = Fault(3, "Access Denied")
+
+        with pytest.raises(OdooConnectionError):
+            connection_password.search("res.partner", [])
+
+        manager = connection_password.performance_manager
+        assert manager.get_cached_auth("mcp", connection_password._auth_credentials()) is None
+
 
 class TestAuthenticateOrchestration:
     """Test authenticate() orchestration logic.
@@ -112,8 +112,7 @@ class TestOdooResourceHandler:
     ):
         """Test successful record retrieval with safe-field filtering."""
         # Setup mocks
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {
                 "id": 1,
                 "name": "Test Partner",
@@ -130,14 +129,13 @@ class TestOdooResourceHandler:
 
         # Verify access control was called
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
-        mock_connection.search.assert_called_once_with("res.partner", [("id", "=", 1)])
 
         # Verify safe-field filtering: binary/html/serialized/private fields excluded
-        read_call_args = mock_connection.read.call_args
+        read_call_args = mock_connection.search_read.call_args
         assert read_call_args is not None
-        # read should be called with (model, ids, safe_fields)
+        # search_read should be called with (model, domain, safe_fields)
         assert read_call_args[0][0] == "res.partner"
-        assert read_call_args[0][1] == [1]
+        assert read_call_args[0][1] == [("id", "=", 1)]
         safe_fields = read_call_args[0][2]
         assert isinstance(safe_fields, list)
         # Binary fields must be excluded
@@ -159,13 +157,28 @@ class TestOdooResourceHandler:
         assert "Name: Test Partner" in result
         assert "=" * 50 in result
 
+    @pytest.mark.asyncio
+    async def test_handle_record_retrieval_fetches_fields_once(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test that field metadata is fetched once and reused for formatting."""
+        mock_connection.search_read.return_value = [
+            {"id": 1, "name": "Test Partner", "country_id": (1, "United States")}
+        ]
+
+        result = await resource_handler._handle_record_retrieval("res.partner", "1")
+
+        mock_connection.fields_get.assert_called_once_with("res.partner")
+        # Relation metadata from the single fetch is still used for formatting
+        assert "odoo://res.country/record/1" in result
+
     @pytest.mark.asyncio
     async def test_handle_record_retrieval_not_found(
         self, resource_handler, mock_connection, mock_access_controller
     ):
         """Test record not found error."""
         # Setup mocks
-        mock_connection.search.return_value = []
+        mock_connection.search_read.return_value = []
 
         # Test retrieval
         with pytest.raises(NotFoundError) as exc_info:
@@ -175,7 +188,10 @@ class TestOdooResourceHandler:
 
         # Verify calls
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
-        mock_connection.search.assert_called_once_with("res.partner", [("id", "=", 999)])
+        # Existence is checked by the read itself, without a separate search
+        mock_connection.search_read.assert_called_once()
+        assert mock_connection.search_read.call_args[0][1] == [("id", "=", 999)]
+        mock_connection.search.assert_not_called()
         mock_connection.read.assert_not_called()
 
     @pytest.mark.asyncio
@@ -229,7 +245,7 @@ class TestOdooResourceHandler:
     ):
         """Test connection error during retrieval."""
         # Setup mock to raise connection error
-        mock_connection.search.side_effect = OdooConnectionError("Connection lost")
+        mock_connection.search_read.side_effect = OdooConnectionError("Connection lost")
 
         # Test retrieval
         with pytest.raises(ValidationError) as exc_info:
@@ -241,10 +257,9 @@ class TestOdooResourceHandler:
     async def test_handle_record_retrieval_read_returns_empty(
         self, resource_handler, mock_connection, mock_access_controller
     ):
-        """Test NotFoundError when search finds ID but read returns empty list."""
-        # search finds the record ID, but read returns nothing
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = []
+        """Test NotFoundError when the fallback read of all fields returns nothing."""
+        mock_connection.fields_get.side_effect = Exception("fields_get unavailable")
+        mock_connection.search_read.return_value = []
 
         with pytest.raises(NotFoundError) as exc_info:
             await resource_handler._handle_record_retrieval("res.partner", "1")
@@ -263,13 +278,12 @@ class TestOdooResourceHandler:
             "image_128": {"type": "binary", "string": "Image 128"},
             "__last_update": {"type": "datetime", "string": "Last Modified on"},
         }
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [{"id": 1, "name": "Binary Partner"}]
+        mock_connection.search_read.return_value = [{"id": 1, "name": "Binary Partner"}]
 
         result = await resource_handler._handle_record_retrieval("res.partner", "1")
 
         # Since all fields are unsafe, safe_fields is empty => fallback to no filter
-        mock_connection.read.assert_called_once_with("res.partner", [1])
+        mock_connection.search_read.assert_called_once_with("res.partner", [("id", "=", 1)])
         assert "Binary Partner" in result
 
     @pytest.mark.asyncio
@@ -277,15 +291,14 @@ class TestOdooResourceHandler:
         self, resource_handler, mock_connection, mock_access_controller
     ):
         """Test fallback to reading all fields when fields_get raises an exception."""
-        mock_connection.search.return_value = [1]
         # fields_get raises an exception, triggering the fallback path
         mock_connection.fields_get.side_effect = Exception("fields_get unavailable")
-        mock_connection.read.return_value = [{"id": 1, "name": "Fallback Partner"}]
+        mock_connection.search_read.return_value = [{"id": 1, "name": "Fallback Partner"}]
 
         result = await resource_handler._handle_record_retrieval("res.partner", "1")
 
-        # read should have been called without a field list (fallback)
-        mock_connection.read.assert_called_once_with("res.partner", [1])
+        # search_read should have been called without a field list (fallback)
+        mock_connection.search_read.assert_called_once_with("res.partner", [("id", "=", 1)])
 
         # Result should still contain the record data
         assert "res.partner" in result
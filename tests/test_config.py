@@ -2,6 +2,8 @@
 
 import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -234,6 +236,38 @@ class TestConfigSingleton:
         config2 = get_config()
         assert config is config2
 
+    def test_get_config_loads_once_under_concurrency(self, monkeypatch):
+        """Test that concurrent first calls share a single loaded configuration."""
+        reset_config()
+
+        monkeypatch.setenv("ODOO_URL", "http://singleton.odoo.com")
+        monkeypatch.setenv("ODOO_API_KEY", "singleton-key")
+
+        load_calls = []
+        barrier = threading.Barrier(8)
+
+        def slow_load_config():
+            load_calls.append(1)
+            time.sleep(0.01)
+            return load_config()
+
+        monkeypatch.setattr("mcp_server_odoo.config.load_config", slow_load_config)
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_config())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(load_calls) == 1
+        assert all(config is results[0] for config in results)
+
     def test_set_config(self):
         """Test setting a custom configuration."""
         reset_config()  # Ensure clean state
@@ -400,3 +434,29 @@ class TestYoloMode:
             monkeypatch.setenv("ODOO_YOLO", value)
             config = load_config()
             assert config.yolo_mode == "true"
+
+    def test_json_rpc_requires_yolo_mode(self):
+        """Test JSON-RPC can only be enabled together with YOLO mode."""
+        with pytest.raises(ValueError, match="ODOO_MCP_JSON_RPC requires YOLO mode"):
+            OdooConfig(url="http://localhost:8069", api_key="test-key", json_rpc=True)
+
+        config = OdooConfig(
+            url="http://localhost:8069",
+            username="admin",
+            password="admin",
+            yolo_mode="read",
+            json_rpc=True,
+        )
+        assert config.json_rpc is True
+
+    def test_json_rpc_from_env(self, monkeypatch):
+        """Test loading the JSON-RPC flag from environment variables."""
+        monkeypatch.setenv("ODOO_URL", "http://localhost:8069")
+        monkeypatch.setenv("ODOO_USER", "admin")
+        monkeypatch.setenv("ODOO_PASSWORD", "admin")
+        monkeypatch.setenv("ODOO_YOLO", "read")
+
+        assert load_config().json_rpc is False
+
+        monkeypatch.setenv("ODOO_MCP_JSON_RPC", "true")
+        assert load_config().json_rpc is True
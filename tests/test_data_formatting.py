@@ -88,6 +88,20 @@ class TestRecordFormatter:
         assert "float_field: 3.1416" in result  # Float with specified precision
         assert "monetary_field: 9,999.99" in result  # Monetary formatting
 
+    def test_format_float_digits_from_xmlrpc(self, formatter):
+        """Test that float precision is honoured when digits arrive as a list."""
+        record = {"id": 3, "name": "Test", "qty": 2.5, "rate": 1234.56789}
+
+        fields_metadata = {
+            "qty": {"type": "float", "digits": [16, 3]},
+            "rate": {"type": "float", "digits": [16, 3]},
+        }
+
+        result = formatter.format_record(record, fields_metadata)
+
+        assert "qty: 2.500" in result
+        assert "rate: 1,234.568" in result
+
     def test_format_many2one_field(self, formatter):
         """Test formatting of many2one fields."""
         record = {
@@ -108,6 +122,20 @@ class TestRecordFormatter:
         assert "partner_id: Parent Company (odoo://res.partner/record/10)" in result
         assert "country_id: Not set" in result
 
+    def test_format_many2one_bare_id(self, formatter):
+        """Test many2one values read without display names (bare integer IDs)."""
+        record = {"id": 4, "name": "Test", "partner_id": 10, "country_id": [3, "Belgium"]}
+
+        fields_metadata = {
+            "partner_id": {"type": "many2one", "relation": "res.partner"},
+            "country_id": {"type": "many2one", "relation": "res.country"},
+        }
+
+        result = formatter.format_record(record, fields_metadata)
+
+        assert "partner_id: ID 10 (odoo://res.partner/record/10)" in result
+        assert "country_id: Belgium (odoo://res.country/record/3)" in result
+
     def test_format_one2many_field(self, formatter):
         """Test formatting of one2many fields."""
         record = {"id": 5, "name": "Parent", "child_ids": [1, 2, 3, 4, 5]}
@@ -138,6 +166,20 @@ class TestRecordFormatter:
         assert "tag_ids: 3 record(s)" in result
         assert "odoo://res.partner.category/search?domain" in result
 
+    def test_format_empty_x2many_field(self, formatter):
+        """Test that empty one2many/many2many fields render as 'No records'."""
+        record = {"id": 9, "name": "Test", "child_ids": [], "tag_ids": []}
+
+        fields_metadata = {
+            "child_ids": {"type": "one2many", "relation": "res.partner"},
+            "tag_ids": {"type": "many2many", "relation": "res.partner.category"},
+        }
+
+        result = formatter.format_record(record, fields_metadata)
+
+        assert "child_ids: No records" in result
+        assert "tag_ids: No records" in result
+
     def test_format_binary_field(self, formatter):
         """Test formatting of binary fields."""
         record = {"id": 7, "name": "Test", "image": b"fake_binary_data"}
@@ -148,6 +190,17 @@ class TestRecordFormatter:
 
         assert "[Binary data - use res.partner/image to retrieve]" in result
 
+    def test_format_value_dispatch_fallbacks(self, formatter):
+        """Test image fields use the binary formatter and unknown types use str()."""
+        record = {"id": 7, "name": "Test", "avatar": b"data", "reference": "sale.order,5"}
+
+        fields_metadata = {"avatar": {"type": "image"}, "reference": {"type": "reference"}}
+
+        result = formatter.format_record(record, fields_metadata)
+
+        assert "[Binary data - use res.partner/avatar to retrieve]" in result
+        assert "reference: sale.order,5" in result
+
     def test_omit_internal_fields(self, formatter):
         """Test that internal fields are omitted."""
         record = {
@@ -168,6 +221,35 @@ class TestRecordFormatter:
         assert "_prefetch_field" not in result
         assert "email: test@example.com" in result
 
+    def test_format_records_matches_format_record(self, formatter):
+        """Test that batch formatting gives the same output as per-record formatting."""
+        records = [
+            {"id": 1, "name": "A", "email": "a@example.com", "parent_id": (9, "Parent")},
+            {"id": 2, "name": "B", "email": False, "parent_id": False},
+            {"id": 3, "name": "C", "phone": "123"},
+        ]
+        fields_metadata = {
+            "email": {"type": "char"},
+            "phone": {"type": "char"},
+            "parent_id": {"type": "many2one", "relation": "res.partner"},
+        }
+
+        result = formatter.format_records(records, fields_metadata)
+
+        assert result == [formatter.format_record(r, fields_metadata) for r in records]
+        assert "parent_id: Parent (odoo://res.partner/record/9)" in result[0]
+        assert "email: Not set" in result[1]
+        assert "phone: 123" in result[2]
+
+    def test_format_records_empty(self, formatter):
+        """Test batch formatting of an empty list."""
+        assert formatter.format_records([]) == []
+
+    def test_formatters_use_slots(self, formatter):
+        """Test that formatter instances carry no per-instance __dict__."""
+        assert not hasattr(formatter, "__dict__")
+        assert not hasattr(DatasetFormatter("res.partner"), "__dict__")
+
     def test_format_list(self, formatter):
         """Test formatting a list of records."""
         records = [
@@ -318,6 +400,12 @@ class TestDatasetFormatter:
 
         assert "| is_company = True & customer_rank > 0 active = True" in result
 
+    def test_format_domain_skips_malformed_conditions(self, formatter):
+        """Test that list conditions of the wrong length are skipped."""
+        domain = ["!", ["active", "="], ["name", "ilike", "a"]]
+
+        assert formatter._format_domain(domain) == "! name ilike a"
+
     def test_format_search_with_selected_fields(self, formatter):
         """Test formatting with specific fields shown inline."""
         records = [
@@ -46,7 +46,7 @@ class TestErrorSanitizationIntegration:
         not in the tool layer. This test verifies the tool's error wrapping.
         """
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.side_effect = OdooConnectionError(
+        tool_handler.connection.search_and_count.side_effect = OdooConnectionError(
             "Operation failed: Invalid field 'bogus_field' in search criteria"
         )
 
@@ -93,7 +93,7 @@ class TestErrorSanitizationIntegration:
     async def test_tool_generic_error_sanitization(self, tool_handler):
         """Test that generic errors are sanitized."""
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search.side_effect = Exception(
+        tool_handler.connection.search_and_count.side_effect = Exception(
             "Traceback (most recent call last):\n"
             '  File "/opt/odoo/models.py", line 123, in execute\n'
             "    raise ValueError('Test error')\n"
@@ -113,7 +113,7 @@ class TestErrorSanitizationIntegration:
     async def test_resource_error_sanitization(self, resource_handler):
         """Test that resource errors are sanitized."""
         resource_handler.connection.is_authenticated = True
-        resource_handler.connection.search.return_value = []
+        resource_handler.connection.search_read.return_value = []
 
         from mcp_server_odoo.error_handling import NotFoundError
 
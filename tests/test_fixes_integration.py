@@ -103,8 +103,7 @@ class TestFixesIntegration:
         assert record_result.record["create_date"] == "2025-06-06T13:50:23+00:00"
 
         # Test 3: search_records with datetime formatting
-        tool_handler.connection.search_count.return_value = 2
-        tool_handler.connection.search.return_value = [1, 2]
+        tool_handler.connection.search_and_count.return_value = ([1, 2], 2)
         tool_handler.connection.read.return_value = [
             {
                 "id": 1,
@@ -12,6 +12,7 @@ import pytest
 
 from mcp_server_odoo.config import OdooConfig
 from mcp_server_odoo.odoo_connection import OdooConnection, OdooConnectionError, create_connection
+from mcp_server_odoo.performance import JsonRpcProxy
 
 
 @pytest.fixture
@@ -69,6 +70,8 @@ class TestOdooConnectionInit:
         """Test initialization with custom timeout."""
         conn = OdooConnection(test_config, timeout=60)
         assert conn.timeout == 60
+        # The timeout is applied to the pooled XML-RPC transport
+        assert conn._performance_manager.connection_pool._transport.timeout == 60
 
     def test_parse_url_https(self):
         """Test URL parsing for HTTPS URLs."""
@@ -248,6 +251,23 @@ class TestOdooConnectionConnect:
             error_msg = str(exc_info.value)
             assert "Connection failed" in error_msg or "Connection test failed" in error_msg
 
+    def test_connect_uses_json_rpc_object_proxy(self):
+        """Test the object proxy talks JSON-RPC when enabled."""
+        config = OdooConfig(
+            url="http://localhost:8069",
+            username="admin",
+            password="admin",
+            yolo_mode="read",
+            json_rpc=True,
+        )
+        conn = OdooConnection(config)
+
+        with patch.object(conn, "_test_connection"):
+            conn.connect()
+
+        assert isinstance(conn._object_proxy, JsonRpcProxy)
+        assert not isinstance(conn._common_proxy, JsonRpcProxy)
+
 
 class TestOdooConnectionDisconnect:
     """Test connection cleanup."""
@@ -5,8 +5,11 @@ letting all OdooConnection logic (argument building, caching,
 performance tracking, error handling) run for real.
 """
 
+import sys
+import threading
 import xmlrpc.client
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -164,6 +167,56 @@ class TestCreate:
             conn.create("res.partner", {"name": "Fail"})
 
 
+class TestCreateAndRead:
+    """Test OdooConnection.create_and_read() method."""
+
+    def test_uses_web_save_in_yolo_mode_on_odoo_17(self, connected_connection):
+        """A single web_save call creates the record and returns its fields."""
+        conn = connected_connection
+        conn.config.yolo_mode = "true"
+        conn._server_version = "17.0"
+        conn._object_proxy.execute_kw.return_value = [{"id": 42, "display_name": "New"}]
+
+        record_id, record = conn.create_and_read(
+            "res.partner", {"name": "New"}, ["id", "display_name"]
+        )
+
+        assert record_id == 42
+        assert record == {"id": 42, "display_name": "New"}
+        conn._object_proxy.execute_kw.assert_called_once()
+        args = conn._object_proxy.execute_kw.call_args[0]
+        assert args[4] == "web_save"
+        assert args[5] == [[], {"name": "New"}]
+        assert args[6] == {"specification": {"id": {}, "display_name": {}}}
+
+    @pytest.mark.parametrize(
+        ("yolo_mode", "version"), [("off", "17.0"), ("true", "16.0"), ("true", None)]
+    )
+    def test_falls_back_to_create_and_read(self, connected_connection, yolo_mode, version):
+        """MCP endpoints and older servers use create followed by read."""
+        conn = connected_connection
+        conn.config.yolo_mode = yolo_mode
+        conn._server_version = version
+        conn._object_proxy.execute_kw.side_effect = [42, [{"id": 42, "display_name": "New"}]]
+
+        record_id, record = conn.create_and_read(
+            "res.partner", {"name": "New"}, ["id", "display_name"]
+        )
+
+        assert record_id == 42
+        assert record == {"id": 42, "display_name": "New"}
+        methods = [c.args[4] for c in conn._object_proxy.execute_kw.call_args_list]
+        assert methods == ["create", "read"]
+
+    def test_unreadable_record_keeps_its_id(self, connected_connection):
+        """The fallback still reports the new ID when the record cannot be read."""
+        conn = connected_connection
+        conn.config.yolo_mode = "off"
+        conn._object_proxy.execute_kw.side_effect = [42, []]
+
+        assert conn.create_and_read("res.partner", {"name": "New"}, ["id"]) == (42, None)
+
+
 class TestWrite:
     """Test OdooConnection.write() method."""
 
@@ -248,6 +301,31 @@ class TestFieldsGet:
 
         assert conn._object_proxy.execute_kw.call_count == 2
 
+    def test_fields_get_caches_empty_result(self, connected_connection):
+        """fields_get() should also reuse a cached empty definition."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = {}
+
+        conn.fields_get("x.empty")
+        conn.fields_get("x.empty")
+
+        assert conn._object_proxy.execute_kw.call_count == 1
+
+    def test_fields_get_interns_field_types(self, connected_connection):
+        """fields_get() should intern field type strings decoded from the wire."""
+        conn = connected_connection
+        # Build strings at runtime so they are not interned literals
+        field_type = "".join(["many", "2one"])
+        conn._object_proxy.execute_kw.return_value = {
+            "partner_id": {"type": field_type, "relation": "res.partner"},
+            "name": {"string": "Name"},
+        }
+
+        result = conn.fields_get("res.partner")
+
+        assert result["partner_id"]["type"] is sys.intern("many2one")
+        assert "type" not in result["name"]
+
 
 class TestSearchCount:
     """Test OdooConnection.search_count() method."""
@@ -380,3 +458,254 @@ class TestExecuteKwErrorHandling:
 
         kwargs = conn._object_proxy.execute_kw.call_args[0][6]
         assert kwargs["context"]["lang"] == "de_DE"
+
+
+class TestExecuteKwAuthPrefix:
+    """Test the cached (database, uid, password) prefix used by execute_kw."""
+
+    def test_prefix_built_once_and_reused(self, connected_connection):
+        """The auth prefix is built on first use and reused for later calls."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = []
+
+        conn.search("res.partner", [])
+        prefix = conn._auth_prefix
+        conn.search("res.partner", [])
+
+        assert prefix == ("testdb", 2, "admin")
+        assert conn._auth_prefix is prefix
+        for call in conn._object_proxy.execute_kw.call_args_list:
+            assert call[0][:3] == ("testdb", 2, "admin")
+
+    def test_prefix_cleared_on_disconnect(self, connected_connection):
+        """Disconnecting drops the cached auth prefix."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = []
+        conn.search("res.partner", [])
+
+        conn.disconnect()
+
+        assert conn._auth_prefix is None
+
+
+class TestExecuteKwBinding:
+    """Test reuse of the execute_kw method bound on the object proxy."""
+
+    def test_binding_reused_for_same_proxy(self, connected_connection):
+        """The bound method is looked up once per proxy."""
+        conn = connected_connection
+        proxy = Mock()
+        proxy.execute_kw.return_value = []
+        conn._object_proxy = proxy
+
+        conn.search("res.partner", [])
+        conn.search("res.partner", [])
+
+        assert conn._execute_kw_binding == (proxy, proxy.execute_kw)
+        assert proxy.execute_kw.call_count == 2
+
+    def test_binding_follows_replaced_proxy(self, connected_connection):
+        """Replacing the object proxy rebinds execute_kw."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = []
+        conn.search("res.partner", [])
+
+        new_proxy = Mock()
+        new_proxy.execute_kw.return_value = [5]
+        conn._object_proxy = new_proxy
+
+        assert conn.search("res.partner", []) == [5]
+
+
+class TestExecuteKwRetry:
+    """Test the single retry of idempotent calls on transient HTTP errors."""
+
+    @staticmethod
+    def _gateway_error(errcode=502):
+        return xmlrpc.client.ProtocolError("localhost/xmlrpc/2/object", errcode, "Bad Gateway", {})
+
+    def test_read_retried_once_on_gateway_error(self, connected_connection):
+        """A read hitting a 502 is retried and succeeds."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = [self._gateway_error(), [1, 2]]
+
+        assert conn.search("res.partner", []) == [1, 2]
+        assert conn._object_proxy.execute_kw.call_count == 2
+
+    def test_write_not_retried(self, connected_connection):
+        """Non-idempotent methods fail on the first gateway error."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = self._gateway_error()
+
+        with pytest.raises(OdooConnectionError):
+            conn.execute_kw("res.partner", "create", [{"name": "x"}], {})
+        assert conn._object_proxy.execute_kw.call_count == 1
+
+    def test_permanent_http_error_not_retried(self, connected_connection):
+        """Non-transient statuses are not retried."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = self._gateway_error(404)
+
+        with pytest.raises(OdooConnectionError):
+            conn.search("res.partner", [])
+        assert conn._object_proxy.execute_kw.call_count == 1
+
+
+class TestExecuteParallel:
+    """Test concurrent execution of independent calls."""
+
+    def test_results_returned_in_call_order(self, connected_connection):
+        """Results line up with the submitted calls."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = lambda db, uid, pw, model, method, a, kw: model
+
+        results = conn.execute_parallel(
+            [
+                ("res.partner", "search_count", [[]], {}),
+                ("product.product", "search_count", [[]], {}),
+                ("res.users", "search_count", [[]], {}),
+            ]
+        )
+
+        assert results == ["res.partner", "product.product", "res.users"]
+
+    def test_error_propagates(self, connected_connection):
+        """A failing call raises OdooConnectionError."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = xmlrpc.client.Fault(1, "boom")
+
+        with pytest.raises(OdooConnectionError):
+            conn.execute_parallel(
+                [("res.partner", "read", [[1]], {}), ("res.users", "read", [[1]], {})]
+            )
+
+    def test_executor_shut_down_on_disconnect(self, connected_connection):
+        """Disconnecting releases the worker threads."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = 0
+        conn.execute_parallel([("res.partner", "search_count", [[]], {})] * 2)
+        executor = conn._executor
+        assert executor is not None
+
+        conn.disconnect()
+
+        assert conn._executor is None
+        assert executor._shutdown
+
+    def test_concurrent_calls_share_one_executor(self, connected_connection):
+        """Handler threads calling at the same time create a single pool."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.return_value = 0
+        barrier = threading.Barrier(4)
+
+        def call():
+            barrier.wait()
+            conn.execute_parallel([("res.partner", "search_count", [[]], {})] * 2)
+
+        with patch(
+            "mcp_server_odoo.odoo_connection.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor_cls:
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        executor_cls.assert_called_once()
+        conn.disconnect()
+
+    def test_large_read_concurrent_with_disconnect(self, connected_connection):
+        """A read racing disconnect fails with OdooConnectionError, not RuntimeError."""
+        conn = connected_connection
+        started = threading.Event()
+        release = threading.Event()
+
+        def execute_kw(db, uid, pw, model, method, args, kwargs):
+            started.set()
+            release.wait(5)
+            return [{"id": record_id} for record_id in args[0]]
+
+        conn._object_proxy.execute_kw.side_effect = execute_kw
+        ids = list(range(1, conn.READ_CHUNK_SIZE * 2 + 2))
+        outcome = []
+
+        def read():
+            try:
+                outcome.append(conn.read("res.partner", ids, ["name"]))
+            except Exception as e:
+                outcome.append(e)
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        assert started.wait(5)
+        conn.disconnect()
+        release.set()
+        thread.join(5)
+
+        assert len(outcome) == 1
+        assert isinstance(outcome[0], (list, OdooConnectionError))
+
+        # The executor is gone; a new parallel call must not resurrect it
+        conn._authenticated = True
+        with pytest.raises(OdooConnectionError, match="Not connected"):
+            conn.execute_parallel([("res.partner", "read", [[1]], {})] * 2)
+        assert conn._executor is None
+
+    def test_sockets_closed_on_disconnect(self, connected_connection):
+        """Disconnecting closes the pool's keep-alive sockets."""
+        conn = connected_connection
+        transport = conn._performance_manager.connection_pool._transport
+        connection = transport.make_connection("localhost:8069")
+        connection.sock = sock = Mock()
+
+        conn.disconnect()
+
+        sock.close.assert_called_once()
+
+    def test_search_and_count(self, connected_connection):
+        """The page of IDs and the total count come back together."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = lambda db, uid, pw, model, method, a, kw: (
+            [1, 2] if method == "search" else 7
+        )
+
+        ids, total = conn.search_and_count("res.partner", [], limit=2, offset=0)
+
+        assert ids == [1, 2]
+        assert total == 7
+        methods = {c.args[4]: c.args[6] for c in conn._object_proxy.execute_kw.call_args_list}
+        assert methods == {"search": {"limit": 2, "offset": 0}, "search_count": {}}
+
+    def test_large_read_is_chunked(self, connected_connection):
+        """Reads above the chunk size are split and reassembled in order."""
+        conn = connected_connection
+        conn._object_proxy.execute_kw.side_effect = lambda db, uid, pw, model, method, a, kw: [
+            {"id": record_id} for record_id in a[0]
+        ]
+        ids = list(range(1, conn.READ_CHUNK_SIZE * 2 + 2))
+
+        records = conn.read("res.partner", ids, ["name"])
+
+        assert [r["id"] for r in records] == ids
+        assert conn._object_proxy.execute_kw.call_count == 3
+        for call in conn._object_proxy.execute_kw.call_args_list:
+            assert len(call.args[5][0]) <= conn.READ_CHUNK_SIZE
+            assert call.args[6] == {"fields": ["name"]}
+
+    def test_large_read_chunks_get_their_own_context(self, connected_connection):
+        """Each chunk carries a separate kwargs/context dict with the locale."""
+        conn = connected_connection
+        conn.config.locale = "fr_FR"
+        conn._object_proxy.execute_kw.side_effect = lambda db, uid, pw, model, method, a, kw: [
+            {"id": record_id} for record_id in a[0]
+        ]
+        ids = list(range(1, conn.READ_CHUNK_SIZE * 2 + 2))
+
+        records = conn.read("res.partner", ids, ["name"])
+
+        assert [r["id"] for r in records] == ids
+        sent = [call.args[6] for call in conn._object_proxy.execute_kw.call_args_list]
+        assert len(sent) == 3
+        assert all(kw == {"fields": ["name"], "context": {"lang": "fr_FR"}} for kw in sent)
+        assert len({id(kw) for kw in sent}) == 3
+        assert len({id(kw["context"]) for kw in sent}) == 3
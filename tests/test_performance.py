@@ -1,10 +1,15 @@
 """Tests for performance optimization module."""
 
 import asyncio
+import gzip
+import http.client
+import json
 import os
+import threading
 import time
+import xmlrpc.client
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -13,6 +18,7 @@ from mcp_server_odoo.performance import (
     Cache,
     CacheEntry,
     ConnectionPool,
+    JsonRpcProxy,
     PerformanceManager,
     PerformanceMonitor,
     RequestOptimizer,
@@ -234,6 +240,97 @@ class TestConnectionPool:
         assert stats["connections_created"] == 1
         assert stats["connections_reused"] == 1
 
+    @patch("mcp_server_odoo.performance.ServerProxy")
+    def test_reuse_does_not_take_lock(self, mock_proxy, mock_config):
+        """Test reusing a fresh connection skips the pool lock."""
+        pool = ConnectionPool(mock_config)
+        conn = pool.get_connection("/xmlrpc/2/object")
+
+        pool._lock = MagicMock()
+        pool._lock.__enter__.side_effect = AssertionError("lock taken on hit path")
+
+        assert pool.get_connection("/xmlrpc/2/object") is conn
+        assert pool._stats["connections_reused"] == 1
+
+    @patch("mcp_server_odoo.performance.ServerProxy")
+    def test_stale_connection_is_replaced(self, mock_proxy, mock_config):
+        """Test a connection idle for too long is recreated."""
+        pool = ConnectionPool(mock_config)
+        pool.get_connection("/xmlrpc/2/object")
+        pool._connections["/xmlrpc/2/object"][1] -= pool.MAX_IDLE_SECONDS + 1
+
+        pool.get_connection("/xmlrpc/2/object")
+
+        stats = pool.get_stats()
+        assert stats["connections_created"] == 2
+        assert stats["connections_closed"] == 1
+        assert stats["active_connections"] == 1
+
+    @patch("mcp_server_odoo.performance.ServerProxy")
+    def test_wall_clock_jump_does_not_expire_connections(self, mock_proxy, mock_config):
+        """Test idle tracking uses the monotonic clock, not wall-clock time."""
+        pool = ConnectionPool(mock_config)
+        conn = pool.get_connection("/xmlrpc/2/object")
+
+        with patch("time.time", return_value=time.time() + 3600):
+            assert pool.get_connection("/xmlrpc/2/object") is conn
+        assert pool._stats["connections_created"] == 1
+
+    def test_transport_accepts_gzip_without_compressing_requests(self, mock_config):
+        """Test gzip responses are accepted but request bodies are sent as-is."""
+        pool = ConnectionPool(mock_config)
+
+        assert pool._transport.accept_gzip_encoding is True
+        assert pool._transport.encode_threshold is None
+
+    def test_transport_connection_is_per_thread(self, mock_config):
+        """Test each thread gets its own keep-alive HTTP connection."""
+        pool = ConnectionPool(mock_config)
+        transport = pool._transport
+        main_conn = transport.make_connection("localhost:8069")
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(transport.make_connection("localhost:8069"))
+        )
+        thread.start()
+        thread.join()
+
+        assert transport.make_connection("localhost:8069") is main_conn
+        assert other[0] is not main_conn
+
+    def test_transport_close_all_closes_every_thread(self, mock_config):
+        """Test close_all() closes the keep-alive connection of each thread."""
+        pool = ConnectionPool(mock_config)
+        transport = pool._transport
+        connections = [transport.make_connection("localhost:8069")]
+        thread = threading.Thread(
+            target=lambda: connections.append(transport.make_connection("localhost:8069"))
+        )
+        thread.start()
+        thread.join()
+        sockets = []
+        for connection in connections:
+            connection.sock = Mock()
+            sockets.append(connection.sock)
+
+        transport.close_all()
+
+        assert all(connection.sock is None for connection in connections)
+        for sock in sockets:
+            sock.close.assert_called_once()
+
+    def test_transport_reopened_connection_is_tracked(self, mock_config):
+        """Test a connection reused after close_all() is closed again next time."""
+        transport = ConnectionPool(mock_config)._transport
+        transport.make_connection("localhost:8069")
+        transport.close_all()
+
+        connection = transport.make_connection("localhost:8069")
+        connection.sock = sock = Mock()
+        transport.close_all()
+
+        sock.close.assert_called_once()
+
     @patch("mcp_server_odoo.performance.ServerProxy")
     def test_connection_pool_max_limit(self, mock_proxy, mock_config):
         """Test connection pool respects max connections."""
@@ -253,6 +350,33 @@ class TestConnectionPool:
         assert stats["active_connections"] == 2
         assert stats["connections_closed"] == 1
 
+    @patch("mcp_server_odoo.performance.ServerProxy")
+    def test_connection_pool_evicts_least_recently_used(self, mock_proxy, mock_config):
+        """Test the pool evicts the least recently used endpoint when full."""
+        pool = ConnectionPool(mock_config, max_connections=2)
+        pool.get_connection("/endpoint1")
+        pool.get_connection("/endpoint2")
+
+        # Touch endpoint1 so endpoint2 becomes the least recently used
+        pool.get_connection("/endpoint1")
+        pool.get_connection("/endpoint3")
+
+        assert list(pool._connections) == ["/endpoint1", "/endpoint3"]
+
+    @patch("mcp_server_odoo.performance.ServerProxy")
+    def test_cleanup_stops_at_first_fresh_connection(self, mock_proxy, mock_config):
+        """Test the stale sweep only removes idle entries at the LRU end."""
+        pool = ConnectionPool(mock_config)
+        for endpoint in ("/endpoint1", "/endpoint2", "/endpoint3"):
+            pool.get_connection(endpoint)
+        for endpoint in ("/endpoint1", "/endpoint2"):
+            pool._connections[endpoint][1] -= pool.MAX_IDLE_SECONDS + 1
+
+        pool._cleanup_stale_connections()
+
+        assert list(pool._connections) == ["/endpoint3"]
+        assert pool.get_stats()["connections_closed"] == 2
+
     @patch("mcp_server_odoo.performance.ServerProxy")
     def test_connection_pool_set_database(self, mock_proxy, mock_config):
         """Test set_database clears pool and sets transport database."""
@@ -285,6 +409,38 @@ class TestConnectionPool:
         # Verify that putheader was called with the database header
         mock_connection.putheader.assert_called_with("X-Odoo-Database", "mydb")
 
+    def test_transport_reuses_connection_with_timeout(self, mock_config):
+        """Test transports keep one HTTP connection per host with the configured timeout."""
+        from mcp_server_odoo.performance import OdooSafeTransport, OdooTransport
+
+        for transport_cls in (OdooTransport, OdooSafeTransport):
+            transport = transport_cls(timeout=7)
+
+            first = transport.make_connection("localhost:8069")
+            second = transport.make_connection("localhost:8069")
+
+            assert first is second
+            assert first.timeout == 7
+
+    def test_transport_sends_keep_alive_header(self, mock_config):
+        """Test transports ask the server to keep the connection open."""
+        from mcp_server_odoo.performance import OdooTransport
+
+        transport = OdooTransport()
+        mock_connection = Mock()
+
+        transport.send_headers(mock_connection, [])
+
+        mock_connection.putheader.assert_any_call("Connection", "keep-alive")
+
+    def test_connection_pool_timeout(self, mock_config):
+        """Test the pool applies its timeout to the shared transport."""
+        pool = ConnectionPool(mock_config, timeout=12)
+        assert pool._transport.timeout == 12
+
+        pool.set_timeout(3)
+        assert pool._transport.timeout == 3
+
     def test_connection_pool_clear(self, mock_config):
         """Test clearing connection pool."""
         pool = ConnectionPool(mock_config)
@@ -294,12 +450,104 @@ class TestConnectionPool:
             pool.get_connection("/endpoint1")
             pool.get_connection("/endpoint2")
 
+        connection = pool._transport.make_connection("localhost:8069")
+        connection.sock = sock = Mock()
+
         # Clear pool
         pool.clear()
 
         stats = pool.get_stats()
         assert stats["active_connections"] == 0
         assert stats["connections_closed"] == 2
+        sock.close.assert_called_once()
+
+
+class TestJsonRpcProxy:
+    """Test the JSON-RPC object proxy."""
+
+    @staticmethod
+    def _transport(*payloads, status=200):
+        """Build a transport whose connection answers with the given payloads."""
+        connection = MagicMock()
+        responses = []
+        for payload in payloads:
+            response = MagicMock(status=status, reason="OK")
+            response.read.return_value = json.dumps(payload).encode("utf-8")
+            responses.append(response)
+        connection.getresponse.side_effect = responses
+        transport = MagicMock()
+        transport.make_connection.return_value = connection
+        return transport, connection
+
+    def test_execute_kw_posts_json_rpc_call(self):
+        """Test calls are sent as JSON-RPC and the result is returned."""
+        transport, connection = self._transport({"jsonrpc": "2.0", "id": 1, "result": [1, 2]})
+        proxy = JsonRpcProxy("http://localhost:8069", "object", transport)
+
+        result = proxy.execute_kw("db", 2, "pw", "res.partner", "search", [[]], {})
+
+        assert result == [1, 2]
+        transport.make_connection.assert_called_once_with("localhost:8069")
+        connection.putrequest.assert_called_once_with("POST", "/jsonrpc", skip_accept_encoding=True)
+        connection.putheader.assert_any_call("Accept-Encoding", "gzip")
+        body = json.loads(connection.endheaders.call_args[0][0])
+        assert body["params"] == {
+            "service": "object",
+            "method": "execute_kw",
+            "args": ["db", 2, "pw", "res.partner", "search", [[]], {}],
+        }
+        transport.send_headers.assert_called_once_with(connection, [])
+
+    def test_gzip_response_decoded(self):
+        """Test gzip-encoded responses are decompressed."""
+        transport, connection = self._transport({})
+        response = MagicMock(status=200, reason="OK")
+        response.read.return_value = gzip.compress(json.dumps({"result": [3]}).encode("utf-8"))
+        response.getheader.return_value = "gzip"
+        connection.getresponse.side_effect = [response]
+        proxy = JsonRpcProxy("http://localhost:8069", "object", transport)
+
+        assert proxy.execute_kw("db", 2, "pw", "res.partner", "search", [[]], {}) == [3]
+
+    def test_error_raised_as_fault(self):
+        """Test Odoo errors are raised as XML-RPC faults."""
+        transport, _ = self._transport(
+            {
+                "error": {
+                    "code": 200,
+                    "message": "Odoo Server Error",
+                    "data": {"name": "odoo.exceptions.AccessDenied", "message": "Access Denied"},
+                }
+            }
+        )
+        proxy = JsonRpcProxy("http://localhost:8069", "object", transport)
+
+        with pytest.raises(xmlrpc.client.Fault) as exc_info:
+            proxy.execute_kw("db", 2, "pw", "res.partner", "read", [[1]], {})
+
+        assert exc_info.value.faultString == "odoo.exceptions.AccessDenied: Access Denied"
+
+    def test_http_error_raised_as_protocol_error(self):
+        """Test non-200 responses raise ProtocolError and drop the connection."""
+        transport, _ = self._transport({}, status=502)
+        proxy = JsonRpcProxy("http://localhost:8069", "object", transport)
+
+        with pytest.raises(xmlrpc.client.ProtocolError):
+            proxy.execute_kw("db", 2, "pw", "res.partner", "read", [[1]], {})
+        transport.close.assert_called_once()
+
+    def test_retries_once_on_dropped_keep_alive(self):
+        """Test a connection closed by the server is retried on a fresh one."""
+        transport, connection = self._transport({"result": 7})
+        connection.getresponse.side_effect = [
+            http.client.RemoteDisconnected("closed"),
+            *connection.getresponse.side_effect,
+        ]
+        proxy = JsonRpcProxy("http://localhost:8069", "object", transport)
+
+        assert proxy.execute_kw("db", 2, "pw", "res.partner", "search_count", [[]], {}) == 7
+        transport.close.assert_called_once()
+        assert transport.make_connection.call_count == 2
 
 
 class TestRequestOptimizer:
@@ -497,6 +745,29 @@ class TestPerformanceManager:
         cached = manager.get_cached_fields("res.partner")
         assert cached == fields
 
+    def test_invalidate_fields_cache(self, mock_config):
+        """Test invalidating cached field definitions for one model."""
+        manager = PerformanceManager(mock_config)
+        manager.cache_fields("res.partner", {"name": {"type": "char"}})
+        manager.cache_fields("res.users", {"login": {"type": "char"}})
+
+        manager.invalidate_fields_cache("res.partner")
+
+        assert manager.get_cached_fields("res.partner") is None
+        assert manager.get_cached_fields("res.users") == {"login": {"type": "char"}}
+
+    def test_field_cache_scoped_by_database(self, mock_config):
+        """Test field definitions are not shared between databases."""
+        manager = PerformanceManager(mock_config)
+        manager.set_database("db_one")
+        manager.cache_fields("res.partner", {"name": {"type": "char"}})
+
+        manager.set_database("db_two")
+        assert manager.get_cached_fields("res.partner") is None
+
+        manager.set_database("db_one")
+        assert manager.get_cached_fields("res.partner") == {"name": {"type": "char"}}
+
     def test_record_caching(self, mock_config):
         """Test record caching."""
         manager = PerformanceManager(mock_config)
@@ -62,8 +62,7 @@ class TestResourceQueryParameterHandling:
         """Test search resource with only limit parameter (issue #4 case)."""
         # Setup mocks
         mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = [1, 2]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Record 1"},
             {"id": 2, "name": "Record 2"},
         ]
@@ -73,8 +72,8 @@ class TestResourceQueryParameterHandling:
         result = await resource_handler._handle_search("res.partner", None, None, 2, None, None)
 
         # Verify the search was called with correct limit
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=2, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=2, offset=0, order=None
         )
 
         # Verify result contains the records
@@ -91,8 +90,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 3
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Company A"},
             {"id": 2, "name": "Company B"},
             {"id": 3, "name": "Company C"},
@@ -105,9 +103,8 @@ class TestResourceQueryParameterHandling:
         )
 
         # Verify domain was parsed and used
-        mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, None, limit=10, offset=0, order=None
         )
 
         assert "Company A" in result
@@ -120,8 +117,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Test Partner", "email": "test@example.com"}
         ]
         mock_connection.fields_get.return_value = {}
@@ -132,7 +128,9 @@ class TestResourceQueryParameterHandling:
         )
 
         # Verify fields were parsed and used
-        mock_connection.read.assert_called_once_with("res.partner", [1], ["name", "email"])
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ["name", "email"], limit=10, offset=0, order=None
+        )
 
         assert "Fields: name, email" in result
         assert "Test Partner" in result
@@ -143,8 +141,7 @@ class TestResourceQueryParameterHandling:
         """Test search resource with limit and offset parameters."""
         # Setup mocks
         mock_connection.search_count.return_value = 100
-        mock_connection.search.return_value = [21, 22, 23, 24, 25]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Record {i}"} for i in range(21, 26)
         ]
         mock_connection.fields_get.return_value = {}
@@ -153,8 +150,8 @@ class TestResourceQueryParameterHandling:
         result = await resource_handler._handle_search("res.partner", None, None, 5, 20, None)
 
         # Verify pagination
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=5, offset=20, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=5, offset=20, order=None
         )
 
         assert "Page 5 of 20" in result  # offset 20, limit 5 = page 5
@@ -170,8 +167,7 @@ class TestResourceQueryParameterHandling:
 
         # Setup mocks
         mock_connection.search_count.return_value = 50
-        mock_connection.search.return_value = [1, 2, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Active Record {i}"} for i in range(1, 4)
         ]
         mock_connection.fields_get.return_value = {}
@@ -183,8 +179,8 @@ class TestResourceQueryParameterHandling:
 
         # Verify both domain and limit were used
         mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=3, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, None, limit=3, offset=0, order=None
         )
 
         assert "active = True" in result
@@ -90,8 +90,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3, 4, 5]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Partner 1", "email": "p1@example.com"},
             {"id": 2, "name": "Partner 2", "email": "p2@example.com"},
             {"id": 3, "name": "Partner 3", "email": "p3@example.com"},
@@ -108,11 +107,13 @@ class TestSearchResource:
 
         # Verify calls
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
-        mock_connection.search_count.assert_called_once_with("res.partner", [])
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=10, offset=0, order=None
         )
-        mock_connection.read.assert_called_once_with("res.partner", [1, 2, 3, 4, 5], None)
+        # A short first page already gives the total, so no count is requested
+        mock_connection.search_count.assert_not_called()
+        mock_connection.search.assert_not_called()
+        mock_connection.read.assert_not_called()
 
         # Check result format
         assert "Search Results: res.partner" in result
@@ -132,8 +133,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 2
-        mock_connection.search.return_value = [1, 3]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Company A", "is_company": True},
             {"id": 3, "name": "Company B", "is_company": True},
         ]
@@ -145,9 +145,8 @@ class TestSearchResource:
         )
 
         # Verify domain was parsed and used
-        mock_connection.search_count.assert_called_once_with("res.partner", domain)
-        mock_connection.search.assert_called_once_with(
-            "res.partner", domain, limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, None, limit=10, offset=0, order=None
         )
 
         # Check result contains domain info
@@ -155,6 +154,26 @@ class TestSearchResource:
         assert "Company A" in result
         assert "Company B" in result
 
+    @pytest.mark.asyncio
+    async def test_search_with_unencoded_domain(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test search with a domain that was not URL-encoded."""
+        domain = [["name", "ilike", "a+b"]]
+
+        mock_access_controller.validate_model_access.return_value = None
+        mock_connection.search_count.return_value = 0
+        mock_connection.search_read.return_value = []
+        mock_connection.fields_get.return_value = {}
+
+        await resource_handler._handle_search(
+            "res.partner", json.dumps(domain), None, None, None, None
+        )
+
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", domain, None, limit=10, offset=0, order=None
+        )
+
     @pytest.mark.asyncio
     async def test_search_with_fields(
         self, resource_handler, mock_connection, mock_access_controller
@@ -165,8 +184,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": 1, "name": "Test Partner", "email": "test@example.com", "phone": "+1234567890"}
         ]
         mock_connection.fields_get.return_value = {}
@@ -177,7 +195,9 @@ class TestSearchResource:
         )
 
         # Verify fields were parsed and used
-        mock_connection.read.assert_called_once_with("res.partner", [1], ["name", "email", "phone"])
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], ["name", "email", "phone"], limit=10, offset=0, order=None
+        )
 
         # Check result shows fields
         assert "Fields: name, email, phone" in result
@@ -192,8 +212,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 50  # Total records
-        mock_connection.search.return_value = [11, 12, 13, 14, 15]  # Page 2 results
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [  # Page 3 results
             {"id": i, "name": f"Partner {i}"} for i in range(11, 16)
         ]
         mock_connection.fields_get.return_value = {}
@@ -209,8 +228,8 @@ class TestSearchResource:
         )
 
         # Verify pagination in calls
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=5, offset=10, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=5, offset=10, order=None
         )
 
         # Check pagination info in result
@@ -219,6 +238,71 @@ class TestSearchResource:
         assert "→ Next page:" in result
         assert "← Previous page:" in result
 
+    @pytest.mark.asyncio
+    async def test_search_pagination_uris_keep_fields(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test pagination URIs carry the requested fields unchanged."""
+        mock_access_controller.validate_model_access.return_value = None
+        mock_connection.search_count.return_value = 50
+        mock_connection.search_read.return_value = [
+            {"id": i, "name": f"Partner {i}", "email": ""} for i in range(11, 16)
+        ]
+        mock_connection.fields_get.return_value = {}
+
+        result = await resource_handler._handle_search(
+            "res.partner", None, "name,email", 5, 10, None
+        )
+
+        assert "fields=name%2Cemail" in result
+        assert "fields=n%2Ca" not in result
+
+    @pytest.mark.asyncio
+    async def test_search_pagination_uris_use_compact_domain(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test pagination URIs encode the domain without JSON whitespace."""
+        mock_access_controller.validate_model_access.return_value = None
+        mock_connection.search_count.return_value = 50
+        mock_connection.search_read.return_value = [
+            {"id": i, "name": f"Partner {i}"} for i in range(1, 6)
+        ]
+        mock_connection.fields_get.return_value = {}
+
+        result = await resource_handler._handle_search(
+            "res.partner", '[["is_company", "=", true]]', None, 5, 0, None
+        )
+
+        assert "domain=%5B%5B%22is_company%22%2C%22%3D%22%2Ctrue%5D%5D" in result
+
+    @pytest.mark.asyncio
+    async def test_search_count_skipped_for_short_page(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test the total comes from a short last page without a count call."""
+        mock_access_controller.validate_model_access.return_value = None
+        mock_connection.search_read.return_value = [{"id": i} for i in range(21, 24)]
+        mock_connection.fields_get.return_value = {}
+
+        result = await resource_handler._handle_search("res.partner", None, None, 10, 20, None)
+
+        mock_connection.search_count.assert_not_called()
+        assert "Showing records 21-23 of 23" in result
+
+    @pytest.mark.asyncio
+    async def test_search_count_used_for_empty_page_past_start(
+        self, resource_handler, mock_connection, mock_access_controller
+    ):
+        """Test an empty page after the first still asks for the real total."""
+        mock_access_controller.validate_model_access.return_value = None
+        mock_connection.search_count.return_value = 5
+        mock_connection.search_read.return_value = []
+        mock_connection.fields_get.return_value = {}
+
+        await resource_handler._handle_search("res.partner", None, None, 10, 20, None)
+
+        mock_connection.search_count.assert_called_once_with("res.partner", [])
+
     @pytest.mark.asyncio
     async def test_search_with_order(
         self, resource_handler, mock_connection, mock_access_controller
@@ -229,8 +313,7 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 3
-        mock_connection.search.return_value = [3, 1, 2]  # Ordered IDs
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [  # Ordered records
             {"id": 3, "name": "Zebra Corp"},
             {"id": 1, "name": "Alpha Inc"},
             {"id": 2, "name": "Beta LLC"},
@@ -241,8 +324,8 @@ class TestSearchResource:
         result = await resource_handler._handle_search("res.partner", None, None, None, None, order)
 
         # Verify order was used
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order="name desc, id asc"
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=10, offset=0, order="name desc, id asc"
         )
 
         # Results should show in order
@@ -256,13 +339,14 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 0
-        mock_connection.search.return_value = []
+        mock_connection.search_read.return_value = []
         mock_connection.fields_get.return_value = {}
 
         # Execute search
         result = await resource_handler._handle_search("res.partner", None, None, None, None, None)
 
-        # Should not call read for empty results
+        # A single search_read round trip, no separate read
+        mock_connection.search_read.assert_called_once()
         mock_connection.read.assert_not_called()
 
         # Check result message
@@ -290,6 +374,8 @@ class TestSearchResource:
         """Test search with connection error."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
+        # A full page needs the total, so the failing count call is reached
+        mock_connection.search_read.return_value = [{"id": i} for i in range(1, 11)]
         mock_connection.search_count.side_effect = OdooConnectionError("Connection lost")
 
         # Execute search and expect error
@@ -306,19 +392,20 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = list(range(1, 11))
-        mock_connection.read.return_value = [{"id": i} for i in range(1, 11)]
+        mock_connection.search_read.return_value = [{"id": i} for i in range(1, 11)]
         mock_connection.fields_get.return_value = {}
 
         # Test with negative limit (should use default)
         await resource_handler._handle_search("res.partner", None, None, -5, None, None)
-        mock_connection.search.assert_called_with("res.partner", [], limit=10, offset=0, order=None)
+        mock_connection.search_read.assert_called_with(
+            "res.partner", [], None, limit=10, offset=0, order=None
+        )
 
         # Test with limit over max (should cap at max)
-        mock_connection.search.reset_mock()
+        mock_connection.search_read.reset_mock()
         await resource_handler._handle_search("res.partner", None, None, 200, None, None)
-        mock_connection.search.assert_called_with(
-            "res.partner", [], limit=100, offset=0, order=None
+        mock_connection.search_read.assert_called_with(
+            "res.partner", [], None, limit=100, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -332,17 +419,15 @@ class TestSearchResource:
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3, 4, 5]
-        mock_connection.read.return_value = [{"id": i} for i in range(1, 6)]
+        mock_connection.search_read.return_value = [{"id": i} for i in range(1, 6)]
         mock_connection.fields_get.return_value = {}
 
         # Should handle gracefully and use empty domain
         await resource_handler._handle_search("res.partner", invalid_domain, None, None, None, None)
 
         # Should use empty domain
-        mock_connection.search_count.assert_called_once_with("res.partner", [])
-        mock_connection.search.assert_called_once_with(
-            "res.partner", [], limit=10, offset=0, order=None
+        mock_connection.search_read.assert_called_once_with(
+            "res.partner", [], None, limit=10, offset=0, order=None
         )
 
     @pytest.mark.asyncio
@@ -353,8 +438,7 @@ class TestSearchResource:
         # Setup mocks for large dataset
         mock_access_controller.validate_model_access.return_value = None
         mock_connection.search_count.return_value = 500  # Large dataset
-        mock_connection.search.return_value = list(range(1, 11))
-        mock_connection.read.return_value = [
+        mock_connection.search_read.return_value = [
             {"id": i, "name": f"Partner {i}"} for i in range(1, 11)
         ]
         mock_connection.fields_get.return_value = {}
@@ -429,18 +513,18 @@ class TestSearchResourceIntegration:
 
 
 class TestSearchReadFailure:
-    """Test search resource when read fails after search succeeds."""
+    """Test search resource when reading the page fails after counting succeeds."""
 
     @pytest.mark.asyncio
     async def test_search_read_failure_after_search_success(
         self, resource_handler, mock_connection, mock_access_controller
     ):
-        """Test that OdooConnectionError during read is wrapped as ValidationError."""
+        """Test that OdooConnectionError during search_read is wrapped as ValidationError."""
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 3
-        mock_connection.search.return_value = [1, 2, 3]
-        # read raises OdooConnectionError after search succeeded
-        mock_connection.read.side_effect = OdooConnectionError("Connection reset during read")
+        # search_read raises OdooConnectionError before any count is made
+        mock_connection.search_read.side_effect = OdooConnectionError(
+            "Connection reset during read"
+        )
 
         with pytest.raises(ValidationError) as exc_info:
             await resource_handler._handle_search("res.partner", None, None, None, None, None)
@@ -28,8 +28,7 @@ class TestSearchSmartDefaults:
         """Test that search_records uses smart defaults when fields is None."""
         # Setup mocks
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.return_value = 2
-        tool_handler.connection.search.return_value = [1, 2]
+        tool_handler.connection.search_and_count.return_value = ([1, 2], 2)
 
         # Mock fields_get to return field metadata
         tool_handler.connection.fields_get.return_value = {
@@ -86,8 +85,7 @@ class TestSearchSmartDefaults:
         """Test that search_records uses specified fields when provided."""
         # Setup mocks
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
+        tool_handler.connection.search_and_count.return_value = ([1], 1)
         tool_handler.connection.read.return_value = [
             {"id": 1, "name": "Test", "phone": "+1234567890"}
         ]
@@ -105,8 +103,7 @@ class TestSearchSmartDefaults:
         """Test that search_records can fetch all fields when explicitly requested."""
         # Setup mocks
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
+        tool_handler.connection.search_and_count.return_value = ([1], 1)
         tool_handler.connection.read.return_value = [
             {
                 "id": 1,
@@ -132,8 +129,7 @@ class TestSearchSmartDefaults:
     async def test_search_falls_back_when_fields_get_fails(self, tool_handler):
         """Smart defaults should fall back to all fields when fields_get fails."""
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
+        tool_handler.connection.search_and_count.return_value = ([1], 1)
         tool_handler.connection.fields_get.side_effect = Exception("Cannot get fields")
         tool_handler.connection.read.return_value = [{"id": 1, "name": "Test"}]
 
@@ -148,8 +144,7 @@ class TestSearchSmartDefaults:
         """Test that datetime fields are formatted even with smart defaults."""
         # Setup mocks
         tool_handler.connection.is_authenticated = True
-        tool_handler.connection.search_count.return_value = 1
-        tool_handler.connection.search.return_value = [1]
+        tool_handler.connection.search_and_count.return_value = ([1], 1)
 
         # Mock fields_get — use date_order (a business datetime field that smart
         # selection includes) instead of create_date (which is in the exclude list
@@ -135,6 +135,19 @@ class TestServerFoundation:
         assert server.access_controller is None
         assert server.resource_handler is None
 
+    def test_reconnect_reuses_performance_manager(self, server_with_mock_connection):
+        """Test the performance manager (and its field cache) survives a reconnect."""
+        server = server_with_mock_connection
+
+        server._ensure_connection()
+        manager = server.performance_manager
+        server._cleanup_connection()
+        server._ensure_connection()
+
+        assert server.performance_manager is manager
+        call_args = server._mock_connection_class.call_args
+        assert call_args[1]["performance_manager"] is manager
+
     def test_cleanup_connection_without_connection(self, server_with_mock_connection):
         """Test cleanup when no connection exists."""
         server = server_with_mock_connection
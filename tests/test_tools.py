@@ -1,5 +1,6 @@
 """Test suite for MCP tools functionality."""
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -93,8 +94,7 @@ class TestOdooToolHandler:
         """Test successful search_records operation."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2, 3]
+        mock_connection.search_and_count.return_value = ([1, 2, 3], 5)
         mock_connection.read.return_value = [
             {"id": 1, "name": "Record 1"},
             {"id": 2, "name": "Record 2"},
@@ -123,13 +123,37 @@ class TestOdooToolHandler:
 
         # Verify calls
         mock_access_controller.validate_model_access.assert_called_once_with("res.partner", "read")
-        mock_connection.search_count.assert_called_once_with(
-            "res.partner", [["is_company", "=", True]]
-        )
-        mock_connection.search.assert_called_once_with(
+        mock_connection.search_and_count.assert_called_once_with(
             "res.partner", [["is_company", "=", True]], limit=3, offset=0, order="name asc"
         )
 
+    @pytest.mark.asyncio
+    async def test_search_records_runs_rpcs_off_event_loop(
+        self, handler, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test blocking Odoo and access checks run in worker threads, not on the event loop."""
+        rpc_threads = []
+
+        def search_and_count(*args, **kwargs):
+            rpc_threads.append(threading.current_thread())
+            return [1], 1
+
+        def read(*args, **kwargs):
+            rpc_threads.append(threading.current_thread())
+            return [{"id": 1, "name": "Record 1"}]
+
+        def validate_model_access(*args, **kwargs):
+            rpc_threads.append(threading.current_thread())
+
+        mock_access_controller.validate_model_access.side_effect = validate_model_access
+        mock_connection.search_and_count.side_effect = search_and_count
+        mock_connection.read.side_effect = read
+
+        await mock_app._tools["search_records"](model="res.partner", fields=["name"])
+
+        assert len(rpc_threads) == 3
+        assert threading.main_thread() not in rpc_threads
+
     @pytest.mark.asyncio
     async def test_search_records_access_denied(
         self, handler, mock_connection, mock_access_controller, mock_app
@@ -172,7 +196,7 @@ class TestOdooToolHandler:
     ):
         """Test search_records with connection error."""
         # Setup mocks
-        mock_connection.search_count.side_effect = OdooConnectionError("Connection lost")
+        mock_connection.search_and_count.side_effect = OdooConnectionError("Connection lost")
 
         # Get the registered search_records function
         search_records = mock_app._tools["search_records"]
@@ -190,8 +214,7 @@ class TestOdooToolHandler:
         """Test search_records with Odoo domain operators like |, &, !."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 10
-        mock_connection.search.return_value = [1, 2, 3]
+        mock_connection.search_and_count.return_value = ([1, 2, 3], 10)
         mock_connection.read.return_value = [
             {"id": 1, "name": "Partner 1", "state_id": [13, "California"]},
             {"id": 2, "name": "Partner 2", "state_id": [13, "California"]},
@@ -219,8 +242,7 @@ class TestOdooToolHandler:
         assert len(result.records) == 3
 
         # Verify the domain was passed correctly
-        mock_connection.search_count.assert_called_with("res.partner", domain_with_or)
-        mock_connection.search.assert_called_with(
+        mock_connection.search_and_count.assert_called_with(
             "res.partner", domain_with_or, limit=10, offset=0, order=None
         )
 
@@ -231,8 +253,7 @@ class TestOdooToolHandler:
         """Test search_records with domain as JSON string (Claude Desktop format)."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
+        mock_connection.search_and_count.return_value = ([15], 1)
         mock_connection.read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
@@ -253,8 +274,7 @@ class TestOdooToolHandler:
 
         # Verify the domain was parsed and passed correctly as a list
         expected_domain = [["is_company", "=", True], ["name", "ilike", "azure interior"]]
-        mock_connection.search_count.assert_called_with("res.partner", expected_domain)
-        mock_connection.search.assert_called_with(
+        mock_connection.search_and_count.assert_called_with(
             "res.partner", expected_domain, limit=5, offset=0, order=None
         )
 
@@ -265,8 +285,7 @@ class TestOdooToolHandler:
         """Test search_records with Python-style domain string (single quotes)."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
+        mock_connection.search_and_count.return_value = ([15], 1)
         mock_connection.read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
@@ -287,7 +306,9 @@ class TestOdooToolHandler:
 
         # Verify the domain was parsed correctly
         expected_domain = [["name", "ilike", "azure interior"], ["is_company", "=", True]]
-        mock_connection.search_count.assert_called_with("res.partner", expected_domain)
+        mock_connection.search_and_count.assert_called_with(
+            "res.partner", expected_domain, limit=5, offset=0, order=None
+        )
 
     @pytest.mark.asyncio
     async def test_search_records_with_invalid_json_domain(
@@ -316,8 +337,7 @@ class TestOdooToolHandler:
         """Test search_records with fields as JSON string."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [15]
+        mock_connection.search_and_count.return_value = ([15], 1)
         mock_connection.read.return_value = [
             {"id": 15, "name": "Azure Interior", "is_company": True},
         ]
@@ -346,8 +366,7 @@ class TestOdooToolHandler:
         """Test search_records with complex nested domain operators."""
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2]
+        mock_connection.search_and_count.return_value = ([1, 2], 5)
         mock_connection.read.return_value = [
             {"id": 1, "name": "Company A", "is_company": True},
             {"id": 2, "name": "Company B", "is_company": True},
@@ -373,8 +392,7 @@ class TestOdooToolHandler:
         assert len(result.records) == 2
 
         # Verify the domain was passed correctly
-        mock_connection.search_count.assert_called_with("res.partner", complex_domain)
-        mock_connection.search.assert_called_with(
+        mock_connection.search_and_count.assert_called_with(
             "res.partner", complex_domain, limit=5, offset=0, order=None
         )
 
@@ -550,6 +568,20 @@ class TestOdooToolHandler:
         mock_access_controller.get_enabled_models.assert_called_once()
         assert mock_access_controller.get_model_permissions.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_list_resource_templates_not_shared(self, handler, mock_access_controller):
+        """Test changing one response's templates does not leak into the next."""
+        mock_access_controller.get_enabled_models.return_value = [{"model": "res.partner"}]
+
+        first = await handler._handle_list_resource_templates_tool()
+        first["templates"][0]["uri_template"] = "changed"
+        first["templates"][0]["parameters"]["model"] = "changed"
+        first["templates"].clear()
+
+        second = await handler._handle_list_resource_templates_tool()
+        assert second["templates"][0]["uri_template"] == "odoo://{model}/record/{record_id}"
+        assert second["templates"][0]["parameters"]["model"] != "changed"
+
     @pytest.mark.asyncio
     async def test_list_models_with_permission_failures(
         self, handler, mock_connection, mock_access_controller, mock_app
@@ -642,8 +674,7 @@ class TestOdooToolHandler:
         )
         OdooToolHandler(mock_app, mock_connection, mock_access_controller, custom_config)
 
-        mock_connection.search_count.return_value = 0
-        mock_connection.search.return_value = []
+        mock_connection.search_and_count.return_value = ([], 0)
         mock_connection.read.return_value = []
 
         search_records = mock_app._tools["search_records"]
@@ -655,8 +686,9 @@ class TestOdooToolHandler:
         assert result.total == 0
         assert result.records == []
 
-        mock_connection.search_count.assert_called_with("res.partner", [])
-        mock_connection.search.assert_called_with("res.partner", [], limit=25, offset=0, order=None)
+        mock_connection.search_and_count.assert_called_with(
+            "res.partner", [], limit=25, offset=0, order=None
+        )
 
     @pytest.mark.asyncio
     async def test_search_records_limit_validation(
@@ -664,8 +696,7 @@ class TestOdooToolHandler:
     ):
         """Test search_records limit validation."""
         # Setup mocks
-        mock_connection.search_count.return_value = 100
-        mock_connection.search.return_value = []
+        mock_connection.search_and_count.return_value = ([], 100)
         mock_connection.read.return_value = []
 
         # Get the registered search_records function
@@ -696,8 +727,7 @@ class TestOdooToolHandler:
 
         # Setup mocks
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
+        mock_connection.search_and_count.return_value = ([1], 1)
         mock_connection.read.return_value = [{"id": 1, "name": "Test"}]
 
         # Create mock context
@@ -779,8 +809,10 @@ class TestOdooToolHandler:
         from unittest.mock import AsyncMock
 
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.create.return_value = 42
-        mock_connection.read.return_value = [{"id": 42, "display_name": "New Record"}]
+        mock_connection.create_and_read.return_value = (
+            42,
+            {"id": 42, "display_name": "New Record"},
+        )
         mock_connection.build_record_url.return_value = "http://localhost:8069/odoo/res.partner/42"
 
         ctx = AsyncMock()
@@ -800,8 +832,7 @@ class TestOdooToolHandler:
         from unittest.mock import AsyncMock
 
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
+        mock_connection.search_and_count.return_value = ([1], 1)
         mock_connection.read.return_value = [{"id": 1, "name": "Test"}]
 
         ctx = AsyncMock()
@@ -826,8 +857,7 @@ class TestOdooToolHandler:
         from unittest.mock import AsyncMock
 
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 1
-        mock_connection.search.return_value = [1]
+        mock_connection.search_and_count.return_value = ([1], 1)
         mock_connection.read.return_value = [{"id": 1, "name": "Test"}]
 
         # Create a context that raises on every call
@@ -1003,8 +1033,10 @@ class TestCreateRecordTool:
     @pytest.mark.asyncio
     async def test_create_record_success(self, handler, mock_connection, mock_app):
         """Test successful record creation returns CreateResult with correct data."""
-        mock_connection.create.return_value = 42
-        mock_connection.read.return_value = [{"id": 42, "display_name": "New Partner"}]
+        mock_connection.create_and_read.return_value = (
+            42,
+            {"id": 42, "display_name": "New Partner"},
+        )
         mock_connection.build_record_url.return_value = "http://localhost:8069/odoo/res.partner/42"
 
         create_record = mock_app._tools["create_record"]
@@ -1016,8 +1048,9 @@ class TestCreateRecordTool:
         assert result.url == "http://localhost:8069/odoo/res.partner/42"
         assert "42" in result.message
 
-        mock_connection.create.assert_called_once_with("res.partner", {"name": "New Partner"})
-        mock_connection.read.assert_called_once_with("res.partner", [42], ["id", "display_name"])
+        mock_connection.create_and_read.assert_called_once_with(
+            "res.partner", {"name": "New Partner"}, ["id", "display_name"]
+        )
 
     @pytest.mark.asyncio
     async def test_create_record_empty_values(self, handler, mock_app):
@@ -1052,7 +1085,7 @@ class TestCreateRecordTool:
     @pytest.mark.asyncio
     async def test_create_record_connection_error(self, handler, mock_connection, mock_app):
         """Test create_record with connection error."""
-        mock_connection.create.side_effect = OdooConnectionError("Connection lost")
+        mock_connection.create_and_read.side_effect = OdooConnectionError("Connection lost")
         create_record = mock_app._tools["create_record"]
         with pytest.raises(ValidationError, match="Connection error"):
             await create_record(model="res.partner", values={"name": "Test"})
@@ -1103,10 +1136,7 @@ class TestUpdateRecordTool:
         """Test successful record update with existence check and result read."""
         # First read: existence check returns [{"id": 10}]
         # Second read: post-update fetch returns updated record
-        mock_connection.read.side_effect = [
-            [{"id": 10}],  # existence check
-            [{"id": 10, "display_name": "Updated Partner"}],  # post-update read
-        ]
+        mock_connection.read.return_value = [{"id": 10, "display_name": "Updated Partner"}]
         mock_connection.write.return_value = True
         mock_connection.build_record_url.return_value = "http://localhost:8069/odoo/res.partner/10"
 
@@ -1120,10 +1150,8 @@ class TestUpdateRecordTool:
         assert result.record["display_name"] == "Updated Partner"
         assert "10" in result.message
 
-        # Verify existence check then post-update read
-        assert mock_connection.read.call_count == 2
-        mock_connection.read.assert_any_call("res.partner", [10], ["id"])
-        mock_connection.read.assert_any_call("res.partner", [10], ["id", "display_name"])
+        # Verify the write is not preceded by an existence check
+        mock_connection.read.assert_called_once_with("res.partner", [10], ["id", "display_name"])
         mock_connection.write.assert_called_once_with(
             "res.partner", [10], {"name": "Updated Partner"}
         )
@@ -1131,12 +1159,14 @@ class TestUpdateRecordTool:
     @pytest.mark.asyncio
     async def test_update_record_not_found(self, handler, mock_connection, mock_app):
         """Test update_record when record doesn't exist."""
-        mock_connection.read.return_value = []  # existence check fails
+        mock_connection.write.side_effect = OdooConnectionError(
+            "Operation failed: The requested record was not found"
+        )
         update_record = mock_app._tools["update_record"]
         with pytest.raises(ValidationError, match="Record not found"):
             await update_record(model="res.partner", record_id=999, values={"name": "Test"})
-        # Should not attempt write
-        mock_connection.write.assert_not_called()
+        # Should not read back a record that was never written
+        mock_connection.read.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_record_empty_values(self, handler, mock_app):
@@ -1420,8 +1450,7 @@ class TestSearchRecordReturnValue:
     ):
         """Test search_records with complex domain verifies the actual return value."""
         mock_access_controller.validate_model_access.return_value = None
-        mock_connection.search_count.return_value = 5
-        mock_connection.search.return_value = [1, 2]
+        mock_connection.search_and_count.return_value = ([1, 2], 5)
         mock_connection.read.return_value = [
             {"id": 1, "name": "Company A", "is_company": True},
             {"id": 2, "name": "Company B", "is_company": True},
@@ -1527,7 +1556,7 @@ class TestToolEdgeCases:
     @pytest.mark.asyncio
     async def test_create_record_generic_exception(self, handler, mock_connection, mock_app):
         """Test create_record wraps unexpected RuntimeError in ValidationError."""
-        mock_connection.create.side_effect = RuntimeError("unexpected")
+        mock_connection.create_and_read.side_effect = RuntimeError("unexpected")
 
         create_record = mock_app._tools["create_record"]
 
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from mcp_server_odoo.access_control import AccessController
 from mcp_server_odoo.config import OdooConfig
 from mcp_server_odoo.tools import OdooToolHandler
 
@@ -174,6 +175,80 @@ class TestYoloModeTools:
         for model in models:
             assert "operations" not in model
 
+    @pytest.mark.asyncio
+    async def test_list_models_yolo_reuses_model_query(
+        self, config_yolo_read, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test ir.model is queried once and reused until the cache expires."""
+        mock_connection.search_read.return_value = [{"model": "res.partner", "name": "Contact"}]
+        handler = OdooToolHandler(
+            mock_app, mock_connection, mock_access_controller, config_yolo_read
+        )
+
+        first = await handler._handle_list_models_tool()
+        second = await handler._handle_list_models_tool()
+
+        assert first["models"] == second["models"] == [{"model": "res.partner", "name": "Contact"}]
+        mock_connection.search_read.assert_called_once()
+
+        # An expired entry triggers a fresh query
+        fetched_at, models = handler._yolo_models
+        handler._yolo_models = (fetched_at - AccessController.CACHE_TTL, models)
+        await handler._handle_list_models_tool()
+        assert mock_connection.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_models_yolo_models_not_shared(
+        self, config_yolo_read, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test changing one response's models does not alter the cached list."""
+        mock_connection.search_read.return_value = [{"model": "res.partner", "name": "Contact"}]
+        handler = OdooToolHandler(
+            mock_app, mock_connection, mock_access_controller, config_yolo_read
+        )
+
+        first = await handler._handle_list_models_tool()
+        first["models"][0]["name"] = "Changed"
+        first["models"].clear()
+
+        second = await handler._handle_list_models_tool()
+        assert second["models"] == [{"model": "res.partner", "name": "Contact"}]
+        mock_connection.search_read.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_models_yolo_metadata_not_shared(
+        self, config_yolo_read, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test changing one response's YOLO metadata does not leak into the next."""
+        mock_connection.search_read.return_value = [{"model": "res.partner", "name": "Contact"}]
+        handler = OdooToolHandler(
+            mock_app, mock_connection, mock_access_controller, config_yolo_read
+        )
+
+        first = await handler._handle_list_models_tool()
+        first["yolo_mode"]["level"] = "true"
+        first["yolo_mode"]["operations"]["write"] = True
+
+        second = await handler._handle_list_models_tool()
+        assert second["yolo_mode"]["level"] == "read"
+        assert second["yolo_mode"]["operations"]["write"] is False
+
+    @pytest.mark.asyncio
+    async def test_list_models_yolo_error_not_cached(
+        self, config_yolo_read, mock_connection, mock_access_controller, mock_app
+    ):
+        """Test a failed ir.model query is retried on the next call."""
+        mock_connection.search_read.side_effect = [
+            Exception("Database connection failed"),
+            [{"model": "res.partner", "name": "Contact"}],
+        ]
+        handler = OdooToolHandler(
+            mock_app, mock_connection, mock_access_controller, config_yolo_read
+        )
+
+        assert (await handler._handle_list_models_tool())["total"] == 0
+        assert (await handler._handle_list_models_tool())["total"] == 1
+
     @pytest.mark.asyncio
     async def test_list_models_standard_mode(
         self, config_standard, mock_connection, mock_access_controller, mock_app
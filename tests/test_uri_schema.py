@@ -1,11 +1,14 @@
 """Tests for the URI schema module."""
 
+from urllib.parse import parse_qsl
+
 import pytest
 
 from mcp_server_odoo.uri_schema import (
     OdooOperation,
     URIParseError,
     URIValidationError,
+    _parse_query_parameters,
     build_pagination_uri,
     build_record_uri,
     build_search_uri,
@@ -141,6 +144,14 @@ class TestURIParsing:
         with pytest.raises(URIValidationError, match="Record operation requires an ID"):
             parse_uri("odoo://res.partner/record")
 
+    def test_parse_uri_id_only_kept_for_record_operation(self):
+        """Test a trailing ID is only taken as record ID for record URIs."""
+        assert parse_uri("odoo://res.partner/record/7").record_id == 7
+
+        parsed = parse_uri("odoo://res.partner/count/7")
+        assert parsed.operation == OdooOperation.COUNT
+        assert parsed.record_id is None
+
     def test_parse_uri_browse_without_ids(self):
         """Test parsing browse URIs without IDs parameter."""
         with pytest.raises(URIValidationError, match="Browse operation requires 'ids' parameter"):
@@ -164,6 +175,23 @@ class TestURIParsing:
         with pytest.raises(URIValidationError, match="Invalid IDs parameter"):
             parse_uri("odoo://res.partner/browse?ids=1,abc,3")
 
+    def test_query_parameters_match_parse_qsl(self):
+        """Test the undecoded fast path agrees with urllib's parse_qsl."""
+        for query in (
+            "limit=5&offset=10",
+            "order=",
+            "&&ids=1,2&",
+            "a=1=2",
+            "domain=%5B%5D",
+            "q=a+b",
+        ):
+            assert _parse_query_parameters(query) == dict(parse_qsl(query, keep_blank_values=True))
+
+    def test_parse_uri_repeated_parameter_keeps_last(self):
+        """Test that a repeated query parameter keeps its last value."""
+        uri = parse_uri("odoo://res.partner/search?limit=5&limit=20")
+        assert uri.limit == 20
+
     def test_odoo_uri_to_uri(self):
         """Test converting OdooURI back to string."""
         original = (
@@ -245,6 +273,11 @@ class TestURIBuilding:
         with pytest.raises(URIValidationError, match="Invalid model name"):
             build_uri("", "search")
 
+    def test_build_uri_rejects_model_with_trailing_newline(self):
+        """Test the model name must match in full, not just up to a newline."""
+        with pytest.raises(URIValidationError, match="Invalid model name"):
+            build_uri("res.partner\n", "search")
+
     def test_build_uri_invalid_operation(self):
         """Test building URIs with invalid operations."""
         with pytest.raises(URIValidationError, match="Invalid operation"):
@@ -277,6 +310,14 @@ class TestURIConvenienceFunctions:
         uri = build_record_uri("res.partner", 123)
         assert uri == "odoo://res.partner/record/123"
 
+    def test_build_record_uri_cache_keeps_validation(self):
+        """Test memoized record URIs still reject invalid input every time."""
+        assert build_record_uri("res.partner", 7) is build_record_uri("res.partner", 7)
+
+        for _ in range(2):
+            with pytest.raises(URIValidationError):
+                build_record_uri("res.partner", 0)
+
     def test_build_pagination_uri(self):
         """Test building pagination URIs."""
         base = "odoo://res.partner/search?domain=[('is_company','=',True)]&limit=10"
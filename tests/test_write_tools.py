@@ -1,11 +1,12 @@
 """Tests for write operation tools."""
 
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
 from mcp_server_odoo.access_control import AccessControlError
 from mcp_server_odoo.error_handling import ValidationError
+from mcp_server_odoo.error_sanitizer import ErrorSanitizer
 from mcp_server_odoo.odoo_connection import OdooConnectionError
 from mcp_server_odoo.tools import OdooToolHandler, register_tools
 
@@ -63,8 +64,7 @@ class TestWriteTools:
             "display_name": "Test Partner",
         }
 
-        mock_connection.create.return_value = created_id
-        mock_connection.read.return_value = [essential_record]
+        mock_connection.create_and_read.return_value = (created_id, essential_record)
 
         # Execute
         result = await tool_handler._handle_create_record_tool(model, values)
@@ -77,8 +77,9 @@ class TestWriteTools:
             == f"http://localhost:8069/web#id={created_id}&model={model}&view_type=form"
         )
         assert "Successfully created" in result["message"]
-        mock_connection.create.assert_called_once_with(model, values)
-        mock_connection.read.assert_called_once_with(model, [created_id], ["id", "display_name"])
+        mock_connection.create_and_read.assert_called_once_with(
+            model, values, ["id", "display_name"]
+        )
 
     @pytest.mark.asyncio
     async def test_create_record_model_without_name_field(self, tool_handler, mock_connection):
@@ -88,15 +89,24 @@ class TestWriteTools:
         created_id = 42
         essential_record = {"id": created_id, "display_name": "Activity #42"}
 
-        mock_connection.create.return_value = created_id
-        mock_connection.read.return_value = [essential_record]
+        mock_connection.create_and_read.return_value = (created_id, essential_record)
 
         result = await tool_handler._handle_create_record_tool(model, values)
 
         assert result["success"] is True
         assert result["record"] == essential_record
         # Only universally available fields requested — no 'name'
-        mock_connection.read.assert_called_once_with(model, [created_id], ["id", "display_name"])
+        mock_connection.create_and_read.assert_called_once_with(
+            model, values, ["id", "display_name"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_record_unreadable_reports_id(self, tool_handler, mock_connection):
+        """Test a created record that cannot be read back still reports its ID."""
+        mock_connection.create_and_read.return_value = (42, None)
+
+        with pytest.raises(ValidationError, match="res.partner with ID 42"):
+            await tool_handler._handle_create_record_tool("res.partner", {"name": "Test"})
 
     @pytest.mark.asyncio
     async def test_create_record_no_values(self, tool_handler):
@@ -111,12 +121,10 @@ class TestWriteTools:
         model = "res.partner"
         record_id = 123
         values = {"email": "updated@example.com"}
-        # First read call (existence check) returns just ID
-        existing_record = {"id": record_id}
-        # Second read call returns essential fields
+        # The read after the write returns essential fields
         updated_record = {"id": record_id, "display_name": "Test Partner"}
 
-        mock_connection.read.side_effect = [[existing_record], [updated_record]]
+        mock_connection.read.return_value = [updated_record]
         mock_connection.write.return_value = True
 
         # Execute
@@ -131,12 +139,8 @@ class TestWriteTools:
         )
         assert "Successfully updated" in result["message"]
         mock_connection.write.assert_called_once_with(model, [record_id], values)
-        # Verify both read calls with correct parameters
-        expected_calls = [
-            call(model, [record_id], ["id"]),  # Existence check
-            call(model, [record_id], ["id", "display_name"]),  # Essential fields
-        ]
-        mock_connection.read.assert_has_calls(expected_calls)
+        # No existence check before the write, only the essential fields read
+        mock_connection.read.assert_called_once_with(model, [record_id], ["id", "display_name"])
 
     @pytest.mark.asyncio
     async def test_update_record_model_without_name_field(self, tool_handler, mock_connection):
@@ -144,29 +148,64 @@ class TestWriteTools:
         model = "mail.activity"
         record_id = 42
         values = {"summary": "Updated summary"}
-        existing_record = {"id": record_id}
         updated_record = {"id": record_id, "display_name": "Activity #42"}
 
-        mock_connection.read.side_effect = [[existing_record], [updated_record]]
+        mock_connection.read.return_value = [updated_record]
         mock_connection.write.return_value = True
 
         result = await tool_handler._handle_update_record_tool(model, record_id, values)
 
         assert result["success"] is True
         # Only universally available fields requested — no 'name'
-        expected_calls = [
-            call(model, [record_id], ["id"]),
-            call(model, [record_id], ["id", "display_name"]),
-        ]
-        mock_connection.read.assert_has_calls(expected_calls)
+        mock_connection.read.assert_called_once_with(model, [record_id], ["id", "display_name"])
 
     @pytest.mark.asyncio
-    async def test_update_record_not_found(self, tool_handler, mock_connection):
-        """Test update record that doesn't exist."""
+    @pytest.mark.parametrize(
+        "fault",
+        [
+            # write() MissingError as sent back by /xmlrpc/2
+            "One of the records you are trying to modify has already been deleted "
+            "(Document type: Contact).",
+            "One of the documents you are trying to access has been deleted, "
+            "please try again after refreshing.",
+            # MissingError traceback, as reported over JSON-RPC
+            "Traceback (most recent call last):\n"
+            "odoo.exceptions.MissingError: Record does not exist or has been deleted.",
+        ],
+    )
+    async def test_update_record_not_found(self, tool_handler, mock_connection, fault):
+        """Test update record that doesn't exist, with the faults Odoo really sends."""
+        mock_connection.write.side_effect = OdooConnectionError(
+            f"Operation failed: {ErrorSanitizer.sanitize_xmlrpc_fault(fault)}"
+        )
+
+        with pytest.raises(ValidationError, match="Record not found"):
+            await tool_handler._handle_update_record_tool("res.partner", 999, {"name": "Test"})
+
+    @pytest.mark.asyncio
+    async def test_update_record_not_found_translated(self, tool_handler, mock_connection):
+        """Test a translated MissingError falls back to checking the record exists."""
+        mock_connection.write.side_effect = OdooConnectionError(
+            "Operation failed: L'un des enregistrements que vous essayez de modifier "
+            "a déjà été supprimé (Type de document: Contact)."
+        )
         mock_connection.read.return_value = []
 
         with pytest.raises(ValidationError, match="Record not found"):
             await tool_handler._handle_update_record_tool("res.partner", 999, {"name": "Test"})
+        mock_connection.read.assert_called_once_with("res.partner", [999], ["id"])
+
+    @pytest.mark.asyncio
+    async def test_update_record_error_on_existing_record(self, tool_handler, mock_connection):
+        """Test a failed write on an existing record keeps its original error."""
+        mock_connection.write.side_effect = OdooConnectionError(
+            "Operation failed: Le champ 'name' est obligatoire."
+        )
+        mock_connection.read.return_value = [{"id": 123}]
+
+        with pytest.raises(ValidationError, match="est obligatoire") as exc_info:
+            await tool_handler._handle_update_record_tool("res.partner", 123, {"name": ""})
+        assert "Record not found" not in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_update_record_no_values(self, tool_handler):
@@ -215,7 +254,7 @@ class TestWriteTools:
     @pytest.mark.asyncio
     async def test_update_record_connection_error(self, tool_handler, mock_connection):
         """Test update record with connection error."""
-        mock_connection.read.side_effect = OdooConnectionError("Connection failed")
+        mock_connection.write.side_effect = OdooConnectionError("Connection failed")
 
         with pytest.raises(ValidationError, match="Connection error"):
             await tool_handler._handle_update_record_tool("res.partner", 123, {"name": "Test"})